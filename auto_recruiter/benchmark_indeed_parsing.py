@@ -0,0 +1,150 @@
+#!/usr/bin/env python3.7
+"""
+    Purpose:
+        Script responsible for benchmarking how long the Indeed class takes to
+        parse the job details page in indeed/cached_data, with and without the
+        fast path extraction (and with each HTML parser backend)
+    Steps:
+        - Parse CLI args
+        - Load the cached job details page
+        - Check every parser produces the same job details
+        - Time parse_job_details_html for each parser
+
+    usage:
+        python3.7 benchmark_indeed_parsing.py
+            [-h]
+            [--iterations ITERATIONS]
+
+    example call:
+        python3.7 auto_recruiter/benchmark_indeed_parsing.py --iterations=200
+"""
+
+# Python Library Imports
+import logging
+import os
+import sys
+import timeit
+from argparse import ArgumentParser
+from execution_helpers import function_executors
+from logging_helpers import loggers
+
+# Local Library Imports
+BASE_PROJECT_PATH = f"{os.path.dirname(os.path.realpath(__file__))}/../"
+sys.path.insert(0, BASE_PROJECT_PATH)
+from indeed import indeed, replay_transport
+
+
+###
+# Main Execution
+###
+
+
+@function_executors.main_executor
+def main():
+    """
+    Purpose:
+        Benchmark parsing the cached Indeed job details page
+    """
+    logging.info("Starting Indeed Parsing Benchmark")
+
+    cli_args = get_cli_arguments()
+
+    raw_job_details_html = replay_transport.load_cached_data_html(
+        replay_transport.ReplayTransport.cached_data_files["details"]
+    )
+
+    # Fast Path First, Then Every Parser Backend Through The DOM Fallback
+    parsers = [("fast path", "html.parser", True)]
+    for parser_backend in indeed.Indeed.parser_backends:
+        parsers.append((f"DOM ({parser_backend})", parser_backend, False))
+
+    baseline_job_details = None
+    baseline_seconds = None
+    for parser_name, parser_backend, use_fast_path_extraction in parsers:
+        indeed.Indeed.configure_parser_backend(parser_backend)
+        indeed.Indeed.use_fast_path_extraction = use_fast_path_extraction
+
+        job_details = get_comparable_job_details(raw_job_details_html)
+        if baseline_job_details is None:
+            baseline_job_details = job_details
+        elif job_details != baseline_job_details:
+            logging.error(f"{parser_name} Parsed Different Job Details")
+
+        seconds_per_parse = timeit.timeit(
+            lambda: indeed.Indeed.parse_job_details_html(raw_job_details_html),
+            number=cli_args.iterations,
+        ) / cli_args.iterations
+        if baseline_seconds is None:
+            baseline_seconds = seconds_per_parse
+
+        logging.info(
+            f"{parser_name}: {seconds_per_parse * 1000:.2f} ms per page "
+            f"({seconds_per_parse / baseline_seconds:.1f}x the fast path)"
+        )
+
+    logging.info("Indeed Parsing Benchmark Complete")
+
+
+###
+# Benchmark Helpers
+###
+
+
+def get_comparable_job_details(raw_job_details_html):
+    """
+    Purpose:
+        Parse the job details, dropping the fields computed from the current time
+        so parses can be compared
+    Args:
+        raw_job_details_html (String): Raw HTML of the job details page
+    Returns:
+        job_details (Dict): Details of the job
+    """
+
+    job_details = indeed.Indeed.parse_job_details_html(raw_job_details_html)
+    job_details.pop("job_posting_datetime", None)
+
+    return job_details
+
+
+###
+# Scrpt Configuration Functions
+###
+
+
+def get_cli_arguments():
+    """
+    Purpose:
+        Parse CLI arguments for script
+    Args:
+        N/A
+    Return:
+        N/A
+    """
+    logging.info("Getting and Parsing CLI Arguments")
+
+    parser = ArgumentParser(description="Benchmark Indeed Parsing")
+    optional = parser.add_argument_group("Optional Arguments")
+
+    optional.add_argument(
+        "--iterations",
+        dest="iterations",
+        help="How many times to parse the page with each parser",
+        type=int,
+        default=100,
+        required=False,
+    )
+
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+
+    try:
+        loggers.get_stdout_logging(
+            log_level=logging.INFO, log_prefix="[benchmark_indeed_parsing] "
+        )
+        main()
+    except Exception as err:
+        logging.exception(f"{os.path.basename(__file__)} failed due to error: {err}")
+        raise err
@@ -1,4 +1,4 @@
-#!/usr/bin/env python3.6
+#!/usr/bin/env python3.7
 """
     Purpose:
         Script responsible for pulling jobs from job boards and generating a
@@ -11,7 +11,7 @@
         - Generate a report with all of the jobs
 
     usage:
-        python3.6 generate_job_report.py
+        python3.7 generate_job_report.py
             [-h]
             --job-boards {indeed,monster,career_builder} -
             -job-titles JOB_TITLES
@@ -23,7 +23,7 @@
             [--salary-min SALARY_MIN]
 
     example call:
-        python3.6 auto_recruiter/generate_job_report.py \
+        python3.7 auto_recruiter/generate_job_report.py \
             --report-output-filename="office_admin_jobs" \
             --report-output-dir="../data/job_reports" --min-jobs=15 \
             --job-boards="indeed"  --job-boards="monster" \
@@ -33,16 +33,17 @@
 """
 
 # Python Library Imports
+import asyncio
 import logging
 import os
 import pytz
 import re
 import shutil
 import sys
-import xlsxwriter
 from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
 from data_structure_helpers import string_helpers
-from datetime import datetime
+from datetime import datetime, timedelta
 from execution_helpers import function_executors
 from logging_helpers import loggers
 from wordcloud import WordCloud, STOPWORDS, ImageColorGenerator
@@ -51,7 +52,16 @@ from wordcloud import WordCloud, STOPWORDS, ImageColorGenerator
 BASE_PROJECT_PATH = f"{os.path.dirname(os.path.realpath(__file__))}/../"
 sys.path.insert(0, BASE_PROJECT_PATH)
 from config import config
-from indeed import indeed
+from indeed import (
+    async_indeed,
+    http_transport,
+    indeed,
+    job_listing_filters,
+    job_store,
+    rate_limiter,
+    replay_transport,
+)
+from job_reports import job_exporters, xlsx_job_report
 
 # Globals
 CONFIGS = config.Config.get()
@@ -72,35 +82,52 @@ def main():
 
     cli_args = get_cli_arguments()
 
-    job_board_functions = {
-        "indeed": get_job_listings_from_indeed,
-        "monster": get_job_listings_from_monster,
-        "career_builder": get_job_listings_from_career_builder,
-    }
-    job_listings_by_job_board = {}
+    configure_indeed(cli_args)
 
-    for job_board in cli_args.job_boards:
+    persistent_job_store = open_job_store(cli_args)
+    profile = cli_args.profile or cli_args.report_output_filename
 
-        job_listings_by_title = {}
-        for job_title in cli_args.job_titles:
-            job_listings_by_title[job_title] =\
-                job_board_functions[job_board](
-                    job_title,
-                    cli_args.zip_code,
-                    cli_args.radius,
-                    cli_args.job_type,
-                    cli_args.salary_min,
-                    cli_args.min_jobs_to_find,
-                    cli_args.max_days_since_posting,
-                )
+    # Jobs The Profile Saw In Earlier Runs Reuse Their Stored Details
+    seen_job_ids_by_job_board = None
+    if cli_args.incremental and persistent_job_store:
+        seen_job_ids_by_job_board = get_seen_job_ids_by_job_board(
+            persistent_job_store, profile, cli_args.job_boards
+        )
+        if "indeed" in cli_args.job_boards:
+            preload_seen_indeed_job_details(
+                persistent_job_store, profile, cli_args.max_days_since_posting
+            )
+    elif cli_args.incremental:
+        logging.warning("Incremental Reports Need The Job Store, Reporting All Jobs")
 
-        job_listings_by_job_board[job_board] = job_listings_by_title
+    output_formats = cli_args.output_formats or ["xlsx"]
+    job_listings_by_job_board = find_job_listings(cli_args, output_formats)
 
-    create_job_report(
-        cli_args.report_output_dir,
-        cli_args.report_output_filename,
-        job_listings_by_job_board
-    )
+    if persistent_job_store:
+        store_job_listings(persistent_job_store, profile, job_listings_by_job_board)
+        persistent_job_store.close()
+
+    new_job_listings_by_job_board = None
+    if seen_job_ids_by_job_board is not None:
+        new_job_listings_by_job_board = get_new_job_listings(
+            job_listings_by_job_board, seen_job_ids_by_job_board
+        )
+
+    if "xlsx" in output_formats:
+        create_job_report(
+            cli_args.report_output_dir,
+            cli_args.report_output_filename,
+            job_listings_by_job_board,
+            new_job_listings_by_job_board=new_job_listings_by_job_board,
+            **get_job_report_settings(cli_args),
+        )
+        if new_job_listings_by_job_board is not None and cli_args.delta_report:
+            create_job_report(
+                cli_args.report_output_dir,
+                f"{cli_args.report_output_filename}_new",
+                new_job_listings_by_job_board,
+                **get_job_report_settings(cli_args),
+            )
 
     for job_board, job_listings_by_title in job_listings_by_job_board.items():
         for job_title, job_listings in job_listings_by_title.items():
@@ -113,10 +140,391 @@ def main():
             except Exception as err:
                 logging.exception(f"Failed to Generate Wordcloud {job_title}: {err}")
 
+    if cli_args.transport_mode != "replay":
+        logging.info(
+            "Indeed Transfer Stats: "
+            f"{indeed.Indeed.get_transport().get_transfer_stats()}"
+        )
+    indeed.Indeed.close_transport()
+    indeed.Indeed.close_parse_pool()
+    indeed.Indeed.link_version_tracker.save()
+    if indeed.Indeed.job_details_registry:
+        logging.info(
+            "Indeed Job Details Dedup Stats: "
+            f"{indeed.Indeed.job_details_registry.get_stats()}"
+        )
+    if indeed.Indeed.response_cache:
+        logging.info(
+            f"Indeed Response Cache Stats: {indeed.Indeed.response_cache.get_stats()}"
+        )
 
     logging.info("Starting Process To Find Jobs For Me Complete")
 
 
+###
+# Job Search Functions
+###
+
+
+def find_job_listings(cli_args, output_formats):
+    """
+    Purpose:
+        Run every job board/job title search, writing the jobs to the flat file
+        exports (any output format but xlsx) as they are found
+    Args:
+        cli_args (ArgParse Obj): Arguments passed into the script
+        output_formats (List of Strings): Formats to write the report in
+    Returns:
+        job_listings_by_job_board (Dict of Dicts of Lists): Jobs found, by job
+            board and job title
+    """
+
+    # Flat File Exports Are Written As Jobs Are Found (And Closed Even If A
+    # Search Fails, So The Rows Already Written Are Kept)
+    open_job_exporters = []
+    try:
+        for output_format in output_formats:
+            if output_format == "xlsx":
+                continue
+            open_job_exporters.append(
+                job_exporters.get_job_exporter(
+                    output_format,
+                    get_report_file(
+                        cli_args.report_output_dir,
+                        cli_args.report_output_filename,
+                        output_format,
+                    ),
+                    get_headers_for_global_job_listing_worksheets(),
+                )
+            )
+
+        def export_job_listing(job_listing):
+            for job_exporter in open_job_exporters:
+                job_exporter.write_job_listing(job_listing)
+
+        job_board_functions = {
+            "indeed": get_job_listings_from_indeed,
+            "monster": get_job_listings_from_monster,
+            "career_builder": get_job_listings_from_career_builder,
+        }
+        async_job_board_functions = {
+            "indeed": get_job_listings_by_title_from_indeed_async,
+        }
+        job_listings_by_job_board = {}
+        job_searches = []
+
+        for job_board in cli_args.job_boards:
+
+            # Crawl Every Job Title At Once If The Job Board Supports It
+            if cli_args.async_crawl and job_board in async_job_board_functions:
+                job_listings_by_job_board[job_board] =\
+                    async_job_board_functions[job_board](
+                        cli_args.job_titles,
+                        cli_args.zip_code,
+                        cli_args.radius,
+                        cli_args.job_type,
+                        cli_args.salary_min,
+                        cli_args.min_jobs_to_find,
+                        cli_args.max_days_since_posting,
+                        max_requests_in_flight=cli_args.max_details_in_flight,
+                        on_job_listing=export_job_listing,
+                    )
+                continue
+
+            job_listings_by_job_board[job_board] = {}
+            for job_title in cli_args.job_titles:
+                job_searches.append((job_board, job_title))
+
+        # Run Each Job Board/Job Title Search (In Parallel With --workers), Keeping
+        # The Results In The Order The Searches Were Requested
+        all_job_listings = run_job_searches(
+            job_searches,
+            job_board_functions,
+            cli_args,
+            workers=cli_args.workers,
+            on_job_listing=export_job_listing,
+        )
+        for (job_board, job_title), job_listings in zip(job_searches, all_job_listings):
+            job_listings_by_job_board[job_board][job_title] = job_listings
+    finally:
+        for job_exporter in open_job_exporters:
+            job_exporter.close()
+
+    return job_listings_by_job_board
+
+
+def run_job_searches(
+    job_searches, job_board_functions, cli_args, workers=1, on_job_listing=None
+):
+    """
+    Purpose:
+        Run job board/job title searches on a pool of worker threads. Workers share
+        the job board classes, so the response cache, rate limit, and job details
+        dedup apply across every search
+    Args:
+        job_searches (List of Tuples): (job_board, job_title) searches to run
+        job_board_functions (Dict of Functions): Function to search each job board
+        cli_args (Namespace): Parsed CLI arguments for the script
+        workers (Int): Number of searches to run at once
+        on_job_listing (Function): Called with each job listing as it is found
+            (from the worker threads)
+    Returns:
+        all_job_listings (List of Dicts): Job listings (keyed by job ID) found by
+            each search, in the same order as job_searches
+    """
+
+    def run_job_search(job_search):
+        job_board, job_title = job_search
+        logging.info(f"Searching {job_board} for {job_title}")
+
+        return job_board_functions[job_board](
+            job_title,
+            cli_args.zip_code,
+            cli_args.radius,
+            cli_args.job_type,
+            cli_args.salary_min,
+            cli_args.min_jobs_to_find,
+            cli_args.max_days_since_posting,
+            on_job_listing=on_job_listing,
+        )
+
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        return list(executor.map(run_job_search, job_searches))
+
+
+###
+# Job Store Functions
+###
+
+
+def open_job_store(cli_args):
+    """
+    Purpose:
+        Open the job store (a SQLite database kept across runs). Replay runs do
+        not use it, since their jobs are not real
+    Args:
+        cli_args (Namespace): Parsed CLI arguments for the script
+    Returns:
+        persistent_job_store (JobStore Obj): The open job store, None if disabled
+    """
+
+    if cli_args.disable_job_store or cli_args.transport_mode == "replay":
+        logging.info("Job Store Disabled, Not Storing Jobs")
+        return None
+
+    return job_store.JobStore(cli_args.job_store_file)
+
+
+def store_job_listings(persistent_job_store, profile, job_listings_by_job_board):
+    """
+    Purpose:
+        Add the jobs found this run to the job store and mark them as seen by the
+        profile
+    Args:
+        persistent_job_store (JobStore Obj): The open job store
+        profile (String): Name of the profile the run is for
+        job_listings_by_job_board (Dict of Dicts): Job listings found for each job
+            title on each job board
+    Returns:
+        N/A
+    """
+
+    for job_board, job_listings_by_title in job_listings_by_job_board.items():
+        for job_title, job_listings in job_listings_by_title.items():
+            persistent_job_store.upsert_job_listings(
+                job_listings.values(), job_board=job_board, job_search=job_title
+            )
+            persistent_job_store.mark_job_ids_seen(
+                profile, job_board, job_listings.keys()
+            )
+
+    logging.info(f"Job Store Stats: {persistent_job_store.get_stats()}")
+
+
+def get_seen_job_ids_by_job_board(persistent_job_store, profile, job_boards):
+    """
+    Purpose:
+        Get the jobs the profile saw in earlier runs on each job board
+    Args:
+        persistent_job_store (JobStore Obj): The open job store
+        profile (String): Name of the profile the run is for
+        job_boards (List of Strings): Job boards being searched
+    Returns:
+        seen_job_ids_by_job_board (Dict of Sets): job_id of every job seen on
+            each job board
+    """
+
+    seen_job_ids_by_job_board = {}
+    for job_board in job_boards:
+        seen_job_ids_by_job_board[job_board] =\
+            persistent_job_store.get_seen_job_ids(profile, job_board)
+        logging.info(
+            f"Profile {profile} Has Seen "
+            f"{len(seen_job_ids_by_job_board[job_board])} {job_board} Jobs"
+        )
+
+    return seen_job_ids_by_job_board
+
+
+def preload_seen_indeed_job_details(
+    persistent_job_store, profile, max_days_since_posting
+):
+    """
+    Purpose:
+        Hand the stored details of Indeed jobs the profile has already seen to the
+        Indeed class, so only unseen jobs have their details fetched. Jobs posted
+        outside the window are skipped, since they will not be reported
+    Args:
+        persistent_job_store (JobStore Obj): The open job store
+        profile (String): Name of the profile the run is for
+        max_days_since_posting (Int): Max Days since posting that a job needs to
+            be reported
+    Returns:
+        N/A
+    """
+
+    seen_job_listings = persistent_job_store.query_job_listings(
+        job_board="indeed",
+        posted_since=datetime.now() - timedelta(days=max_days_since_posting),
+        profile=profile,
+    )
+    preloaded_jobs = indeed.Indeed.preload_job_details(seen_job_listings)
+
+    logging.info(f"Preloaded Details Of {preloaded_jobs} Seen Indeed Jobs")
+
+
+def get_new_job_listings(job_listings_by_job_board, seen_job_ids_by_job_board):
+    """
+    Purpose:
+        Get the job listings the profile had not seen before this run
+    Args:
+        job_listings_by_job_board (Dict of Dicts): Job listings found for each job
+            title on each job board
+        seen_job_ids_by_job_board (Dict of Sets): job_id of every job seen on
+            each job board before this run
+    Returns:
+        new_job_listings_by_job_board (Dict of Dicts): Job listings not seen
+            before, in the same shape as job_listings_by_job_board
+    """
+
+    new_job_listings_by_job_board = {}
+    for job_board, job_listings_by_title in job_listings_by_job_board.items():
+        seen_job_ids = seen_job_ids_by_job_board.get(job_board, set())
+
+        new_job_listings_by_job_board[job_board] = {}
+        for job_title, job_listings in job_listings_by_title.items():
+            new_job_listings_by_job_board[job_board][job_title] = {
+                job_id: job_listing
+                for job_id, job_listing in job_listings.items()
+                if job_id not in seen_job_ids
+            }
+
+    return new_job_listings_by_job_board
+
+
+###
+# Job Board Configuration Functions
+###
+
+
+def configure_indeed(cli_args):
+    """
+    Purpose:
+        Configure the Indeed class (shared by every Indeed search in the run) from
+        the cli args
+    Args:
+        cli_args (Namespace): Parsed CLI arguments for the script
+    Returns:
+        N/A
+    """
+
+    indeed.Indeed.max_details_in_flight = cli_args.max_details_in_flight
+    indeed.Indeed.job_details_hedge_width = cli_args.job_details_hedge_width
+    indeed.Indeed.job_listing_filters = get_job_listing_filters(cli_args)
+    indeed.Indeed.listing_pages_to_prefetch = cli_args.listing_pages_to_prefetch
+    # Replayed Responses Would Skew The Link Version Stats Of Live Runs
+    indeed.Indeed.configure_link_version_tracker(
+        stats_file=(
+            None if cli_args.transport_mode == "replay"
+            else cli_args.link_version_stats_file
+        )
+    )
+    indeed.Indeed.configure_job_details_registry(
+        enabled=cli_args.incremental or not cli_args.disable_job_details_dedup
+    )
+    indeed.Indeed.configure_parser_backend(cli_args.html_parser)
+    indeed.Indeed.configure_keyword_classifier(cli_args.keyword_taxonomy_file)
+    indeed.Indeed.configure_parse_pool(parse_workers=cli_args.parse_workers)
+
+    # Replay Runs Never Touch The Network, Record Runs Wrap The Live Transport
+    if cli_args.transport_mode == "replay":
+        indeed.Indeed.set_transport(
+            replay_transport.ReplayTransport(
+                corpus_dir=cli_args.replay_corpus_dir,
+                latency=cli_args.replay_latency,
+            )
+        )
+    else:
+        live_transport = http_transport.HttpTransport(
+            pool_maxsize=cli_args.workers * (
+                cli_args.max_details_in_flight * cli_args.job_details_hedge_width
+                + cli_args.listing_pages_to_prefetch + 1
+            ),
+            rate_limiter=rate_limiter.RateLimiter(
+                requests_per_second=cli_args.requests_per_second,
+                burst=cli_args.request_burst,
+            ),
+            max_response_bytes=cli_args.max_response_mb * 1024 * 1024,
+        )
+        if cli_args.transport_mode == "record":
+            live_transport = replay_transport.RecordingTransport(
+                live_transport, cli_args.replay_corpus_dir
+            )
+        indeed.Indeed.set_transport(live_transport)
+
+    # Cached Responses Would Hide Requests From Record And Replay Runs
+    if cli_args.disable_response_cache or cli_args.transport_mode != "live":
+        indeed.Indeed.configure_response_cache(cache_dir=None)
+    else:
+        indeed.Indeed.configure_response_cache(
+            cache_dir=cli_args.response_cache_dir,
+            max_size_bytes=cli_args.response_cache_max_mb * 1024 * 1024,
+        )
+
+
+def get_job_listing_filters(cli_args):
+    """
+    Purpose:
+        Build the filters a job listing card must pass before the details of the
+        job are fetched from the cli args
+    Args:
+        cli_args (Namespace): Parsed CLI arguments for the script
+    Returns:
+        filters (List of Functions): Predicates taking a job listing dict
+    """
+
+    filters = []
+
+    if cli_args.exclude_companies:
+        filters.append(
+            job_listing_filters.exclude_companies(cli_args.exclude_companies)
+        )
+    if cli_args.exclude_title_keywords:
+        filters.append(
+            job_listing_filters.exclude_title_keywords(cli_args.exclude_title_keywords)
+        )
+    if cli_args.require_title_keywords:
+        filters.append(
+            job_listing_filters.require_title_keywords(cli_args.require_title_keywords)
+        )
+    if cli_args.min_listed_salary:
+        filters.append(
+            job_listing_filters.min_annual_salary(cli_args.min_listed_salary)
+        )
+
+    return filters
+
+
 ###
 # Job Listing Functions
 ###
@@ -130,6 +538,7 @@ def get_job_listings_from_indeed(
     salary_min,
     min_jobs_to_find,
     max_days_since_posting,
+    on_job_listing=None,
 ):
     """
     Purpose:
@@ -149,9 +558,140 @@ def get_job_listings_from_indeed(
             no new results
         max_days_since_posting (Int): Max Days since posting that a job needs to be
             added to the report
+        on_job_listing (Function): Called with each job listing as it is found
     Returns:
-        job_listings (List of Dicts): A list of Dicts. Key is the job ID and the
-            dict holds all of the job listing details.
+        job_listings (Dict of JobListing Objs): Job listings keyed by job ID, each
+            holding all of the job listing details.
+    """
+
+    job_listings = {}
+
+    # Jobs Stream In As Their Details Are Fetched (In Listing Order So Reports Are
+    # Repeatable); Closing The Stream Once Enough Are Found Stops The Crawl
+    job_listing_stream = indeed.Indeed.iter_job_listings(
+        job_title,
+        zip_code,
+        radius=radius,
+        job_type=job_type,
+        salary_min=salary_min,
+        max_days_since_posting=max_days_since_posting,
+        ordered=True,
+    )
+    try:
+        for job_listing in job_listing_stream:
+            job_listing["job_board"] = "indeed"
+            job_listing["job_search"] = job_title
+            job_listings[job_listing["job_id"]] = job_listing
+            if on_job_listing:
+                on_job_listing(job_listing)
+            if len(job_listings) >= min_jobs_to_find:
+                break
+            logging.info(f"Finding Jobs ({len(job_listings)} of {min_jobs_to_find})")
+    finally:
+        job_listing_stream.close()
+
+    return job_listings
+
+
+def get_job_listings_by_title_from_indeed_async(
+    job_titles,
+    zip_code,
+    radius,
+    job_type,
+    salary_min,
+    min_jobs_to_find,
+    max_days_since_posting,
+    max_requests_in_flight=16,
+    on_job_listing=None,
+):
+    """
+    Purpose:
+        Get Job Listings from Indeed for every job title at once. Each title is
+        crawled by its own coroutine on a single event loop, with requests bounded
+        by the AsyncIndeed semaphores
+    Args:
+        job_titles (List of Strings): job titles to Search (keywords in Indeed)
+        zip_code (String): Zip code to center the job search on
+        radius (String): Radius (from the zip code center) that jobs need to be
+            in to be considered
+        job_type (String): type of job. Enum of the following:
+            [fulltime, parttime, contractor]
+        salary_min (String): Minimum salary for jobs to be returned (best guess if
+            none is provided)
+        min_jobs_to_find (String): How many jobs to attempt to find for each title
+        max_days_since_posting (Int): Max Days since posting that a job needs to be
+            added to the report
+        max_requests_in_flight (Int): Max number of requests to Indeed at once
+        on_job_listing (Function): Called with each job listing as it is found
+    Returns:
+        job_listings_by_title (Dict of Dicts): Job listings (keyed by job ID) for
+            each job title
+    """
+
+    indeed_crawler = async_indeed.AsyncIndeed(
+        max_requests_in_flight=max_requests_in_flight,
+        max_requests_per_host=max_requests_in_flight,
+    )
+
+    async def crawl_job_titles():
+        return await asyncio.gather(*[
+            crawl_job_listings_from_indeed(
+                indeed_crawler,
+                job_title,
+                zip_code,
+                radius,
+                job_type,
+                salary_min,
+                min_jobs_to_find,
+                max_days_since_posting,
+                on_job_listing=on_job_listing,
+            )
+            for job_title in job_titles
+        ])
+
+    loop = asyncio.new_event_loop()
+    try:
+        all_job_listings = loop.run_until_complete(crawl_job_titles())
+    finally:
+        loop.close()
+        indeed_crawler.close()
+
+    return dict(zip(job_titles, all_job_listings))
+
+
+async def crawl_job_listings_from_indeed(
+    indeed_crawler,
+    job_title,
+    zip_code,
+    radius,
+    job_type,
+    salary_min,
+    min_jobs_to_find,
+    max_days_since_posting,
+    on_job_listing=None,
+):
+    """
+    Purpose:
+        Coroutine version of get_job_listings_from_indeed. Pages through Indeed
+        with the AsyncIndeed object until enough jobs are found
+    Args:
+        indeed_crawler (AsyncIndeed Obj): AsyncIndeed object shared by every title
+        job_title (String): job title to Search (keywords in Indeed)
+        zip_code (String): Zip code to center the job search on
+        radius (String): Radius (from the zip code center) that jobs need to be
+            in to be considered
+        job_type (String): type of job. Enum of the following:
+            [fulltime, parttime, contractor]
+        salary_min (String): Minimum salary for jobs to be returned (best guess if
+            none is provided)
+        min_jobs_to_find (String): How many jobs to attempt to find. will loop through
+            calls to Indeed until this number is met or if 5 calls in a row yeild
+            no new results
+        max_days_since_posting (Int): Max Days since posting that a job needs to be
+            added to the report
+        on_job_listing (Function): Called with each job listing as it is found
+    Returns:
+        job_listings (Dict of JobListing Objs): Job listings keyed by job ID
     """
 
     job_listings = {}
@@ -163,50 +703,71 @@ def get_job_listings_from_indeed(
     job_listing_pagination = 0
     pagination_non_increment_counter = 0
     while len(job_listings) < min_jobs_to_find:
-        logging.info(f"Finding Jobs ({len(job_listings)} of {min_jobs_to_find})")
+        logging.info(
+            f"Finding {job_title} Jobs ({len(job_listings)} of {min_jobs_to_find})"
+        )
 
-        new_job_listings = indeed.Indeed.get_job_listings(
+        new_job_listings = await indeed_crawler.get_job_listings(
             job_title,
             zip_code,
             radius=radius,
             job_type=job_type,
             salary_min=salary_min,
             pagination=job_listing_pagination,
-            max_days_since_posting=max_days_since_posting
+            max_days_since_posting=max_days_since_posting,
+            # Retries Of A Page Must Reach Indeed To Get Different Results
+            use_cache=pagination_non_increment_counter == 0,
         )
-
-        new_job_found = False
         for job_listing in new_job_listings:
-            if job_listing["job_id"] not in job_listings:
-                job_listings[job_listing["job_id"]] = job_listing
-                new_job_found = True
+            job_listing["job_board"] = "indeed"
+            job_listing["job_search"] = job_title
 
-        if (
-            not new_job_found
-            and pagination_non_increment_counter < max_pagination_no_increment
+        if add_new_job_listings(
+            job_listings, new_job_listings, on_job_listing=on_job_listing
         ):
+            job_listing_pagination += jobs_per_listing_page
+            pagination_non_increment_counter = 0
+        elif pagination_non_increment_counter < max_pagination_no_increment:
             logging.info(
-                "No Unqiue Jobs Found On Loop (This is loop "
+                f"No Unqiue {job_title} Jobs Found On Loop (This is loop "
                 f"#{pagination_non_increment_counter}), Continuing"
             )
             pagination_non_increment_counter += 1
-            continue
-        elif (
-            not new_job_found
-            and pagination_non_increment_counter >= max_pagination_no_increment
-        ):
+        else:
             logging.info(
-                "No Unqiue Jobs Found On Loop (This is loop "
+                f"No Unqiue {job_title} Jobs Found On Loop (This is loop "
                 f"#{pagination_non_increment_counter}), Exiting"
             )
             break
-        else:
-            job_listing_pagination += jobs_per_listing_page
-            pagination_non_increment_counter = 0
 
     return job_listings
 
 
+def add_new_job_listings(job_listings, new_job_listings, on_job_listing=None):
+    """
+    Purpose:
+        Add the job listings from a page of results that have not already been found
+    Args:
+        job_listings (Dict of JobListing Objs): Job listings found so far, keyed by
+            job ID. Updated in place
+        new_job_listings (List of JobListing Objs): Job listings from a page of
+            results
+        on_job_listing (Function): Called with each job listing that is new
+    Returns:
+        new_job_found (Boolean): Whether any of the job listings were new
+    """
+
+    new_job_found = False
+    for job_listing in new_job_listings:
+        if job_listing["job_id"] not in job_listings:
+            job_listings[job_listing["job_id"]] = job_listing
+            new_job_found = True
+            if on_job_listing:
+                on_job_listing(job_listing)
+
+    return new_job_found
+
+
 def get_job_listings_from_monster(
     job_title,
     zip_code,
@@ -215,6 +776,7 @@ def get_job_listings_from_monster(
     salary_min,
     min_jobs_to_find,
     max_days_since_posting,
+    on_job_listing=None,
 ):
     """
     Purpose:
@@ -234,6 +796,7 @@ def get_job_listings_from_monster(
             no new results
         max_days_since_posting (Int): Max Days since posting that a job needs to be
             added to the report
+        on_job_listing (Function): Called with each job listing as it is found
     Returns:
         job_listings (List of Dicts): A list of Dicts. Key is the job ID and the
             dict holds all of the job listing details.
@@ -253,6 +816,7 @@ def get_job_listings_from_career_builder(
     salary_min,
     min_jobs_to_find,
     max_days_since_posting,
+    on_job_listing=None,
 ):
     """
     Purpose:
@@ -272,6 +836,7 @@ def get_job_listings_from_career_builder(
             no new results
         max_days_since_posting (Int): Max Days since posting that a job needs to be
             added to the report
+        on_job_listing (Function): Called with each job listing as it is found
     Returns:
         job_listings (List of Dicts): A list of Dicts. Key is the job ID and the
             dict holds all of the job listing details.
@@ -368,12 +933,66 @@ def generate_wordcloud(
 ###
 
 
+def get_job_report_settings(cli_args):
+    """
+    Purpose:
+        Get the settings of the xlsx job report from the cli args
+    Args:
+        cli_args (Namespace): Parsed CLI arguments for the script
+    Returns:
+        job_report_settings (Dict): Keyword arguments for create_job_report
+    """
+
+    return {
+        "constant_memory": cli_args.constant_memory_xlsx,
+        "max_rows_per_sheet": cli_args.max_rows_per_sheet,
+        "max_urls_per_sheet": cli_args.max_urls_per_sheet,
+        "max_rows_per_workbook": cli_args.max_rows_per_workbook,
+        "max_mb_per_workbook": cli_args.max_mb_per_workbook,
+        "report_workers": cli_args.report_workers,
+        "split_report_by": cli_args.split_report_by,
+        "report_index": cli_args.report_index,
+    }
+
+
+def get_report_file(report_output_dir, report_output_filename, file_extension):
+    """
+    Purpose:
+        Get the path of a report file, dated the day the report was run
+    Args:
+        report_output_dir (String): Base directory of the report
+        report_output_filename (String): Base of the filename (will append date)
+        file_extension (String): Extension of the file (e.g. xlsx)
+    Returns:
+        report_file (String): Path of the report file
+    """
+
+    report_date = datetime.now(pytz.timezone("US/Eastern")).strftime("%Y%m%d")
+
+    return (
+        f"{report_output_dir}/{report_output_filename}_{report_date}.{file_extension}"
+    )
+
+
 def create_job_report(
-    report_output_dir, report_output_filename, job_listings_by_job_board
+    report_output_dir,
+    report_output_filename,
+    job_listings_by_job_board,
+    new_job_listings_by_job_board=None,
+    constant_memory=False,
+    max_rows_per_sheet=None,
+    max_urls_per_sheet=None,
+    max_rows_per_workbook=None,
+    max_mb_per_workbook=None,
+    report_workers=1,
+    split_report_by=None,
+    report_index=False,
 ):
     """
     Purpose:
-        Create the Job Report with the job listings provided
+        Create the Job Report with the job listings provided. Sheets too large
+        for Excel are sharded into numbered sheets, and reports past the workbook
+        thresholds spill into numbered workbooks (e.g. jobs_part2_20190601.xlsx)
     Args:
         report_output_dir (String): Location to put the filename. Specifically, the
             base directory
@@ -381,6 +1000,22 @@ def create_job_report(
             base of the filename (will append date)
         job_listings_by_job_board (List of Dicts): A list of Dicts. Key is the job ID
             and the dict holds all of the job listing details.
+        new_job_listings_by_job_board (Dict of Dicts): Job listings not seen in
+            earlier runs, in the same shape as job_listings_by_job_board. Adds a
+            "New" sheet after the Global sheet when provided
+        constant_memory (Boolean): Whether to flush each row to disk as it is
+            written (sheets get an autofilter instead of an Excel table)
+        max_rows_per_sheet (Int): Max jobs per sheet (capped at Excel's limits)
+        max_urls_per_sheet (Int): Max hyperlinks per sheet before it is sharded
+            (capped at Excel's limit)
+        max_rows_per_workbook (Int): Max jobs per workbook (None for no limit)
+        max_mb_per_workbook (Float): Max estimated cell text per workbook in MB
+            (None for no limit)
+        report_workers (Int): Number of workbooks to write at once
+        split_report_by (String): Write a workbook per "board" or per "title"
+            (e.g. jobs_indeed_20190601.xlsx) instead of a single workbook
+        report_index (Boolean): Also write an index workbook (e.g.
+            jobs_index_20190601.xlsx) linking to every workbook of the report
     Returns:
         N/A
     """
@@ -389,15 +1024,119 @@ def create_job_report(
         logging.error("No Job Boards Found, Unable to Generate Report")
         return
 
-    # Create a workbook and add a worksheet.
-    report_date = datetime.now(pytz.timezone("US/Eastern")).strftime("%Y%m%d")
-    workbook = xlsxwriter.Workbook(
-        f"{report_output_dir}/{report_output_filename}_{report_date}.xlsx"
+    # Group The Sheets Into The Workbooks Of The Report
+    report_groups = []
+    if split_report_by == "board":
+        for job_board, job_listings_by_title in job_listings_by_job_board.items():
+            report_groups.append((
+                f"{report_output_filename}_{get_simple_name(job_board)}",
+                get_job_report_worksheets(
+                    {job_board: job_listings_by_title},
+                    new_job_listings_by_job_board=get_job_board_subset(
+                        new_job_listings_by_job_board, job_board
+                    ),
+                ),
+            ))
+    elif split_report_by == "title":
+        for job_board, job_listings_by_title in job_listings_by_job_board.items():
+            for job_title, job_listings in job_listings_by_title.items():
+                report_groups.append((
+                    f"{report_output_filename}_{get_simple_name(job_board)}"
+                    f"_{get_simple_name(job_title)}",
+                    get_job_report_worksheets(
+                        {job_board: {job_title: job_listings}},
+                        new_job_listings_by_job_board=get_job_board_subset(
+                            new_job_listings_by_job_board, job_board, job_title
+                        ),
+                        include_global_worksheet=False,
+                    ),
+                ))
+    else:
+        report_groups.append((
+            report_output_filename,
+            get_job_report_worksheets(
+                job_listings_by_job_board,
+                new_job_listings_by_job_board=new_job_listings_by_job_board,
+            ),
+        ))
+
+    # Shard Large Sheets And Spill Into More Workbooks Past The Thresholds
+    workbooks = []
+    for report_group_filename, worksheets in report_groups:
+        report_group_workbooks = xlsx_job_report.plan_job_report_workbooks(
+            worksheets,
+            max_rows_per_workbook=max_rows_per_workbook,
+            max_mb_per_workbook=max_mb_per_workbook,
+            max_rows_per_sheet=max_rows_per_sheet,
+            max_urls_per_sheet=max_urls_per_sheet,
+        )
+        if len(report_group_workbooks) > 1:
+            logging.info(
+                f"{report_group_filename} Spilled Into "
+                f"{len(report_group_workbooks)} Workbooks"
+            )
+
+        for workbook_number, workbook_worksheets in enumerate(
+            report_group_workbooks, 1
+        ):
+            workbook_filename = report_group_filename
+            if workbook_number > 1:
+                workbook_filename = f"{report_group_filename}_part{workbook_number}"
+            workbooks.append((
+                get_report_file(report_output_dir, workbook_filename, "xlsx"),
+                workbook_worksheets,
+            ))
+
+    # Each Workbook Is Built And Compressed Independently
+    xlsx_job_report.write_job_report_workbooks(
+        workbooks,
+        workers=report_workers,
+        constant_memory=constant_memory,
+        max_rows_per_sheet=max_rows_per_sheet,
+        max_urls_per_sheet=max_urls_per_sheet,
     )
 
+    if report_index:
+        xlsx_job_report.write_job_report_workbook(
+            get_report_file(
+                report_output_dir, f"{report_output_filename}_index", "xlsx"
+            ),
+            [get_index_worksheet(workbooks)],
+        )
+
+
+def get_job_report_worksheets(
+    job_listings_by_job_board,
+    new_job_listings_by_job_board=None,
+    include_global_worksheet=True,
+):
+    """
+    Purpose:
+        Get the sheets of a job report workbook: the Global sheet, the New sheet,
+        and a sheet for each job board/job title combination
+    Args:
+        job_listings_by_job_board (Dict of Dicts): Job listings found for each job
+            title on each job board
+        new_job_listings_by_job_board (Dict of Dicts): Job listings not seen in
+            earlier runs, in the same shape as job_listings_by_job_board. Adds a
+            "New" sheet when provided
+        include_global_worksheet (Boolean): Whether to add the Global sheet
+    Returns:
+        worksheets (List of Dicts): Sheets of the workbook, in order (sheets
+            without job listings are left out)
+    """
+
+    worksheets = []
+
     # # Generate the Global Worksheet First
-    global_job_listings = get_global_job_listings(job_listings_by_job_board)
-    create_global_worksheet(workbook, "Global", global_job_listings)
+    if include_global_worksheet:
+        global_job_listings = get_global_job_listings(job_listings_by_job_board)
+        worksheets.append(get_global_worksheet("Global", global_job_listings))
+
+    # Followed By The Jobs Not Seen In Earlier Runs
+    if new_job_listings_by_job_board is not None:
+        new_global_job_listings = get_global_job_listings(new_job_listings_by_job_board)
+        worksheets.append(get_global_worksheet("New", new_global_job_listings))
 
     # Generate a Sheet for Each Job Board/Job Title Combination
     for job_board, job_listings_by_title in job_listings_by_job_board.items():
@@ -411,222 +1150,144 @@ def create_job_report(
                 (sheet_name[:28] + "..") if len(sheet_name) > 31 else sheet_name
             )
 
-            create_job_board_worksheet(workbook, sheet_name, job_listings)
+            worksheets.append(get_job_board_worksheet(sheet_name, job_listings))
 
-    workbook.close()
+    return [worksheet for worksheet in worksheets if worksheet]
 
 
-def create_job_board_worksheet(workbook, sheet_name, job_listings):
+def get_job_board_subset(job_listings_by_job_board, job_board, job_title=None):
     """
     Purpose:
-        Create a sheet in the job report for job listings of a specific job board and
-        job title combination. (e.g. job listings for "Administrative Assistant" in
-        Indeed)
+        Get the job listings of a single job board (or job board/job title)
     Args:
-        workbook (XlsxWriter Workbook Object): The open workbook object to add the
-            sheet to
-        sheet_name (String): Name of the sheet to add to the workbook
-        job_listings (List of Dicts): A list of Dicts. Key is the job ID
-            and the dict holds all of the job listing details.
+        job_listings_by_job_board (Dict of Dicts): Job listings found for each job
+            title on each job board (None passes through)
+        job_board (String): Job board to keep
+        job_title (String): Job title to keep (None keeps every job title)
     Returns:
-        N/A
+        job_listings_by_job_board (Dict of Dicts): Job listings of the job board
+            (and job title), in the same shape
     """
 
-    if not job_listings:
-        logging.error(f"No {sheet_name} Job Listings to Generate Report")
-        return
+    if job_listings_by_job_board is None:
+        return None
 
-    # Create Worksheet
-    worksheet = workbook.add_worksheet(sheet_name)
-
-    # Set Cell Format
-    cell_formats = {
-        "base_cell_format": workbook.add_format({
-            "text_wrap": True
-        }),
-        "date_cell_format": workbook.add_format({
-            "num_format": "[$-en-US]mmmm d, yyyy"
-        }),
-    }
+    job_listings_by_title = job_listings_by_job_board.get(job_board, {})
+    if job_title is not None:
+        job_listings_by_title = {job_title: job_listings_by_title.get(job_title, {})}
 
-    # Get Headers
-    headers = get_headers_for_job_title_listing_worksheets()
+    return {job_board: job_listings_by_title}
 
-    # Set Column Widths
-    for header_idx, header in enumerate(headers):
-        worksheet.set_column(f"{header['column']}:{header['column']}", header["width"])
-
-    # Set Row Height
-    min_row = 1
-    max_row = 1 + len(job_listings)
-    for row_idx in range(1, max_row):
-        worksheet.set_row(row_idx, 48)
-
-    # Set Table Options And Create Table
-    table_dimensions = "{column_start}{row_start}:{column_end}{row_end}".format(
-        column_start="A",
-        row_start=min_row,
-        column_end=chr((ord("A") - 1) + len(headers)),
-        row_end=max_row,
-    )
-    table_options = {
-        "name": re.sub("[^a-zA-Z]+", "", sheet_name),
-        "columns": [{"header": header["title"]} for header in headers],
-    }
-    worksheet.add_table(table_dimensions, table_options)
 
-    # Write Data to Table
-    job_listing_row_idx = 1
-    for job_id, job_details in job_listings.items():
+def get_index_worksheet(workbooks):
+    """
+    Purpose:
+        Get the sheet of the index workbook, with a row linking to each workbook
+        of the report
+    Args:
+        workbooks (List of Tuples): (report_file, worksheets) of each workbook
+    Returns:
+        worksheet (Dict): sheet_name, headers, job_listings (a row per workbook),
+            and row_height of the index sheet
+    """
 
-        for header_column_idx, header in enumerate(headers):
+    index_rows = []
+    for report_file, worksheets in workbooks:
+        workbook_job_listings = [
+            job_listing
+            for worksheet in worksheets
+            for job_listing in worksheet["job_listings"]
+        ]
+        index_rows.append({
+            "workbook": f"external:{os.path.basename(report_file)}",
+            "job_boards": ", ".join(sorted({
+                job_listing["job_board"]
+                for job_listing in workbook_job_listings
+                if job_listing["job_board"]
+            })),
+            "job_searches": ", ".join(sorted({
+                job_listing["job_search"]
+                for job_listing in workbook_job_listings
+                if job_listing["job_search"]
+            })),
+            "sheets": ", ".join(worksheet["sheet_name"] for worksheet in worksheets),
+            "jobs": len({
+                (job_listing["job_board"], job_listing["job_id"])
+                for job_listing in workbook_job_listings
+            }),
+        })
+
+    return {
+        "sheet_name": "Index",
+        "headers": get_headers_for_index_worksheet(),
+        "job_listings": index_rows,
+        "row_height": 32,
+    }
 
-            cell_value = job_details[header["name"]]
 
-            write_data_to_worksheet(
-                worksheet,
-                job_listing_row_idx,
-                header_column_idx,
-                cell_value,
-                cell_formats=cell_formats,
-            )
+def get_simple_name(name):
+    """
+    Purpose:
+        Get a name (e.g. a job title) in a form safe for filenames
+    Args:
+        name (String): Name to simplify
+    Returns:
+        simple_name (String): Lowercase name with runs of other characters
+            replaced by an underscore
+    """
 
-        job_listing_row_idx += 1
+    return re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_")
 
 
-def create_global_worksheet(workbook, sheet_name, job_listings):
+def get_job_board_worksheet(sheet_name, job_listings):
     """
     Purpose:
-        Create a sheet in the job report with all of the job listings flattened and
-        all duplicates removed
+        Get a sheet of the job report for job listings of a specific job board and
+        job title combination. (e.g. job listings for "Administrative Assistant" in
+        Indeed)
     Args:
-        workbook (XlsxWriter Workbook Object): The open workbook object to add the
-            sheet to
         sheet_name (String): Name of the sheet to add to the workbook
-        job_listings (List of Dicts): A list of Dicts. Key is the job ID
-            and the dict holds all of the job listing details.
+        job_listings (Dict of JobListing Objs): Job listings keyed by job ID
     Returns:
-        N/A
+        worksheet (Dict): sheet_name, headers, job_listings, and row_height of the
+            sheet, None if there are no job listings
     """
 
     if not job_listings:
         logging.error(f"No {sheet_name} Job Listings to Generate Report")
-        return
-
-    # Create Worksheet
-    worksheet = workbook.add_worksheet(sheet_name)
-
-    # Set Cell Formats
-    cell_formats = {
-        "base_cell_format": workbook.add_format({
-            "text_wrap": True
-        }),
-        "date_cell_format": workbook.add_format({
-            "num_format": "[$-en-US]mmmm d, yyyy"
-        }),
-    }
-
-    # Get Headers
-    headers = get_headers_for_global_job_listing_worksheets()
+        return None
 
-    # Set Column Widths
-    for header_idx, header in enumerate(headers):
-        worksheet.set_column(f"{header['column']}:{header['column']}", header["width"])
-
-    # Set Row Height
-    min_row = 1
-    max_row = 1 + len(job_listings)
-    for row_idx in range(1, max_row):
-        worksheet.set_row(row_idx, 32)
-
-    # Set Table Options And Create Table
-    table_dimensions = "{column_start}{row_start}:{column_end}{row_end}".format(
-        column_start="A",
-        row_start=min_row,
-        column_end=chr((ord("A") - 1) + len(headers)),
-        row_end=max_row,
-    )
-    table_options = {
-        "name": re.sub("[^a-zA-Z]+", "", sheet_name),
-        "columns": [{"header": header["title"]} for header in headers],
+    return {
+        "sheet_name": sheet_name,
+        "headers": get_headers_for_job_title_listing_worksheets(),
+        "job_listings": list(job_listings.values()),
+        "row_height": 48,
     }
-    worksheet.add_table(table_dimensions, table_options)
-
-    # Write Data to Table
-    job_listing_row_idx = 1
-    for job_id, job_details in job_listings.items():
-
-        for header_column_idx, header in enumerate(headers):
-
-            cell_value = job_details[header["name"]]
 
-            write_data_to_worksheet(
-                worksheet,
-                job_listing_row_idx,
-                header_column_idx,
-                cell_value,
-                cell_formats=cell_formats,
-            )
-
-        job_listing_row_idx += 1
 
-
-def write_data_to_worksheet(
-    worksheet,
-    row_idx,
-    column_idx,
-    cell_value,
-    cell_formats=None
-):
+def get_global_worksheet(sheet_name, job_listings):
     """
     Purpose:
-        Get the write function for a specific type of data
+        Get a sheet of the job report with all of the job listings flattened and
+        all duplicates removed
     Args:
-        data (Object, various types): data to inspect and get write function
+        sheet_name (String): Name of the sheet to add to the workbook
+        job_listings (Dict of JobListing Objs): Job listings keyed by job ID
     Returns:
-        xlsxwriter_function (Function): Function to use to write data to xlsx.
+        worksheet (Dict): sheet_name, headers, job_listings, and row_height of the
+            sheet, None if there are no job listings
     """
 
-    if not cell_formats:
-        cell_formats = {
-            "base_cell_format": None,
-            "date_cell_format": None,
-        }
+    if not job_listings:
+        logging.error(f"No {sheet_name} Job Listings to Generate Report")
+        return None
 
-    if not cell_value:
-        worksheet.write_blank(row_idx, column_idx, "")
-    elif isinstance(cell_value, datetime):
-        worksheet.write_datetime(
-            row_idx, column_idx, cell_value, cell_formats["date_cell_format"]
-        )
-    elif isinstance(cell_value, float) or isinstance(cell_value, int):
-        worksheet.write_number(
-            row_idx, column_idx, cell_value, cell_formats["base_cell_format"]
-        )
-    elif isinstance(cell_value, bool):
-        worksheet.write_boolean(
-            row_idx, column_idx, cell_value, cell_formats["base_cell_format"]
-            )
-    elif isinstance(cell_value, str) and cell_value.lower() in ("true", "false"):
-        worksheet.write_boolean(
-            row_idx, column_idx, cell_value, cell_formats["base_cell_format"]
-        )
-    elif isinstance(cell_value, str) and "http" in cell_value:
-        worksheet.write_url(
-            row_idx, column_idx, cell_value, cell_formats["base_cell_format"]
-        )
-    elif isinstance(cell_value, str) and cell_value.startswith("="):
-        worksheet.write_formula(
-            row_idx, column_idx, cell_value, cell_formats["base_cell_format"]
-        )
-    elif isinstance(cell_value, str):
-        worksheet.write_string(
-            row_idx, column_idx, cell_value, cell_formats["base_cell_format"]
-        )
-    else:
-        worksheet.write_string(
-            row_idx, column_idx, cell_value, cell_formats["base_cell_format"]
-        )
+    return {
+        "sheet_name": sheet_name,
+        "headers": get_headers_for_global_job_listing_worksheets(),
+        "job_listings": list(job_listings.values()),
+        "row_height": 32,
+    }
 
 
 def get_headers_for_job_title_listing_worksheets():
@@ -680,12 +1341,38 @@ def get_headers_for_job_title_listing_worksheets():
             "name": "job_posting_datetime",
             "title": string_helpers.convert_to_title_case("job_posting_datetime"),
             "width": 20,
+            "type": "datetime",
         },
         {
             "name": "college_degree",
             "title": string_helpers.convert_to_title_case("college_degree"),
             "width": 25,
         },
+        {
+            "name": "degrees",
+            "title": string_helpers.convert_to_title_case("degrees"),
+            "width": 25,
+        },
+        {
+            "name": "certifications",
+            "title": string_helpers.convert_to_title_case("certifications"),
+            "width": 25,
+        },
+        {
+            "name": "skills",
+            "title": string_helpers.convert_to_title_case("skills"),
+            "width": 40,
+        },
+        {
+            "name": "security_clearance",
+            "title": string_helpers.convert_to_title_case("security_clearance"),
+            "width": 25,
+        },
+        {
+            "name": "work_arrangement",
+            "title": string_helpers.convert_to_title_case("work_arrangement"),
+            "width": 20,
+        },
         {
             "name": "job_type",
             "title": string_helpers.convert_to_title_case("job_type"),
@@ -705,16 +1392,19 @@ def get_headers_for_job_title_listing_worksheets():
             "name": "easy_apply",
             "title": string_helpers.convert_to_title_case("easy_apply"),
             "width": 15,
+            "type": "boolean",
         },
         {
             "name": "job_details_url",
             "title": string_helpers.convert_to_title_case("job_details_url"),
             "width": 100,
+            "type": "url",
         },
         {
             "name": "job_apply_url",
             "title": string_helpers.convert_to_title_case("job_apply_url"),
             "width": 100,
+            "type": "url",
         },
     ]
 
@@ -761,6 +1451,54 @@ def get_headers_for_global_job_listing_worksheets():
     return global_headers
 
 
+def get_headers_for_index_worksheet():
+    """
+    Purpose:
+        Get the headers and their Excel format for the index sheet
+    Args:
+        N/A
+    Returns:
+        index_headers (List of Dicst): A list of Dicts holding headers and their
+            Excel format for the index sheet
+    """
+
+    index_headers = [
+        {
+            "name": "workbook",
+            "title": string_helpers.convert_to_title_case("workbook"),
+            "width": 50,
+            "type": "url",
+        },
+        {
+            "name": "job_boards",
+            "title": string_helpers.convert_to_title_case("job_boards"),
+            "width": 20,
+        },
+        {
+            "name": "job_searches",
+            "title": string_helpers.convert_to_title_case("job_searches"),
+            "width": 40,
+        },
+        {
+            "name": "sheets",
+            "title": string_helpers.convert_to_title_case("sheets"),
+            "width": 60,
+        },
+        {
+            "name": "jobs",
+            "title": string_helpers.convert_to_title_case("jobs"),
+            "width": 15,
+            "type": "number",
+        },
+    ]
+
+    # Set Column Naming
+    for header_idx, header in enumerate(index_headers):
+        header["column"] = chr(ord("A") + header_idx)
+
+    return index_headers
+
+
 ###
 # Scrpt Configuration Functions
 ###
@@ -868,6 +1606,340 @@ def get_cli_arguments():
         default=7,
         required=False,
     )
+    optional.add_argument(
+        "--exclude-companies",
+        dest="exclude_companies",
+        help="Companies to leave out of the report (details are never fetched)",
+        action="append",
+        type=str,
+        default=[],
+        required=False,
+    )
+    optional.add_argument(
+        "--exclude-title-keywords",
+        dest="exclude_title_keywords",
+        help="Leave out jobs with the keyword in their title",
+        action="append",
+        type=str,
+        default=[],
+        required=False,
+    )
+    optional.add_argument(
+        "--require-title-keywords",
+        dest="require_title_keywords",
+        help="Leave out jobs with none of these keywords in their title",
+        action="append",
+        type=str,
+        default=[],
+        required=False,
+    )
+    optional.add_argument(
+        "--min-listed-salary",
+        dest="min_listed_salary",
+        help="Leave out jobs whose listed salary (annualized) tops out below this",
+        type=int,
+        default=None,
+        required=False,
+    )
+    optional.add_argument(
+        "--html-parser",
+        dest="html_parser",
+        help="How to parse job board HTML (every parser finds the same jobs)",
+        choices=indeed.Indeed.parser_backends,
+        default="strainer",
+        required=False,
+    )
+    optional.add_argument(
+        "--keyword-taxonomy-file",
+        dest="keyword_taxonomy_file",
+        help="JSON file of the degrees, certifications, skills, security "
+        "clearance, and work arrangement terms to tag jobs with",
+        type=str,
+        default=None,
+        required=False,
+    )
+    optional.add_argument(
+        "--parse-workers",
+        dest="parse_workers",
+        help="How many processes to parse job board HTML in (0 parses in the "
+        "threads fetching it)",
+        type=int,
+        default=0,
+        required=False,
+    )
+    optional.add_argument(
+        "--workers",
+        dest="workers",
+        help="How many job board/job title searches to run at once",
+        type=int,
+        default=1,
+        required=False,
+    )
+    optional.add_argument(
+        "--max-details-in-flight",
+        dest="max_details_in_flight",
+        help="Max number of job details to fetch from a job board at once",
+        type=int,
+        default=8,
+        required=False,
+    )
+    optional.add_argument(
+        "--prefetch-listing-pages",
+        dest="listing_pages_to_prefetch",
+        help="How many listing pages to fetch ahead while job details are fetched",
+        type=int,
+        default=2,
+        required=False,
+    )
+    optional.add_argument(
+        "--job-details-hedge-width",
+        dest="job_details_hedge_width",
+        help=(
+            "How many Indeed job details URL versions to request at once (the "
+            "first to return the job wins, 1 requests them one at a time)"
+        ),
+        type=int,
+        default=1,
+        required=False,
+    )
+    optional.add_argument(
+        "--requests-per-second",
+        dest="requests_per_second",
+        help="Sustained requests per second sent to a job board (slows if throttled)",
+        type=float,
+        default=5.0,
+        required=False,
+    )
+    optional.add_argument(
+        "--request-burst",
+        dest="request_burst",
+        help="Max number of requests sent to a job board back to back",
+        type=int,
+        default=10,
+        required=False,
+    )
+    optional.add_argument(
+        "--link-version-stats-file",
+        dest="link_version_stats_file",
+        help=(
+            "JSON file to persist which Indeed job details URL versions work (not "
+            "loaded or saved in replay runs)"
+        ),
+        type=str,
+        default=f"{BASE_PROJECT_PATH}/data/indeed/link_version_stats.json",
+        required=False,
+    )
+    optional.add_argument(
+        "--response-cache-dir",
+        dest="response_cache_dir",
+        help="Directory to cache job board responses in between runs",
+        type=str,
+        default=f"{BASE_PROJECT_PATH}/data/indeed/response_cache",
+        required=False,
+    )
+    optional.add_argument(
+        "--response-cache-max-mb",
+        dest="response_cache_max_mb",
+        help="Max size of the response cache on disk (least recently used evicted)",
+        type=int,
+        default=1024,
+        required=False,
+    )
+    optional.add_argument(
+        "--max-response-mb",
+        dest="max_response_mb",
+        help="Max size of a single (decompressed) response from a job board",
+        type=int,
+        default=10,
+        required=False,
+    )
+    optional.add_argument(
+        "--disable-response-cache",
+        dest="disable_response_cache",
+        help="Always fetch from the job boards instead of reusing cached responses",
+        action="store_true",
+        default=False,
+        required=False,
+    )
+    optional.add_argument(
+        "--transport-mode",
+        dest="transport_mode",
+        help=(
+            "live fetches from the job boards, record also saves every response to "
+            "the replay corpus, and replay answers from the replay corpus (or from "
+            "indeed/cached_data if no corpus has been recorded) without touching "
+            "the network"
+        ),
+        type=str,
+        default="live",
+        choices=["live", "record", "replay"],
+        required=False,
+    )
+    optional.add_argument(
+        "--replay-corpus-dir",
+        dest="replay_corpus_dir",
+        help="Directory of the corpus recorded to and replayed from",
+        type=str,
+        default=f"{BASE_PROJECT_PATH}/data/indeed/replay_corpus",
+        required=False,
+    )
+    optional.add_argument(
+        "--replay-latency",
+        dest="replay_latency",
+        help="Seconds to wait per replayed request (approximates network latency)",
+        type=float,
+        default=0.0,
+        required=False,
+    )
+    optional.add_argument(
+        "--disable-job-details-dedup",
+        dest="disable_job_details_dedup",
+        help="Fetch details for every job found, even if already seen this run",
+        action="store_true",
+        default=False,
+        required=False,
+    )
+    optional.add_argument(
+        "--async-crawl",
+        dest="async_crawl",
+        help="Crawl every job title at once from a single event loop",
+        action="store_true",
+        default=False,
+        required=False,
+    )
+    optional.add_argument(
+        "--job-store-file",
+        dest="job_store_file",
+        help="SQLite database every job found is stored in across runs",
+        type=str,
+        default=f"{BASE_PROJECT_PATH}/data/job_store/jobs.sqlite3",
+        required=False,
+    )
+    optional.add_argument(
+        "--disable-job-store",
+        dest="disable_job_store",
+        help="Do not store the jobs found in the job store",
+        action="store_true",
+        default=False,
+        required=False,
+    )
+    optional.add_argument(
+        "--output-format",
+        dest="output_formats",
+        help=(
+            "Format to write the report in (can be repeated). jsonl and csv are "
+            "written as jobs are found. Defaults to xlsx"
+        ),
+        action="append",
+        type=str,
+        default=[],
+        choices=["xlsx"] + list(job_exporters.JOB_EXPORTERS),
+        required=False,
+    )
+    optional.add_argument(
+        "--constant-memory-xlsx",
+        dest="constant_memory_xlsx",
+        help=(
+            "Flush xlsx rows to disk as they are written, for very large reports "
+            "(sheets get an autofilter instead of an Excel table)"
+        ),
+        action="store_true",
+        default=False,
+        required=False,
+    )
+    optional.add_argument(
+        "--max-rows-per-sheet",
+        dest="max_rows_per_sheet",
+        help=(
+            "Max jobs per xlsx sheet before it is split into numbered sheets "
+            "(sheets are always split at Excel's row and hyperlink limits)"
+        ),
+        type=int,
+        default=None,
+        required=False,
+    )
+    optional.add_argument(
+        "--max-urls-per-sheet",
+        dest="max_urls_per_sheet",
+        help=(
+            "Max hyperlinks per xlsx sheet before it is split into numbered sheets "
+            "(capped at Excel's limit of 65,530)"
+        ),
+        type=int,
+        default=None,
+        required=False,
+    )
+    optional.add_argument(
+        "--max-rows-per-workbook",
+        dest="max_rows_per_workbook",
+        help="Max jobs per xlsx workbook before the report spills into another",
+        type=int,
+        default=None,
+        required=False,
+    )
+    optional.add_argument(
+        "--max-mb-per-workbook",
+        dest="max_mb_per_workbook",
+        help=(
+            "Max MB of (uncompressed) cell text per xlsx workbook before the report "
+            "spills into another"
+        ),
+        type=float,
+        default=None,
+        required=False,
+    )
+    optional.add_argument(
+        "--report-workers",
+        dest="report_workers",
+        help="Number of xlsx workbooks to write at once (each in its own process)",
+        type=int,
+        default=1,
+        required=False,
+    )
+    optional.add_argument(
+        "--split-report-by",
+        dest="split_report_by",
+        help="Write a separate xlsx workbook for each job board or job title",
+        type=str,
+        default=None,
+        choices=["board", "title"],
+        required=False,
+    )
+    optional.add_argument(
+        "--report-index",
+        dest="report_index",
+        help="Also write an index xlsx workbook linking to every report workbook",
+        action="store_true",
+        default=False,
+        required=False,
+    )
+    optional.add_argument(
+        "--incremental",
+        dest="incremental",
+        help=(
+            "Only fetch details of jobs the profile has not seen in earlier runs "
+            "and add a New sheet of them to the report (needs the job store)"
+        ),
+        action="store_true",
+        default=False,
+        required=False,
+    )
+    optional.add_argument(
+        "--profile",
+        dest="profile",
+        help="Name seen jobs are tracked under. Defaults to the report filename",
+        type=str,
+        default=None,
+        required=False,
+    )
+    optional.add_argument(
+        "--delta-report",
+        dest="delta_report",
+        help="With --incremental, also write a report of only the new jobs",
+        action="store_true",
+        default=False,
+        required=False,
+    )
 
     return parser.parse_args()
 
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        Tests for the generate_job_report script's helper functions
+"""
+
+# Python Library Imports
+import csv
+import json
+import re
+from types import SimpleNamespace
+
+# Third Party Imports
+import pytest
+
+# Local Library Imports
+from auto_recruiter import generate_job_report
+from indeed.job_listing import JobListing
+from job_reports.tests.test_xlsx_job_report import build_job_listings, read_workbook
+
+
+###
+# Helpers
+###
+
+
+def build_job_listings_by_job_board():
+    """
+    Purpose:
+        Build jobs found for two job titles on Indeed and one on Monster
+    Args:
+        N/A
+    Returns:
+        job_listings_by_job_board (Dict of Dicts of Dicts): Jobs keyed by job ID,
+            by job board and job title
+    """
+
+    job_counts = {
+        "indeed": {"Office Manager": 5, "HR": 3},
+        "monster": {"Office Manager": 2},
+    }
+
+    return {
+        job_board: {
+            job_title: {
+                f"{job_board}_{job_title}_{job_listing['job_id']}": job_listing
+                for job_listing in build_job_listings(job_count)
+            }
+            for job_title, job_count in job_counts_by_title.items()
+        }
+        for job_board, job_counts_by_title in job_counts.items()
+    }
+
+
+def read_job_report(report_output_dir):
+    """
+    Purpose:
+        Count the sheets and rows of each workbook of a report
+    Args:
+        report_output_dir (Path Obj): Directory the report was written to
+    Returns:
+        job_report (Dict of Dicts): Rows of each sheet (by sheet name in workbook
+            order), by workbook filename without its date
+    """
+
+    job_report = {}
+    for report_file in sorted(report_output_dir.glob("*.xlsx")):
+        sheets, _ = read_workbook(str(report_file))
+        job_report[re.sub(r"_[0-9]{8}\.xlsx$", "", report_file.name)] = {
+            sheet_name: sheet["rows"] for sheet_name, sheet in sheets.items()
+        }
+
+    return job_report
+
+
+###
+# Tests
+###
+
+
+def test_job_exporters_closed_when_search_fails(tmp_path, monkeypatch):
+    """
+    Purpose:
+        A search that fails after finding jobs still leaves complete flat file
+        exports holding the jobs found before it failed
+    """
+
+    def run_failing_job_searches(
+        job_searches, job_board_functions, cli_args, workers=1, on_job_listing=None
+    ):
+        on_job_listing(JobListing(company="EMSL", job_title="Office Manager"))
+        raise RuntimeError("Search Failed")
+
+    monkeypatch.setattr(
+        generate_job_report, "run_job_searches", run_failing_job_searches
+    )
+    cli_args = SimpleNamespace(
+        report_output_dir=str(tmp_path),
+        report_output_filename="jobs",
+        job_boards=["indeed"],
+        job_titles=["Office Manager"],
+        async_crawl=False,
+        workers=1,
+    )
+
+    with pytest.raises(RuntimeError):
+        generate_job_report.find_job_listings(cli_args, ["xlsx", "jsonl", "csv"])
+
+    jsonl_file, = tmp_path.glob("jobs_*.jsonl")
+    with open(jsonl_file, encoding="utf-8") as jsonl_fh:
+        jsonl_rows = [json.loads(line) for line in jsonl_fh]
+    csv_file, = tmp_path.glob("jobs_*.csv")
+    with open(csv_file, newline="", encoding="utf-8") as csv_fh:
+        csv_rows = list(csv.DictReader(csv_fh))
+
+    assert [jsonl_row["company"] for jsonl_row in jsonl_rows] == ["EMSL"]
+    assert [csv_row["company"] for csv_row in csv_rows] == ["EMSL"]
+    assert not list(tmp_path.glob("jobs_*.xlsx"))
+
+
+def test_job_report_sheets_roll_over(tmp_path):
+    """
+    Purpose:
+        Sheets with more jobs than max_urls_per_sheet allows (each job board
+        sheet row has two URLs) roll over into numbered sheets, keeping every job
+    """
+
+    generate_job_report.create_job_report(
+        str(tmp_path),
+        "jobs",
+        build_job_listings_by_job_board(),
+        max_urls_per_sheet=4,
+        report_workers=2,
+    )
+
+    assert read_job_report(tmp_path) == {
+        "jobs": {
+            "Global": 2,
+            "Global (2)": 2,
+            "Global (3)": 2,
+            "Global (4)": 2,
+            "Global (5)": 2,
+            "Indeed - Office Manager": 2,
+            "Indeed - Office Manager (2)": 2,
+            "Indeed - Office Manager (3)": 1,
+            "Indeed - Hr": 2,
+            "Indeed - Hr (2)": 1,
+            "Monster - Office Manager": 2,
+        },
+    }
+
+
+@pytest.mark.parametrize("split_report_by, job_report", [
+    (
+        "board",
+        {
+            "jobs_indeed": {
+                "Global": 8,
+                "Indeed - Office Manager": 5,
+                "Indeed - Hr": 3,
+            },
+            "jobs_monster": {"Global": 2, "Monster - Office Manager": 2},
+        },
+    ),
+    (
+        "title",
+        {
+            "jobs_indeed_hr": {"Indeed - Hr": 3},
+            "jobs_indeed_office_manager": {"Indeed - Office Manager": 5},
+            "jobs_monster_office_manager": {"Monster - Office Manager": 2},
+        },
+    ),
+])
+def test_job_report_split(tmp_path, split_report_by, job_report):
+    """
+    Purpose:
+        split_report_by writes a workbook per job board (each with its own Global
+        sheet) or per job board/job title, written by the process pool
+    """
+
+    generate_job_report.create_job_report(
+        str(tmp_path),
+        "jobs",
+        build_job_listings_by_job_board(),
+        report_workers=2,
+        split_report_by=split_report_by,
+    )
+
+    assert read_job_report(tmp_path) == job_report
+
+
+def test_job_report_split_and_spilled(tmp_path):
+    """
+    Purpose:
+        A split workbook past max_rows_per_workbook spills into numbered part
+        workbooks, while the others stay whole
+    """
+
+    generate_job_report.create_job_report(
+        str(tmp_path),
+        "jobs",
+        build_job_listings_by_job_board(),
+        max_rows_per_workbook=8,
+        split_report_by="board",
+    )
+
+    assert read_job_report(tmp_path) == {
+        "jobs_indeed": {"Global": 8},
+        "jobs_indeed_part2": {"Indeed - Office Manager": 5, "Indeed - Hr": 3},
+        "jobs_monster": {"Global": 2, "Monster - Office Manager": 2},
+    }
@@ -4,4 +4,11 @@
 """
 
 from .indeed import *
+from .async_indeed import *
+from .replay_transport import *
+from .rate_limiter import *
+from .job_details_registry import *
+from .job_listing import *
+from .job_store import *
+from .job_listing_filters import *
 from .cached_data import *
@@ -0,0 +1,553 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        The AsyncIndeed class is the asyncio counterpart of the Indeed class. Listing
+        pages, job details, and link version probes are all coroutines scheduled on
+        one event loop, bounded by a global and a per-host semaphore.
+"""
+
+# Python Library Imports
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+# Local Library Imports
+from .indeed import Indeed
+
+
+###
+# Class Definition
+###
+
+
+class AsyncIndeed(object):
+    """
+        AsyncIndeed Class. Handles requesting data from Indeed website concurrently
+        from a single event loop. Requests are sent through the transport shared
+        with the Indeed class (so pooling and retries apply) and parsed with the
+        Indeed class parsers
+    """
+
+    ###
+    # Class Lifecycle Methods
+    ###
+
+    def __init__(self, max_requests_in_flight=16, max_requests_per_host=8):
+        """
+        Purpose:
+            Initilize the AsyncIndeed Class.
+        Args:
+            max_requests_in_flight (Int): Max number of requests in flight at once
+                across every host
+            max_requests_per_host (Int): Max number of requests in flight at once
+                to a single host
+        Returns:
+            N/A
+        """
+        logging.info("Initializing AsyncIndeed")
+
+        self.max_requests_in_flight = max_requests_in_flight
+        self.max_requests_per_host = max_requests_per_host
+
+        self.executor = ThreadPoolExecutor(max_workers=max_requests_in_flight)
+
+        # Semaphores are created on first use so they bind to the running loop
+        self.global_semaphore = None
+        self.host_semaphores = {}
+
+        # Job details fetches in flight, so concurrent searches share them
+        self.job_details_fetches = {}
+
+    def close(self):
+        """
+        Purpose:
+            Shut down the worker threads used to run blocking requests and parsing
+        Args:
+            N/A
+        Returns:
+            N/A
+        """
+        self.executor.shutdown(wait=True)
+
+    ###
+    # Get Functions
+    ###
+
+    async def get_job_listings(
+        self,
+        keywords,
+        zip_code,
+        radius=15,
+        job_type="fulltime",
+        salary_min="$40,000",
+        pagination=0,
+        max_days_since_posting=7,
+        job_listing_filters=None,
+        use_cache=True,
+    ):
+        """
+        Purpose:
+            Get Job Listings by keyword, zip_code, radius, job_type, and salary.
+            Details for every job on the page are fetched concurrently
+        Args:
+            keywords (String): Keywords to Search
+            zip_code (String): Zip code to center the job search on
+            radius (String): Radius (from the zip code center) that jobs need to be
+                in to be considered
+            job_type (String): type of job. Enum of the following:
+                [fulltime, parttime, contractor]
+            salary_min (String): Minimum salary for jobs to be returned (best guess if
+                none is provided)
+            pagination (String): The job to start on
+            max_days_since_posting (Int): Max Days since posting that a job needs to
+                be returned
+            job_listing_filters (List of Functions): Predicates each job listing
+                card must pass before its details are fetched. Defaults to
+                Indeed.job_listing_filters
+            use_cache (Boolean): Whether a cached listings page can be used.
+                Pass False when retrying a page for different results
+        Returns:
+            job_listings (List of Dicts): A list of Dicts. Key is the job ID and the
+                dict holds all of the job listing details.
+        """
+        logging.info(f"Searching for jobs with keywords: {keywords}")
+
+        raw_job_listing_html = await self.request_job_listings_from_indeed(
+            keywords,
+            zip_code,
+            radius=radius,
+            job_type=job_type,
+            salary_min=salary_min,
+            pagination=pagination,
+            use_cache=use_cache,
+        )
+
+        # Parsing The Job HTML
+        if raw_job_listing_html:
+            base_job_listings = await self.run_blocking(
+                Indeed.run_parse, "parse_job_listings_html", raw_job_listing_html
+            )
+        else:
+            logging.error(f"Failed to Fetch Job Listings from Indeed URL, exiting")
+            base_job_listings = []
+
+        # Add Job Type As A Field
+        for base_job_listing in base_job_listings:
+            base_job_listing["job_type"] = Indeed.get_job_type_name(job_type)
+
+        # Skip Jobs That Would Be Discarded Before Fetching Their Details
+        base_job_listings = Indeed.filter_job_listings_before_details(
+            base_job_listings,
+            max_days_since_posting,
+            job_listing_filters=job_listing_filters,
+        )
+
+        # Get More Information For Each Job Listing (gather keeps listing order)
+        all_job_details = await asyncio.gather(*[
+            self.get_job_details(
+                base_job_listing["company"],
+                base_job_listing["job_title"],
+                base_job_listing["job_id"],
+            )
+            for base_job_listing in base_job_listings
+        ])
+        for base_job_listing, job_details in zip(base_job_listings, all_job_details):
+            for job_detail, job_detail_value in job_details.items():
+                base_job_listing[job_detail] = job_detail_value
+
+        return Indeed.filter_job_listings_by_posting_date(
+            base_job_listings, max_days_since_posting
+        )
+
+    async def iter_job_listings(
+        self,
+        keywords,
+        zip_code,
+        radius=15,
+        job_type="fulltime",
+        salary_min="$40,000",
+        pagination=0,
+        max_days_since_posting=7,
+        job_listing_filters=None,
+        max_pages_without_new_jobs=5,
+    ):
+        """
+        Purpose:
+            Async iterator version of Indeed.iter_job_listings. Pages through the
+            results and yields each job as soon as its details are fetched, with at
+            most Indeed.max_details_in_flight fetches running ahead of the consumer.
+            A page that yields no new job is fetched again (past the response
+            cache) instead of moving on to the next page
+        Args:
+            keywords (String): Keywords to Search
+            zip_code (String): Zip code to center the job search on
+            radius (String): Radius (from the zip code center) that jobs need to be
+                in to be considered
+            job_type (String): type of job. Enum of the following:
+                [fulltime, parttime, contractor]
+            salary_min (String): Minimum salary for jobs to be returned (best guess if
+                none is provided)
+            pagination (String): The job to start on. If 0, page 1 of results
+            max_days_since_posting (Int): Max Days since posting that a job needs to
+                be returned
+            job_listing_filters (List of Functions): Predicates each job listing
+                card must pass before its details are fetched. Defaults to
+                Indeed.job_listing_filters
+            max_pages_without_new_jobs (Int): Stop after this many fetches of a
+                page in a row yield no job that was not already yielded
+        Returns:
+            job_listings (Async Generator of Dicts): Each job with all of the job
+                listing details. A job is yielded once even if listed on several
+                pages
+        """
+        logging.info(f"Streaming jobs with keywords: {keywords}")
+
+        yielded_job_ids = set()
+        pages_without_new_jobs = 0
+        job_details_fetches = {}
+        try:
+            while pages_without_new_jobs < max_pages_without_new_jobs:
+                raw_job_listing_html = await self.request_job_listings_from_indeed(
+                    keywords,
+                    zip_code,
+                    radius=radius,
+                    job_type=job_type,
+                    salary_min=salary_min,
+                    pagination=pagination,
+                    use_cache=not pages_without_new_jobs,
+                )
+
+                # Parsing The Job HTML
+                if raw_job_listing_html:
+                    base_job_listings = await self.run_blocking(
+                        Indeed.run_parse,
+                        "parse_job_listings_html",
+                        raw_job_listing_html,
+                    )
+                else:
+                    logging.error(
+                        f"Failed to Fetch Job Listings from Indeed URL, exiting"
+                    )
+                    base_job_listings = []
+
+                # Add Job Type As A Field
+                for base_job_listing in base_job_listings:
+                    base_job_listing["job_type"] = Indeed.get_job_type_name(job_type)
+
+                # Skip Jobs That Would Be Discarded (Or Were Already Yielded)
+                # Before Fetching Their Details
+                base_job_listings = iter([
+                    base_job_listing
+                    for base_job_listing in Indeed.filter_job_listings_before_details(
+                        base_job_listings,
+                        max_days_since_posting,
+                        job_listing_filters=job_listing_filters,
+                    )
+                    if base_job_listing["job_id"] not in yielded_job_ids
+                ])
+
+                new_job_found = False
+                while True:
+                    while len(job_details_fetches) < Indeed.max_details_in_flight:
+                        base_job_listing = next(base_job_listings, None)
+                        if not base_job_listing:
+                            break
+                        job_details_fetch = asyncio.ensure_future(
+                            self.get_job_details(
+                                base_job_listing["company"],
+                                base_job_listing["job_title"],
+                                base_job_listing["job_id"],
+                            )
+                        )
+                        job_details_fetches[job_details_fetch] = base_job_listing
+
+                    if not job_details_fetches:
+                        break
+
+                    done_fetches, _ = await asyncio.wait(
+                        job_details_fetches, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for job_details_fetch in done_fetches:
+                        base_job_listing = job_details_fetches.pop(job_details_fetch)
+                        for job_detail, job_detail_value in\
+                                job_details_fetch.result().items():
+                            base_job_listing[job_detail] = job_detail_value
+
+                        if base_job_listing["job_id"] in yielded_job_ids:
+                            continue
+                        elif not Indeed.is_job_listing_within_posting_window(
+                            base_job_listing, max_days_since_posting
+                        ):
+                            continue
+                        yielded_job_ids.add(base_job_listing["job_id"])
+                        new_job_found = True
+                        yield base_job_listing
+
+                # Only Move On Once A Page Has Something New, Otherwise Retry It
+                if new_job_found:
+                    pages_without_new_jobs = 0
+                    pagination += Indeed.jobs_per_listing_page
+                else:
+                    pages_without_new_jobs += 1
+                    logging.info(
+                        f"No Unqiue Jobs Found On Page (This is try "
+                        f"#{pages_without_new_jobs} in a row)"
+                    )
+        finally:
+            # Consumer Is Done (Or Search Exhausted), Drop Outstanding Fetches
+            for job_details_fetch in job_details_fetches:
+                job_details_fetch.cancel()
+
+    async def get_job_details(self, company, job_title, job_id):
+        """
+        Purpose:
+            Get Job Details. Jobs already in Indeed's job details registry (or being
+            fetched by another coroutine) are not fetched again
+        Args:
+            company (String): Name of the company the job is with
+            job_title (String): The title of the position with the company
+            job_id (String): The unqiue job_id from Indeed
+        Returns:
+            job_details (Dict): Details of the job
+        """
+
+        job_details_registry = Indeed.job_details_registry
+        if not job_details_registry or not job_id:
+            return await self.fetch_job_details(company, job_title, job_id)
+
+        job_details = job_details_registry.get(job_id)
+        if job_details:
+            logging.info(f"Job {job_id} Already Seen This Run, Reusing Its Details")
+            return job_details
+
+        job_details_fetch = self.job_details_fetches.get(job_id)
+        if not job_details_fetch:
+            job_details_fetch = asyncio.ensure_future(
+                self.fetch_and_register_job_details(company, job_title, job_id)
+            )
+            self.job_details_fetches[job_id] = job_details_fetch
+
+        return dict(await asyncio.shield(job_details_fetch))
+
+    async def fetch_and_register_job_details(self, company, job_title, job_id):
+        """
+        Purpose:
+            Fetch the Job Details and add them to Indeed's job details registry
+        Args:
+            company (String): Name of the company the job is with
+            job_title (String): The title of the position with the company
+            job_id (String): The unqiue job_id from Indeed
+        Returns:
+            job_details (Dict): Details of the job
+        """
+
+        try:
+            job_details = await self.fetch_job_details(company, job_title, job_id)
+            Indeed.job_details_registry.add(job_id, job_details)
+        finally:
+            self.job_details_fetches.pop(job_id, None)
+
+        return job_details
+
+    async def fetch_job_details(self, company, job_title, job_id):
+        """
+        Purpose:
+            Fetch and parse Job Details from Indeed.com
+        Args:
+            company (String): Name of the company the job is with
+            job_title (String): The title of the position with the company
+            job_id (String): The unqiue job_id from Indeed
+        Returns:
+            job_details (Dict): Details of the job
+        """
+
+        job_details_url, raw_job_details_html =\
+            await self.request_job_details_from_indeed(company, job_title, job_id)
+
+        return await self.run_blocking(
+            Indeed.build_job_details, job_details_url, raw_job_details_html
+        )
+
+    ###
+    # Functions to Pull Raw Results From to Indeed.com
+    ###
+
+    async def request_job_listings_from_indeed(
+        self,
+        keywords,
+        zip_code,
+        radius=15,
+        job_type="fulltime",
+        salary_min="$40,000",
+        pagination=0,
+        use_cache=True,
+    ):
+        """
+        Purpose:
+            Get Job Listing HTML from Indeed.com. Search for jobs using keyword,
+            zip_code, radius, job_type, and salary
+        Args:
+            keywords (String): Keywords to Search
+            zip_code (String): Zip code to center the job search on
+            radius (String): Radius (from the zip code center) that jobs need to be
+                in to be considered
+            job_type (String): type of job. Enum of the following:
+                [fulltime, parttime, contractor]
+            salary_min (String): Minimum salary for jobs to be returned (best guess if
+                none is provided)
+            pagination (String): The job to start on
+            use_cache (Boolean): Whether a cached response can be returned (see
+                Indeed.request_url)
+        Returns:
+            raw_job_listing_html (String): Raw HTML results from Indeed.com of the job
+                listings matching the search criteria
+        """
+
+        job_listing_url = Indeed.generate_job_listings_url(
+            keywords,
+            zip_code,
+            radius=radius,
+            job_type=job_type,
+            salary_min=salary_min,
+            pagination=pagination,
+        )
+
+        logging.info(f"Fetching HTML from Indeed URL: {job_listing_url}")
+        job_listing_response =\
+            await self.request_url(job_listing_url, use_cache=use_cache)
+
+        return Indeed.get_html_from_response(job_listing_response)
+
+    async def request_job_details_from_indeed(self, company, job_title, job_id):
+        """
+        Purpose:
+            Get Job Details HTML from Indeed.com, probing each link version (most
+            likely to work first) until one returns the job. Indeed's
+            job_details_hedge_width link versions are kept in flight at once, and
+            the rest are cancelled as soon as one succeeds. Cancelling only stops
+            probes still waiting for a semaphore or a worker thread; a probe whose
+            request is already running on a worker thread finishes it in the
+            background (holding that thread) and its response is dropped
+        Args:
+            company (String): Name of the company the job is with
+            job_title (String): The title of the position with the company
+            job_id (String): The unqiue job_id from Indeed
+        Returns:
+            job_details_url (String): URL that returned the job details
+            raw_job_details_html (String): Raw HTML results from Indeed.com of the job
+                details
+        """
+
+        hedge_width = max(Indeed.job_details_hedge_width, 1)
+        remaining_link_versions =\
+            Indeed.link_version_tracker.get_ordered_link_versions(job_id)
+        pending_probes = {}
+
+        try:
+            while remaining_link_versions or pending_probes:
+
+                # Keep hedge_width Probes In Flight
+                while remaining_link_versions and len(pending_probes) < hedge_width:
+                    link_version = remaining_link_versions.pop(0)
+                    pending_probe = asyncio.ensure_future(
+                        self.request_job_details_version(
+                            company, job_title, job_id, link_version
+                        )
+                    )
+                    pending_probes[pending_probe] = link_version
+
+                finished_probes, _ = await asyncio.wait(
+                    pending_probes, return_when=asyncio.FIRST_COMPLETED
+                )
+                for finished_probe in finished_probes:
+                    link_version = pending_probes.pop(finished_probe)
+                    raw_job_details_html = finished_probe.result()
+                    if raw_job_details_html:
+                        Indeed.link_version_tracker.record_success(
+                            job_id, link_version
+                        )
+                        return (
+                            Indeed.generate_job_details_url(
+                                company, job_title, job_id, link_version=link_version
+                            ),
+                            raw_job_details_html,
+                        )
+        finally:
+            for pending_probe in pending_probes:
+                pending_probe.cancel()
+
+        return None, None
+
+    async def request_job_details_version(
+        self, company, job_title, job_id, link_version
+    ):
+        """
+        Purpose:
+            Probe a single link version of a job's details URL
+        Args:
+            company (String): Name of the company the job is with
+            job_title (String): The title of the position with the company
+            job_id (String): The unqiue job_id from Indeed
+            link_version (String): Version of the job details URL to request
+        Returns:
+            raw_job_details_html (String): Raw HTML results from Indeed.com of the job
+                details, None if this version did not return the job
+        """
+
+        job_details_url = Indeed.generate_job_details_url(
+            company, job_title, job_id, link_version=link_version
+        )
+
+        logging.info(
+            f"Fetching HTML from Indeed URL ({link_version}): {job_details_url}"
+        )
+        job_details_response = await self.request_url(job_details_url)
+
+        return Indeed.get_html_from_response(
+            job_details_response, response_description=f"Details {link_version}"
+        )
+
+    async def request_url(self, url, use_cache=True):
+        """
+        Purpose:
+            GET a URL from Indeed.com once a global and a per-host slot are free
+        Args:
+            url (String): URL to request
+            use_cache (Boolean): Whether a cached response can be returned (see
+                Indeed.request_url)
+        Returns:
+            response (HttpResponse Obj): Status, headers, and body of the response
+        """
+
+        if not self.global_semaphore:
+            self.global_semaphore = asyncio.Semaphore(self.max_requests_in_flight)
+
+        host = urlsplit(url).netloc
+        if host not in self.host_semaphores:
+            self.host_semaphores[host] =\
+                asyncio.Semaphore(self.max_requests_per_host)
+
+        async with self.global_semaphore:
+            async with self.host_semaphores[host]:
+                return await self.run_blocking(Indeed.request_url, url, use_cache)
+
+    ###
+    # Helper Functions
+    ###
+
+    async def run_blocking(self, function, *args):
+        """
+        Purpose:
+            Run a blocking function (a request or a parse) on the worker threads
+            without blocking the event loop
+        Args:
+            function (Function): Function to run
+            args (Args): Arguments to pass to the function
+        Returns:
+            result (Object): What the function returned
+        """
+
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(self.executor, function, *args)
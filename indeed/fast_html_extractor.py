@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        Pull the parts of an Indeed.com job details page the Indeed class reads
+        (window._initialData, the job description, the apply link, and the
+        metadata footer) straight out of the raw HTML in a single scan, without
+        building a DOM. Anything unexpected makes the extraction fail so the caller
+        can fall back to Beautiful Soup.
+"""
+
+# Python Library Imports
+import html
+import re
+
+
+###
+# Globals
+###
+
+
+JOB_DETAILS_SECTION_REGEX = re.compile(
+    r"window\._initialData="
+    r"|<(?P<tag_name>div|span)\b[^>]*?(?:"
+    r"\sid=[\"']?(?P<tag_id>jobDescriptionText|originalJobLinkContainer)"
+    r"(?=[\"'\s>])"
+    r"|\sclass=(?:[\"'](?:[^\"']*\s)?)?"
+    r"(?P<tag_class>jobsearch-JobMetadataFooter)(?=[\"'\s>])"
+    r")[^>]*>"
+)
+TAG_REGEX = re.compile(r"<[^>]*>")
+STRAY_LESS_THAN_REGEX = re.compile(r"<(?![A-Za-z/])")
+ANCHOR_HREF_REGEX = re.compile(
+    r"<a\b[^>]*?\shref=(?:\"(?P<double_quoted>[^\"]*)\"|'(?P<single_quoted>[^']*)'"
+    r"|(?P<unquoted>[^\s\"'>]+))"
+)
+UNSAFE_TEXT_MARKERS = (
+    "<!--", "<![cdata[", "<script", "<style", "<textarea", "<pre",
+)
+ASCII_SPACES = "\x20\x0a\x09\x0c\x0d"
+
+
+###
+# Extraction Functions
+###
+
+
+def extract_job_details_sections(raw_job_details_html):
+    """
+    Purpose:
+        Extract the sections of a job details page in one scan of the raw HTML
+    Args:
+        raw_job_details_html (String): Raw HTML results from Indeed.com of the
+            job details
+    Returns:
+        job_details_sections (Dict): job_description (text, not stripped),
+            job_apply_url, job_metadata (text of the metadata footer), and
+            raw_init_data (JSON string). None if any section could not be
+            extracted exactly as Beautiful Soup would
+    """
+
+    job_details_sections = {}
+
+    for section_match in JOB_DETAILS_SECTION_REGEX.finditer(raw_job_details_html):
+        if not section_match.group("tag_name"):
+            if "raw_init_data" not in job_details_sections:
+                job_details_sections["raw_init_data"] =\
+                    extract_init_data(raw_job_details_html, section_match.end())
+            continue
+
+        inner_html = extract_inner_html(
+            raw_job_details_html, section_match.group("tag_name"), section_match.end()
+        )
+        if inner_html is None:
+            return None
+
+        if section_match.group("tag_id") == "jobDescriptionText":
+            section_name, section_value = "job_description", extract_text(inner_html)
+        elif section_match.group("tag_id") == "originalJobLinkContainer":
+            section_name, section_value = "job_apply_url", extract_href(inner_html)
+        else:
+            section_name, section_value = "job_metadata", extract_text(inner_html)
+
+        # Beautiful Soup Reads The First Match, So Only The First Counts
+        if section_value is None:
+            return None
+        job_details_sections.setdefault(section_name, section_value)
+
+    if len(job_details_sections) != 4:
+        return None
+
+    return job_details_sections
+
+
+###
+# Helpers
+###
+
+
+def extract_init_data(raw_job_details_html, start_idx):
+    """
+    Purpose:
+        Get the window._initialData JSON string that starts at an index
+    Args:
+        raw_job_details_html (String): Raw HTML of the job details page
+        start_idx (Int): Index just past "window._initialData="
+    Returns:
+        raw_init_data (String): JSON assigned to window._initialData
+    """
+
+    end_idx = raw_job_details_html.find(";</script>", start_idx)
+
+    return raw_job_details_html[start_idx:end_idx]
+
+
+def extract_inner_html(raw_html, tag_name, start_idx):
+    """
+    Purpose:
+        Get the HTML inside an element, from just past its open tag up to its
+        matching close tag (counting nested elements of the same name)
+    Args:
+        raw_html (String): Raw HTML the element is in
+        tag_name (String): Name of the element (e.g. div)
+        start_idx (Int): Index just past the element's open tag
+    Returns:
+        inner_html (String): HTML inside the element, None if the element is
+            never closed
+    """
+
+    nested_tag_regex = re.compile(rf"<(/?){tag_name}\b[^>]*>", re.IGNORECASE)
+
+    depth = 1
+    for nested_tag_match in nested_tag_regex.finditer(raw_html, start_idx):
+        if nested_tag_match.group(1):
+            depth -= 1
+        elif not nested_tag_match.group(0).endswith("/>"):
+            depth += 1
+
+        if depth == 0:
+            return raw_html[start_idx:nested_tag_match.start()]
+
+    return None
+
+
+def extract_text(inner_html):
+    """
+    Purpose:
+        Get the text of an element the way Beautiful Soup's .text does (every
+        string inside it joined together, with strings that are only whitespace
+        collapsed to a single newline or space)
+    Args:
+        inner_html (String): HTML inside the element
+    Returns:
+        text (String): Text of the element, None if the element holds markup
+            whose text is not simply its strings (comments, scripts, etc.)
+    """
+
+    lowered_inner_html = inner_html.lower()
+    if any(marker in lowered_inner_html for marker in UNSAFE_TEXT_MARKERS):
+        return None
+    elif STRAY_LESS_THAN_REGEX.search(inner_html):
+        return None
+
+    text_strings = []
+    for text_string in TAG_REGEX.split(inner_html):
+        if not text_string:
+            continue
+
+        text_string = html.unescape(text_string)
+        if not text_string.strip(ASCII_SPACES):
+            text_string = "\n" if "\n" in text_string else " "
+        text_strings.append(text_string)
+
+    return "".join(text_strings)
+
+
+def extract_href(inner_html):
+    """
+    Purpose:
+        Get the href of the first link inside an element
+    Args:
+        inner_html (String): HTML inside the element
+    Returns:
+        href (String): href of the first link, None if there is no link
+    """
+
+    anchor_href_match = ANCHOR_HREF_REGEX.search(inner_html)
+    if not anchor_href_match:
+        return None
+
+    for href in anchor_href_match.groups():
+        if href is not None:
+            return html.unescape(href)
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        The HttpTransport class is responsible for owning the pooled, keep-alive
+        HTTP session that every request to Indeed.com is routed through.
+"""
+
+# Python Library Imports
+import logging
+import requests
+import threading
+import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+try:
+    import charset_normalizer
+except ImportError:
+    charset_normalizer = None
+
+
+###
+# Class Definition
+###
+
+
+class HttpResponse(object):
+    """
+        HttpResponse Class. Lightweight container for the parts of a response the
+        Indeed class consumes, so transports do not need to hand back a live
+        requests.Response
+    """
+
+    __slots__ = (
+        "url",
+        "status_code",
+        "headers",
+        "text",
+        "compressed_bytes",
+        "decompressed_bytes",
+    )
+
+    def __init__(
+        self,
+        url,
+        status_code,
+        headers=None,
+        text=None,
+        compressed_bytes=None,
+        decompressed_bytes=None,
+    ):
+        """
+        Purpose:
+            Initilize the HttpResponse Class.
+        Args:
+            url (String): URL that was requested
+            status_code (Int): HTTP status code of the response
+            headers (Dict): Response headers
+            text (String): Decoded body of the response (None if the body was
+                too large to read)
+            compressed_bytes (Int): Bytes of the body sent over the wire
+            decompressed_bytes (Int): Bytes of the body once the content encoding
+                was decoded
+        Returns:
+            N/A
+        """
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.text = text
+        self.compressed_bytes = compressed_bytes
+        self.decompressed_bytes = decompressed_bytes
+
+
+class HttpTransport(object):
+    """
+        HttpTransport Class. Wraps a requests.Session with a pooled adapter so
+        connections to Indeed.com are kept alive and reused across requests. Only
+        content encodings urllib3 can decode are accepted (brotli only when a
+        brotli package is installed) and bodies are streamed with a size limit
+    """
+
+    ###
+    # Properties
+    ###
+
+    retry_status_codes = (500, 502, 504)
+    throttle_status_codes = (429, 503)
+    decodable_encodings = [
+        encoding.strip() for encoding in ACCEPT_ENCODING.split(",")
+    ] + ["identity"]
+    response_chunk_bytes = 64 * 1024
+
+    ###
+    # Class Lifecycle Methods
+    ###
+
+    def __init__(
+        self,
+        pool_connections=10,
+        pool_maxsize=10,
+        max_retries=3,
+        backoff_factor=0.5,
+        timeout=30,
+        rate_limiter=None,
+        max_response_bytes=10 * 1024 * 1024,
+    ):
+        """
+        Purpose:
+            Initilize the HttpTransport Class.
+        Args:
+            pool_connections (Int): Number of per-host connection pools to cache
+            pool_maxsize (Int): Max number of connections kept open per host
+            max_retries (Int): Number of times to retry a request that failed to
+                connect, failed to read, or got a retryable server error
+            backoff_factor (Float): Backoff factor between retries (seconds)
+            timeout (Int): Seconds to wait for a response before giving up
+            rate_limiter (RateLimiter Obj): Paces every request and backs off
+                throttled (429/503) requests. Requests are not paced if not provided
+            max_response_bytes (Int): Max decompressed size of a response body.
+                Reading stops and the body is dropped once it is exceeded
+        Returns:
+            N/A
+        """
+        logging.info(
+            f"Initializing HttpTransport (pool_connections={pool_connections}, "
+            f"pool_maxsize={pool_maxsize}, max_retries={max_retries})"
+        )
+
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.max_response_bytes = max_response_bytes
+
+        self.transfer_stats_lock = threading.Lock()
+        self.transfer_stats = {
+            "responses": 0,
+            "compressed_bytes": 0,
+            "decompressed_bytes": 0,
+            "oversized_responses": 0,
+        }
+
+        retries = Retry(
+            total=max_retries,
+            connect=max_retries,
+            read=max_retries,
+            status=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=self.retry_status_codes,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=retries,
+            pool_block=True,
+        )
+
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def close(self):
+        """
+        Purpose:
+            Close the session and every pooled connection it holds
+        Args:
+            N/A
+        Returns:
+            N/A
+        """
+        self.session.close()
+
+    ###
+    # Request Functions
+    ###
+
+    def get(self, url, headers=None):
+        """
+        Purpose:
+            GET a URL through the pooled session. With a rate limiter, the request
+            waits for its turn and throttled responses are retried (honoring
+            Retry-After) while the retry budget allows
+        Args:
+            url (String): URL to request
+            headers (Dict): Headers to send with the request
+        Returns:
+            response (HttpResponse Obj): Status, headers, and body of the response
+        """
+
+        headers = dict(headers or {})
+        for header in list(headers):
+            if header.lower() == "accept-encoding":
+                headers[header] = self.negotiate_accept_encoding(headers[header])
+
+        attempt = 0
+        while True:
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+
+            response = self.session.get(
+                url, headers=headers, timeout=self.timeout, stream=True
+            )
+
+            if not self.rate_limiter:
+                break
+            elif response.status_code not in self.throttle_status_codes:
+                self.rate_limiter.record_success()
+                break
+
+            # Release The Connection Of The Throttled Response Before Retrying
+            response.close()
+
+            retry_after = self.rate_limiter.parse_retry_after(
+                response.headers.get("Retry-After")
+            )
+            self.rate_limiter.record_throttle(retry_after)
+
+            if attempt >= self.rate_limiter.max_retries:
+                logging.error(f"Giving Up On Throttled URL After {attempt} Retries")
+                break
+            elif not self.rate_limiter.spend_retry():
+                logging.error("Retry Budget Spent, Giving Up On Throttled URL")
+                break
+
+            backoff_seconds =\
+                self.rate_limiter.get_backoff_seconds(attempt, retry_after)
+            logging.warning(
+                f"Got {response.status_code} From {url}, Retrying In "
+                f"{backoff_seconds:.1f} Seconds"
+            )
+            time.sleep(backoff_seconds)
+            attempt += 1
+
+        return self.read_response(url, response)
+
+    def read_response(self, url, response):
+        """
+        Purpose:
+            Stream the body of a response, decoding its content encoding, and stop
+            reading if it grows past max_response_bytes
+        Args:
+            url (String): URL that was requested
+            response (requests.Response Obj): Response opened with stream=True
+        Returns:
+            response (HttpResponse Obj): Status, headers, and body of the response
+        """
+
+        body_chunks = []
+        decompressed_bytes = 0
+        is_oversized = False
+        try:
+            for body_chunk in response.iter_content(self.response_chunk_bytes):
+                decompressed_bytes += len(body_chunk)
+                if decompressed_bytes > self.max_response_bytes:
+                    is_oversized = True
+                    break
+                body_chunks.append(body_chunk)
+            compressed_bytes = response.raw.tell()
+        finally:
+            response.close()
+
+        with self.transfer_stats_lock:
+            self.transfer_stats["responses"] += 1
+            self.transfer_stats["compressed_bytes"] += compressed_bytes
+            self.transfer_stats["decompressed_bytes"] += decompressed_bytes
+            if is_oversized:
+                self.transfer_stats["oversized_responses"] += 1
+
+        if is_oversized:
+            logging.error(
+                f"Response From {url} Exceeded {self.max_response_bytes} Bytes, "
+                "Dropping It"
+            )
+            text = None
+        else:
+            body = b"".join(body_chunks)
+            text = body.decode(self.get_body_encoding(response, body), errors="replace")
+
+        return HttpResponse(
+            url,
+            response.status_code,
+            headers=dict(response.headers),
+            text=text,
+            compressed_bytes=compressed_bytes,
+            decompressed_bytes=decompressed_bytes,
+        )
+
+    @staticmethod
+    def get_body_encoding(response, body):
+        """
+        Purpose:
+            Get the character encoding of a streamed body. The body has already
+            been consumed, so the encoding is detected from the body bytes instead
+            of response.apparent_encoding (which would read the body again)
+        Args:
+            response (requests.Response Obj): Response the body was read from
+            body (Bytes): Body of the response
+        Returns:
+            encoding (String): Encoding from the Content-Type header, else the
+                detected encoding, else utf-8
+        """
+
+        if response.encoding:
+            return response.encoding
+
+        if charset_normalizer and body:
+            best_match = charset_normalizer.from_bytes(body).best()
+            if best_match:
+                return best_match.encoding
+
+        return "utf-8"
+
+    ###
+    # Content Encoding Functions
+    ###
+
+    def negotiate_accept_encoding(self, accept_encoding):
+        """
+        Purpose:
+            Drop the encodings this transport can not decode from an
+            Accept-Encoding header (e.g. sdch, or br without a brotli package)
+        Args:
+            accept_encoding (String): Requested Accept-Encoding header
+        Returns:
+            accept_encoding (String): Accept-Encoding header limited to decodable
+                encodings ("identity" if none are left)
+        """
+
+        accepted_encodings = [
+            encoding.strip()
+            for encoding in accept_encoding.split(",")
+            if encoding.split(";")[0].strip().lower() in self.decodable_encodings
+        ]
+
+        return ", ".join(accepted_encodings) or "identity"
+
+    def get_transfer_stats(self):
+        """
+        Purpose:
+            Get how many bytes were transferred (compressed) and how many they
+            decoded to
+        Args:
+            N/A
+        Returns:
+            transfer_stats (Dict): responses, compressed_bytes, decompressed_bytes,
+                and oversized_responses of the transport
+        """
+
+        with self.transfer_stats_lock:
+            return dict(self.transfer_stats)
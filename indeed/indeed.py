@@ -6,13 +6,30 @@
 """
 
 # Python Library Imports
+import functools
 import json
 import logging
+import multiprocessing
 import re
-import requests
-from bs4 import BeautifulSoup
+import threading
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from datetime import datetime, timedelta
 
+# Local Library Imports
+from . import fast_html_extractor
+from .http_transport import HttpResponse, HttpTransport
+from .job_details_registry import JobDetailsRegistry
+from .job_listing import JobListing
+from .keyword_classifier import KeywordClassifier
+from .link_version_tracker import LinkVersionTracker
+from .response_cache import ResponseCache
+
 
 ###
 # Class Definition
@@ -31,7 +48,7 @@ class Indeed(object):
 
     expected_headers = {
         "accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-        "accept-encoding": "gzip, deflate, sdch, br",
+        "accept-encoding": "gzip, deflate, br",
         "accept-language": "en-US,en;q=0.9",
         "cache-control": "no-cache",
         "pragma": "no-cache",
@@ -39,23 +56,457 @@ class Indeed(object):
         "upgrade-insecure-requests": "1",
         "user-agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_14_3) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/73.0.3683.86 Safari/537.36",
     }
+    base_url = "https://www.indeed.com"
     jobs_per_listing_page = 18
+    link_versions =\
+        ["v1", "v2", "v3", "v4", "v5", "v6", "v7", "v8", "v9", "v10", "v11"]
+    link_version_tracker = LinkVersionTracker(link_versions)
+    max_details_in_flight = 8
+    job_details_hedge_width = 1
+    job_listing_filters = []
+    listing_pages_to_prefetch = 2
+    transport = None
+    transport_lock = threading.RLock()
+    response_cache = None
+    job_details_registry = None
+    parser_backends = ("html.parser", "lxml", "strainer")
+    parser_backend = "html.parser"
+    use_fast_path_extraction = True
+    parse_executor = None
+    parse_slots = None
+    keyword_taxonomy_file = None
+    keyword_classifier = None
 
     ###
     # Class Lifecycle Methods
     ###
 
-    def __init__(self):
+    def __init__(
+        self,
+        pool_connections=10,
+        pool_maxsize=10,
+        max_retries=3,
+        backoff_factor=0.5,
+    ):
         """
         Purpose:
-            Initilize the Indeed Class.
+            Initilize the Indeed Class. Sets up the pooled HTTP transport that
+            every fetch to Indeed.com is routed through
         Args:
-            N/A
+            pool_connections (Int): Number of per-host connection pools to cache
+            pool_maxsize (Int): Max number of connections kept open per host
+            max_retries (Int): Number of times to retry a failed request
+            backoff_factor (Float): Backoff factor between retries (seconds)
         Returns:
             N/A
         """
         logging.info("Initializing Indeed")
 
+        Indeed.configure_transport(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=max_retries,
+            backoff_factor=backoff_factor,
+        )
+
+    ###
+    # Transport Functions
+    ###
+
+    @staticmethod
+    def configure_transport(**transport_settings):
+        """
+        Purpose:
+            Replace the transport shared by every Indeed fetch with a pooled
+            HttpTransport
+        Args:
+            transport_settings (Kwargs): Settings passed to HttpTransport
+        Returns:
+            transport (HttpTransport Obj): The newly configured transport
+        """
+
+        return Indeed.set_transport(HttpTransport(**transport_settings))
+
+    @staticmethod
+    def set_transport(transport):
+        """
+        Purpose:
+            Replace the transport shared by every Indeed fetch (e.g. with a
+            ReplayTransport or RecordingTransport). Closes the existing transport
+            (and its pooled connections) if one is open
+        Args:
+            transport (Transport Obj): Object with get(url, headers=None) and close()
+        Returns:
+            transport (Transport Obj): The new transport
+        """
+
+        with Indeed.transport_lock:
+            if Indeed.transport:
+                Indeed.transport.close()
+
+            Indeed.transport = transport
+
+            return Indeed.transport
+
+    @staticmethod
+    def close_transport():
+        """
+        Purpose:
+            Close the transport shared by every Indeed fetch (a new one is created
+            on the next fetch)
+        Args:
+            N/A
+        Returns:
+            N/A
+        """
+
+        with Indeed.transport_lock:
+            if Indeed.transport:
+                Indeed.transport.close()
+
+            Indeed.transport = None
+
+    @staticmethod
+    def get_transport():
+        """
+        Purpose:
+            Get the transport shared by every Indeed fetch, creating one with the
+            default settings if none has been configured
+        Args:
+            N/A
+        Returns:
+            transport (HttpTransport Obj): The shared transport
+        """
+
+        # Checked And Created Under One Lock (Reentrant, As configure_transport
+        # Takes It Again) So Concurrent Fetches Never Build Two Transports
+        with Indeed.transport_lock:
+            if not Indeed.transport:
+                Indeed.configure_transport()
+
+            return Indeed.transport
+
+    @staticmethod
+    def configure_response_cache(cache_dir=None, **cache_settings):
+        """
+        Purpose:
+            Replace the on-disk cache of responses shared by every Indeed fetch
+        Args:
+            cache_dir (String): Directory to store the cached responses in. The
+                cache is disabled if not provided
+            cache_settings (Kwargs): Settings passed to ResponseCache (TTLs and
+                size cap)
+        Returns:
+            response_cache (ResponseCache Obj): The new cache (None if disabled)
+        """
+
+        if cache_dir:
+            Indeed.response_cache = ResponseCache(cache_dir, **cache_settings)
+        else:
+            Indeed.response_cache = None
+
+        return Indeed.response_cache
+
+    @staticmethod
+    def request_url(url, use_cache=True):
+        """
+        Purpose:
+            GET a URL from Indeed.com through the shared transport, answering from
+            the response cache when the URL has been fetched recently
+        Args:
+            url (String): URL to request
+            use_cache (Boolean): Whether a cached response can be returned. If
+                False, the URL is always fetched (and the cached response
+                replaced), e.g. when retrying a page for different results
+        Returns:
+            response (HttpResponse Obj): Status, headers, and body of the response
+        """
+
+        if Indeed.response_cache and use_cache:
+            cached_text = Indeed.response_cache.get(url)
+            if cached_text is not None:
+                logging.debug(f"Using Cached Response for Indeed URL: {url}")
+                return HttpResponse(url, 200, text=cached_text)
+
+        response = Indeed.get_transport().get(url, headers=Indeed.expected_headers)
+
+        if (
+            Indeed.response_cache
+            and response.status_code == 200
+            and response.text is not None
+        ):
+            Indeed.response_cache.put(url, response.text)
+
+        return response
+
+    @staticmethod
+    def configure_job_details_registry(enabled=True):
+        """
+        Purpose:
+            Start a new run-scoped registry of job details, so jobs seen on earlier
+            pages or under earlier searches are not fetched again
+        Args:
+            enabled (Boolean): Whether to dedup job details fetches at all
+        Returns:
+            job_details_registry (JobDetailsRegistry Obj): The new registry (None if
+                disabled)
+        """
+
+        if enabled:
+            Indeed.job_details_registry = JobDetailsRegistry()
+        else:
+            Indeed.job_details_registry = None
+
+        return Indeed.job_details_registry
+
+    @staticmethod
+    def preload_job_details(job_listings):
+        """
+        Purpose:
+            Add the details of jobs fetched during earlier runs (e.g. from the job
+            store) to the job details registry, so only jobs not seen before are
+            fetched
+        Args:
+            job_listings (Iterable of JobListing Objs): Jobs with their details
+        Returns:
+            preloaded_jobs (Int): Number of jobs whose details were added (0 if job
+                details dedup is disabled)
+        """
+
+        if not Indeed.job_details_registry:
+            logging.warning("Job Details Dedup Disabled, Unable To Preload Details")
+            return 0
+
+        job_details_by_job_id = {
+            job_listing["job_id"]: {
+                field: job_listing[field] for field in JobListing.job_details_fields
+            }
+            for job_listing in job_listings
+        }
+        Indeed.job_details_registry.preload(job_details_by_job_id)
+
+        return len(job_details_by_job_id)
+
+    ###
+    # Link Version Functions
+    ###
+
+    @staticmethod
+    def configure_link_version_tracker(stats_file=None):
+        """
+        Purpose:
+            Replace the tracker that learns which job details link versions work,
+            loading its stats from a file so they carry over between runs
+        Args:
+            stats_file (String): JSON file to load and save the stats with
+        Returns:
+            link_version_tracker (LinkVersionTracker Obj): The new tracker
+        """
+
+        Indeed.link_version_tracker =\
+            LinkVersionTracker(Indeed.link_versions, stats_file=stats_file)
+
+        return Indeed.link_version_tracker
+
+    @staticmethod
+    def configure_parser_backend(parser_backend="html.parser"):
+        """
+        Purpose:
+            Choose how the HTML from Indeed.com is parsed. Every backend produces the
+            same job listings and job details
+                html.parser: Python's built in parser (slowest, no dependencies)
+                lxml: lxml's C parser (requires lxml)
+                strainer: Only the job cards of a listings page are built into the
+                    tree (uses lxml if installed, html.parser otherwise)
+        Args:
+            parser_backend (String): One of Indeed.parser_backends
+        Returns:
+            N/A
+        """
+
+        if parser_backend not in Indeed.parser_backends:
+            raise ValueError(
+                f"Invalid Parser Backend {parser_backend}, Expected One Of "
+                f"{Indeed.parser_backends}"
+            )
+
+        if parser_backend == "lxml" and not Indeed.is_lxml_installed():
+            logging.warning("lxml Is Not Installed, Parsing With html.parser")
+            parser_backend = "html.parser"
+
+        logging.info(f"Parsing Indeed HTML With {parser_backend}")
+        Indeed.parser_backend = parser_backend
+
+    @staticmethod
+    def configure_keyword_classifier(taxonomy_file=None):
+        """
+        Purpose:
+            Set the taxonomy job descriptions are classified with (degrees,
+            certifications, skills, security clearance, and work arrangement)
+        Args:
+            taxonomy_file (String): JSON taxonomy file (see KeywordClassifier).
+                Uses DEFAULT_KEYWORD_TAXONOMY if not provided
+        Returns:
+            N/A
+        """
+
+        if taxonomy_file:
+            Indeed.keyword_classifier = KeywordClassifier.from_file(taxonomy_file)
+        else:
+            Indeed.keyword_classifier = KeywordClassifier()
+        Indeed.keyword_taxonomy_file = taxonomy_file
+
+    @staticmethod
+    def get_keyword_classifier():
+        """
+        Purpose:
+            Get the classifier job descriptions are tagged with, creating one with
+            the default taxonomy if none has been configured
+        Args:
+            N/A
+        Returns:
+            keyword_classifier (KeywordClassifier Obj): The shared classifier
+        """
+
+        if not Indeed.keyword_classifier:
+            Indeed.configure_keyword_classifier(Indeed.keyword_taxonomy_file)
+
+        return Indeed.keyword_classifier
+
+    @staticmethod
+    def configure_parse_pool(parse_workers=0, max_parses_in_flight=None):
+        """
+        Purpose:
+            Parse HTML in a pool of processes instead of the threads that fetched
+            it, so parsing is not limited to one core by the GIL. Fetching threads
+            hand their HTML to the pool and wait for the result; once
+            max_parses_in_flight parses are queued, fetching threads wait for a
+            slot before handing over more
+        Args:
+            parse_workers (Int): Number of parsing processes. HTML is parsed in the
+                fetching threads if 0
+            max_parses_in_flight (Int): Max number of pages handed to the pool and
+                not yet parsed. Defaults to twice the number of parse_workers
+        Returns:
+            N/A
+        """
+
+        Indeed.close_parse_pool()
+        if not parse_workers:
+            return
+
+        if not max_parses_in_flight:
+            max_parses_in_flight = parse_workers * 2
+
+        logging.info(
+            f"Parsing Indeed HTML In {parse_workers} Processes "
+            f"({max_parses_in_flight} Pages In Flight)"
+        )
+        # Spawned, Not Forked, As Forking Copies The Locks Held By Fetching
+        # Threads (e.g. In Logging) Into Workers Started After Fetching Begins
+        Indeed.parse_slots = threading.BoundedSemaphore(max_parses_in_flight)
+        Indeed.parse_executor = ProcessPoolExecutor(
+            max_workers=parse_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    @staticmethod
+    def close_parse_pool():
+        """
+        Purpose:
+            Shut down the parsing processes (HTML is parsed in the fetching threads
+            afterwards)
+        Args:
+            N/A
+        Returns:
+            N/A
+        """
+
+        parse_executor = Indeed.parse_executor
+        Indeed.parse_executor = None
+        Indeed.parse_slots = None
+
+        if parse_executor:
+            parse_executor.shutdown(wait=True)
+
+    @staticmethod
+    def run_parse(parse_function_name, raw_html):
+        """
+        Purpose:
+            Run one of the Indeed HTML parsing functions, in the parse pool if one is
+            configured (see configure_parse_pool)
+        Args:
+            parse_function_name (String): Name of the Indeed parsing function
+                (e.g. parse_job_details_html)
+            raw_html (String): HTML to parse
+        Returns:
+            parsed_html (Object): What the parsing function returns
+        """
+
+        parse_executor = Indeed.parse_executor
+        parse_slots = Indeed.parse_slots
+        if not parse_executor:
+            return getattr(Indeed, parse_function_name)(raw_html)
+
+        parser_settings = {
+            "parser_backend": Indeed.parser_backend,
+            "use_fast_path_extraction": Indeed.use_fast_path_extraction,
+            "keyword_taxonomy_file": Indeed.keyword_taxonomy_file,
+        }
+        with parse_slots:
+            return parse_executor.submit(
+                Indeed.parse_html_in_worker,
+                parse_function_name,
+                raw_html,
+                parser_settings,
+            ).result()
+
+    @staticmethod
+    def parse_html_in_worker(parse_function_name, raw_html, parser_settings):
+        """
+        Purpose:
+            Run one of the Indeed HTML parsing functions in a parsing process, with
+            the parser settings of the process that handed over the HTML
+        Args:
+            parse_function_name (String): Name of the Indeed parsing function
+            raw_html (String): HTML to parse
+            parser_settings (Dict): parser_backend, use_fast_path_extraction, and
+                keyword_taxonomy_file of the process that handed over the HTML
+        Returns:
+            parsed_html (Object): What the parsing function returns
+        """
+
+        Indeed.parser_backend = parser_settings["parser_backend"]
+        Indeed.use_fast_path_extraction = parser_settings["use_fast_path_extraction"]
+        if (
+            not Indeed.keyword_classifier
+            or Indeed.keyword_taxonomy_file != parser_settings["keyword_taxonomy_file"]
+        ):
+            Indeed.configure_keyword_classifier(
+                parser_settings["keyword_taxonomy_file"]
+            )
+
+        return getattr(Indeed, parse_function_name)(raw_html)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def is_lxml_installed():
+        """
+        Purpose:
+            Check if lxml is available to Beautiful Soup
+        Args:
+            N/A
+        Returns:
+            lxml_installed (Boolean): Whether the lxml parser can be used
+        """
+
+        try:
+            BeautifulSoup("", "lxml")
+        except FeatureNotFound:
+            return False
+
+        return True
+
     #####
     ## Get Functions
     #####
@@ -69,116 +520,547 @@ class Indeed(object):
         salary_min="$40,000",
         pagination=0,
         max_days_since_posting=7,
+        max_details_in_flight=None,
+        job_listing_filters=None,
+    ):
+        """
+        Purpose:
+            Get Job Listings by keyword, zip_code, radius, job_type, and salary
+        Args:
+            keywords (String): Keywords to Search
+            zip_code (String): Zip code to center the job search on
+            radius (String): Radius (from the zip code center) that jobs need to be
+                in to be considered
+            job_type (String): type of job. Enum of the following:
+                [fulltime, parttime, contractor]
+            salary_min (String): Minimum salary for jobs to be returned (best guess if
+                none is provided)
+            pagination (String): The job to start on. If 0, page 1 of results. Page 2
+                starts at 10. This gets different results depending on usage
+            max_days_since_posting (Int): Max Days since posting that a job needs to
+                be returned
+            max_details_in_flight (Int): Max number of job details to fetch at once.
+                Defaults to Indeed.max_details_in_flight
+            job_listing_filters (List of Functions): Predicates each job listing
+                card must pass before its details are fetched. Defaults to
+                Indeed.job_listing_filters
+        Returns:
+            job_listings (List of Dicts): A list of Dicts. Key is the job ID and the
+                dict holds all of the job listing details.
+        """
+        logging.info(f"Searching for jobs with keywords: {keywords}")
+
+        raw_job_listing_html = Indeed.request_job_listings_from_indeed(
+            keywords,
+            zip_code,
+            radius=radius,
+            job_type=job_type,
+            salary_min=salary_min,
+            pagination=pagination,
+        )
+
+        return Indeed.get_job_listings_from_html(
+            raw_job_listing_html,
+            job_type=job_type,
+            max_days_since_posting=max_days_since_posting,
+            max_details_in_flight=max_details_in_flight,
+            job_listing_filters=job_listing_filters,
+        )
+
+    @staticmethod
+    def get_job_listings_from_html(
+        raw_job_listing_html,
+        job_type="fulltime",
+        max_days_since_posting=7,
+        max_details_in_flight=None,
+        job_listing_filters=None,
+    ):
+        """
+        Purpose:
+            Get Job Listings from the HTML of a listings page that has already
+            been fetched (e.g. prefetched while an earlier page was processed)
+        Args:
+            raw_job_listing_html (String): Raw HTML results from Indeed.com of the
+                job listings (None if the fetch failed)
+            job_type (String): type of job. Enum of the following:
+                [fulltime, parttime, contractor]
+            max_days_since_posting (Int): Max Days since posting that a job needs to
+                be returned
+            max_details_in_flight (Int): Max number of job details to fetch at once.
+                Defaults to Indeed.max_details_in_flight
+            job_listing_filters (List of Functions): Predicates each job listing
+                card must pass before its details are fetched. Defaults to
+                Indeed.job_listing_filters
+        Returns:
+            job_listings (List of Dicts): A list of Dicts. Key is the job ID and the
+                dict holds all of the job listing details.
+        """
+
+        # Parsing The Job HTML
+        if raw_job_listing_html:
+            base_job_listings =\
+                Indeed.run_parse("parse_job_listings_html", raw_job_listing_html)
+        else:
+            logging.error(f"Failed to Fetch Job Listings from Indeed URL, exiting")
+            base_job_listings = []
+
+        # Add Job Type As A Field
+        for base_job_listing in base_job_listings:
+            base_job_listing["job_type"] = Indeed.get_job_type_name(job_type)
+
+        # Skip Jobs That Would Be Discarded Before Fetching Their Details
+        base_job_listings = Indeed.filter_job_listings_before_details(
+            base_job_listings,
+            max_days_since_posting,
+            job_listing_filters=job_listing_filters,
+        )
+
+        # Get More Information For Each Job Listing (results come back in the
+        # same order as the listings regardless of which fetch finishes first)
+        if not max_details_in_flight:
+            max_details_in_flight = Indeed.max_details_in_flight
+        with ThreadPoolExecutor(max_workers=max_details_in_flight) as executor:
+            all_job_details = executor.map(
+                lambda base_job_listing: Indeed.get_job_details(
+                    base_job_listing["company"],
+                    base_job_listing["job_title"],
+                    base_job_listing["job_id"],
+                ),
+                base_job_listings,
+            )
+            for base_job_listing, job_details in zip(
+                base_job_listings, all_job_details
+            ):
+                for job_detail, job_detail_value in job_details.items():
+                    base_job_listing[job_detail] = job_detail_value
+
+        return Indeed.filter_job_listings_by_posting_date(
+            base_job_listings, max_days_since_posting
+        )
+
+    @staticmethod
+    def iter_job_listings(
+        keywords,
+        zip_code,
+        radius=15,
+        job_type="fulltime",
+        salary_min="$40,000",
+        pagination=0,
+        max_days_since_posting=7,
+        max_details_in_flight=None,
+        job_listing_filters=None,
+        max_pages_without_new_jobs=5,
+        ordered=False,
+    ):
+        """
+        Purpose:
+            Stream Job Listings by keyword, zip_code, radius, job_type, and salary.
+            Pages through the results (prefetching Indeed.listing_pages_to_prefetch
+            pages ahead) and yields each job as soon as its details are fetched.
+            A page that yields no new job is fetched again (past the response
+            cache, as Indeed returns different results each time) instead of
+            moving on to the next page. Nothing new is fetched while the consumer
+            is not pulling, and closing the generator (e.g. break) cancels the
+            outstanding fetches
+        Args:
+            keywords (String): Keywords to Search
+            zip_code (String): Zip code to center the job search on
+            radius (String): Radius (from the zip code center) that jobs need to be
+                in to be considered
+            job_type (String): type of job. Enum of the following:
+                [fulltime, parttime, contractor]
+            salary_min (String): Minimum salary for jobs to be returned (best guess if
+                none is provided)
+            pagination (String): The job to start on. If 0, page 1 of results
+            max_days_since_posting (Int): Max Days since posting that a job needs to
+                be returned
+            max_details_in_flight (Int): Max number of job details to fetch at once.
+                Defaults to Indeed.max_details_in_flight
+            job_listing_filters (List of Functions): Predicates each job listing
+                card must pass before its details are fetched. Defaults to
+                Indeed.job_listing_filters
+            max_pages_without_new_jobs (Int): Stop after this many fetches of a
+                page in a row yield no job that was not already yielded
+            ordered (Boolean): Yield the jobs of a page in the order they are
+                listed instead of the order their details finish fetching
+        Returns:
+            job_listings (Generator of JobListing Objs): Each job with all of the
+                job listing details. A job is yielded once even if listed on
+                several pages
+        """
+        logging.info(f"Streaming jobs with keywords: {keywords}")
+
+        # Listing Pages Are Fetched Ahead While Details For The Current Page Are
+        # Fetched, Keyed By Pagination
+        listing_pages_to_prefetch = Indeed.listing_pages_to_prefetch
+        prefetch_executor =\
+            ThreadPoolExecutor(max_workers=listing_pages_to_prefetch + 1)
+        prefetched_listing_pages = {}
+
+        yielded_job_ids = set()
+        pages_without_new_jobs = 0
+        try:
+            while pages_without_new_jobs < max_pages_without_new_jobs:
+                for page_idx in range(listing_pages_to_prefetch + 1):
+                    prefetch_pagination =\
+                        pagination + page_idx * Indeed.jobs_per_listing_page
+                    if prefetch_pagination in prefetched_listing_pages:
+                        continue
+                    prefetched_listing_pages[prefetch_pagination] =\
+                        prefetch_executor.submit(
+                            Indeed.request_job_listings_from_indeed,
+                            keywords,
+                            zip_code,
+                            radius=radius,
+                            job_type=job_type,
+                            salary_min=salary_min,
+                            pagination=prefetch_pagination,
+                            use_cache=page_idx > 0 or not pages_without_new_jobs,
+                        )
+
+                raw_job_listing_html =\
+                    prefetched_listing_pages.pop(pagination).result()
+
+                new_job_found = False
+                for job_listing in Indeed.iter_job_listings_from_html(
+                    raw_job_listing_html,
+                    job_type=job_type,
+                    max_days_since_posting=max_days_since_posting,
+                    max_details_in_flight=max_details_in_flight,
+                    job_listing_filters=job_listing_filters,
+                    ordered=ordered,
+                ):
+                    if job_listing["job_id"] in yielded_job_ids:
+                        continue
+                    yielded_job_ids.add(job_listing["job_id"])
+                    new_job_found = True
+                    yield job_listing
+
+                # Only Move On Once A Page Has Something New, Otherwise Retry It
+                if new_job_found:
+                    pages_without_new_jobs = 0
+                    pagination += Indeed.jobs_per_listing_page
+                else:
+                    pages_without_new_jobs += 1
+                    logging.info(
+                        f"No Unqiue Jobs Found On Page (This is try "
+                        f"#{pages_without_new_jobs} in a row)"
+                    )
+        finally:
+            # Consumer Is Done (Or Search Exhausted), Drop Outstanding Prefetches
+            for prefetched_listing_page in prefetched_listing_pages.values():
+                prefetched_listing_page.cancel()
+            prefetch_executor.shutdown(wait=False)
+
+    @staticmethod
+    def iter_job_listings_from_html(
+        raw_job_listing_html,
+        job_type="fulltime",
+        max_days_since_posting=7,
+        max_details_in_flight=None,
+        job_listing_filters=None,
+        ordered=False,
     ):
         """
         Purpose:
-            Get Job Listings by keyword, zip_code, radius, job_type, and salary
+            Stream the Job Listings of a listings page that has already been
+            fetched. At most max_details_in_flight job details are fetched ahead
+            of the consumer
+        Args:
+            raw_job_listing_html (String): Raw HTML results from Indeed.com of the
+                job listings (None if the fetch failed)
+            job_type (String): type of job. Enum of the following:
+                [fulltime, parttime, contractor]
+            max_days_since_posting (Int): Max Days since posting that a job needs to
+                be returned
+            max_details_in_flight (Int): Max number of job details to fetch at once.
+                Defaults to Indeed.max_details_in_flight
+            job_listing_filters (List of Functions): Predicates each job listing
+                card must pass before its details are fetched. Defaults to
+                Indeed.job_listing_filters
+            ordered (Boolean): Yield the jobs in the order they are listed instead
+                of the order their details finish fetching
+        Returns:
+            job_listings (Generator of JobListing Objs): Each job posted within
+                the window, with all of the job listing details
+        """
+
+        # Parsing The Job HTML
+        if raw_job_listing_html:
+            base_job_listings =\
+                Indeed.run_parse("parse_job_listings_html", raw_job_listing_html)
+        else:
+            logging.error(f"Failed to Fetch Job Listings from Indeed URL, exiting")
+            base_job_listings = []
+
+        # Add Job Type As A Field
+        for base_job_listing in base_job_listings:
+            base_job_listing["job_type"] = Indeed.get_job_type_name(job_type)
+
+        # Skip Jobs That Would Be Discarded Before Fetching Their Details
+        base_job_listings = Indeed.filter_job_listings_before_details(
+            base_job_listings,
+            max_days_since_posting,
+            job_listing_filters=job_listing_filters,
+        )
+
+        # Keep At Most max_details_in_flight Fetches Running, Topping Up Only As
+        # The Consumer Takes Jobs
+        if not max_details_in_flight:
+            max_details_in_flight = Indeed.max_details_in_flight
+        executor = ThreadPoolExecutor(max_workers=max_details_in_flight)
+        base_job_listings = iter(base_job_listings)
+        job_details_fetches = []
+        try:
+            while True:
+                while len(job_details_fetches) < max_details_in_flight:
+                    base_job_listing = next(base_job_listings, None)
+                    if not base_job_listing:
+                        break
+                    job_details_fetch = executor.submit(
+                        Indeed.get_job_details,
+                        base_job_listing["company"],
+                        base_job_listing["job_title"],
+                        base_job_listing["job_id"],
+                    )
+                    job_details_fetches.append((base_job_listing, job_details_fetch))
+
+                if not job_details_fetches:
+                    break
+
+                if ordered:
+                    base_job_listing, job_details_fetch = job_details_fetches.pop(0)
+                else:
+                    done_fetches, _ = wait(
+                        [fetch for _, fetch in job_details_fetches],
+                        return_when=FIRST_COMPLETED,
+                    )
+                    fetch_idx = next(
+                        fetch_idx
+                        for fetch_idx, (_, fetch) in enumerate(job_details_fetches)
+                        if fetch in done_fetches
+                    )
+                    base_job_listing, job_details_fetch =\
+                        job_details_fetches.pop(fetch_idx)
+
+                for job_detail, job_detail_value in job_details_fetch.result().items():
+                    base_job_listing[job_detail] = job_detail_value
+
+                if Indeed.is_job_listing_within_posting_window(
+                    base_job_listing, max_days_since_posting
+                ):
+                    yield base_job_listing
+        finally:
+            for _, job_details_fetch in job_details_fetches:
+                job_details_fetch.cancel()
+            executor.shutdown(wait=False)
+
+    @staticmethod
+    def get_job_details(company, job_title, job_id):
+        """
+        Purpose:
+            Get Job Details. Jobs already seen this run (see
+            configure_job_details_registry) are not fetched again
+        Args:
+            company (String): Name of the company the job is with
+            job_title (String): The title of the position with the company
+            job_id (String): The unqiue job_id from Indeed
+        Returns:
+            job_details (Dict): Details of the job
+        """
+
+        if Indeed.job_details_registry:
+            return Indeed.job_details_registry.get_or_fetch(
+                job_id,
+                lambda: Indeed.fetch_job_details(company, job_title, job_id),
+            )
+
+        return Indeed.fetch_job_details(company, job_title, job_id)
+
+    @staticmethod
+    def fetch_job_details(company, job_title, job_id):
+        """
+        Purpose:
+            Fetch and parse Job Details from Indeed.com
+        Args:
+            company (String): Name of the company the job is with
+            job_title (String): The title of the position with the company
+            job_id (String): The unqiue job_id from Indeed
+        Returns:
+            job_details (Dict): Details of the job
+        """
+
+        job_details_url, raw_job_details_html =\
+            Indeed.request_job_details_from_indeed(company, job_title, job_id)
+
+        return Indeed.build_job_details(job_details_url, raw_job_details_html)
+
+    @staticmethod
+    def build_job_details(job_details_url, raw_job_details_html):
+        """
+        Purpose:
+            Build the Job Details for a job from the HTML fetched from its URL
+        Args:
+            job_details_url (String): URL the job details were fetched from (None
+                if no URL version returned the job)
+            raw_job_details_html (String): Raw HTML results from Indeed.com of the
+                job details (None if the fetch failed)
+        Returns:
+            job_details (Dict): Details of the job
+        """
+
+        job_details = {}
+
+        # Parsing The Job HTML
+        if raw_job_details_html:
+            job_details =\
+                Indeed.run_parse("parse_job_details_html", raw_job_details_html)
+        else:
+            logging.error(f"Failed to Fetch Job Details from Indeed URL, exiting")
+            job_details["job_description"] = None
+            job_details["job_apply_url"] = None
+            job_details["job_posting_timeframe"] = None
+            job_details["job_posting_datetime"] = None
+            job_details["raw_init_data"] = None
+            job_details["city"] = None
+            job_details["state"] = None
+            job_details["zip_code"] = None
+            job_details["college_degree"] = None
+            for keyword_category in KeywordClassifier.categories:
+                job_details[keyword_category] = None
+
+        # Adding in the URL for easier searching
+        job_details["job_details_url"] = job_details_url
+
+        return job_details
+
+    @staticmethod
+    def get_job_type_name(job_type):
+        """
+        Purpose:
+            Get the display name of a job type searched for
         Args:
-            keywords (String): Keywords to Search
-            zip_code (String): Zip code to center the job search on
-            radius (String): Radius (from the zip code center) that jobs need to be
-                in to be considered
             job_type (String): type of job. Enum of the following:
                 [fulltime, parttime, contractor]
-            salary_min (String): Minimum salary for jobs to be returned (best guess if
-                none is provided)
-            pagination (String): The job to start on. If 0, page 1 of results. Page 2
-                starts at 10. This gets different results depending on usage
         Returns:
-            job_listings (List of Dicts): A list of Dicts. Key is the job ID and the
-                dict holds all of the job listing details.
+            job_type_name (String): Display name of the job type
         """
-        logging.info(f"Searching for jobs with keywords: {keywords}")
-
-        job_listings = []
 
-        raw_job_listing_html = Indeed.request_job_listings_from_indeed(
-            keywords,
-            zip_code,
-            radius=radius,
-            job_type=job_type,
-            salary_min=salary_min,
-            pagination=pagination,
-        )
-
-        # Parsing The Job HTML
-        if raw_job_listing_html:
-            base_job_listings = Indeed.parse_job_listings_html(raw_job_listing_html)
+        if job_type == "fulltime":
+            return "Full Time"
+        elif job_type == "partime":
+            return "Part Time"
         else:
-            logging.error(f"Failed to Fetch Job Listings from Indeed URL, exiting")
+            return "Unknown"
 
-        # Get More Information For Each Job Listing
-        for base_job_listing in base_job_listings:
-
-            # Add Job Type As A Field
-            if job_type == "fulltime":
-                base_job_listing["job_type"] = "Full Time"
-            elif job_type == "partime":
-                base_job_listing["job_type"] = "Part Time"
-            else:
-                base_job_listing["job_type"] = "Unknown"
+    @staticmethod
+    def filter_job_listings_before_details(
+        job_listings, max_days_since_posting, job_listing_filters=None
+    ):
+        """
+        Purpose:
+            Drop job listings that can be ruled out from their listing card alone
+            (posted too long ago or failing a job listing filter), so their
+            details are never fetched
+        Args:
+            job_listings (List of Dicts): Job listings parsed from a listings page
+            max_days_since_posting (Int): Max Days since posting that a job needs to
+                be returned
+            job_listing_filters (List of Functions): Predicates each job listing
+                must pass. Defaults to Indeed.job_listing_filters
+        Returns:
+            job_listings (List of Dicts): Job listings worth fetching details for
+        """
 
-            # Get Job Details
-            job_details = Indeed.get_job_details(
-                base_job_listing["company"],
-                base_job_listing["job_title"],
-                base_job_listing["job_id"],
-            )
-            for job_detail, job_detail_value in job_details.items():
-                base_job_listing[job_detail] = job_detail_value
+        if job_listing_filters is None:
+            job_listing_filters = Indeed.job_listing_filters
 
-        # Check each listing to see if it should be added to the return list
         cutoff_posting_date = (
             datetime.now() -
             timedelta(days=max_days_since_posting) -
             timedelta(hours=1)
         )
-        for base_job_listing in base_job_listings:
-            if not base_job_listing["job_posting_datetime"]:
+
+        filtered_job_listings = []
+        for job_listing in job_listings:
+            # A Card Date That Can't Be Parsed (e.g. "Active 3 days ago") Is
+            # Unknown, So The Card Is Kept And Its Details Decide
+            try:
+                listing_posting_datetime = Indeed.parse_job_posting_datetime(
+                    job_listing.get("job_listing_posting_timeframe")
+                )
+            except Exception as err:
+                listing_posting_datetime = None
+
+            if (
+                listing_posting_datetime
+                and listing_posting_datetime < cutoff_posting_date
+            ):
+                logging.info(
+                    f"Skipping Details For Job {job_listing['job_id']}, Posted "
+                    f"{job_listing['job_listing_posting_timeframe']}"
+                )
                 continue
-            elif base_job_listing["job_posting_datetime"] < cutoff_posting_date:
+            elif not all(
+                job_listing_filter(job_listing)
+                for job_listing_filter in job_listing_filters
+            ):
+                logging.info(
+                    f"Skipping Details For Job {job_listing['job_id']}, Filtered Out"
+                )
                 continue
-            job_listings.append(base_job_listing)
+            filtered_job_listings.append(job_listing)
 
-        return sorted(job_listings, key = lambda i: i["company"])
+        return filtered_job_listings
 
     @staticmethod
-    def get_job_details(company, job_title, job_id):
+    def filter_job_listings_by_posting_date(job_listings, max_days_since_posting):
         """
         Purpose:
-            Get Job Details
+            Drop job listings without a posting date or that were posted too long
+            ago, and sort the rest by company
         Args:
-            company (String): ...
-            job_id (String): ...
-            job_req (String): ...
+            job_listings (List of Dicts): Job listings with their details
+            max_days_since_posting (Int): Max Days since posting that a job needs to
+                be returned
         Returns:
-            N/A
+            job_listings (List of Dicts): Job listings posted within the window
         """
 
-        job_details = {}
+        filtered_job_listings = []
 
-        job_details_url, raw_job_details_html =\
-            Indeed.request_job_details_from_indeed(company, job_title, job_id)\
+        # Check each listing to see if it should be added to the return list
+        for job_listing in job_listings:
+            if not Indeed.is_job_listing_within_posting_window(
+                job_listing, max_days_since_posting
+            ):
+                continue
+            filtered_job_listings.append(job_listing)
 
-        # Parsing The Job HTML
-        if raw_job_details_html:
-            job_details = Indeed.parse_job_details_html(raw_job_details_html)
-        else:
-            logging.error(f"Failed to Fetch Job Details from Indeed URL, exiting")
-            job_details["job_description"] = None
-            job_details["job_apply_url"] = None
-            job_details["job_posting_timeframe"] = None
-            job_details["job_posting_datetime"] = None
-            job_details["init_data"] = {}
-            job_details["city"] = None
-            job_details["state"] = None
-            job_details["zip_code"] = None
-            job_details["college_degree"] = None
+        return sorted(filtered_job_listings, key = lambda i: i["company"])
 
-        # Adding in the URL for easier searching
-        job_details["job_details_url"] = job_details_url
+    @staticmethod
+    def is_job_listing_within_posting_window(job_listing, max_days_since_posting):
+        """
+        Purpose:
+            Check if a job listing has a posting date within the window
+        Args:
+            job_listing (Dict): Job listing with its details
+            max_days_since_posting (Int): Max Days since posting that a job needs to
+                be returned
+        Returns:
+            within_posting_window (Boolean): Whether the job should be returned
+        """
 
-        return job_details
+        cutoff_posting_date = (
+            datetime.now() -
+            timedelta(days=max_days_since_posting) -
+            timedelta(hours=1)
+        )
+        if not job_listing["job_posting_datetime"]:
+            return False
+
+        return job_listing["job_posting_datetime"] >= cutoff_posting_date
 
     ###
     # Functions to Pull Raw Results From to Indeed.com
@@ -191,7 +1073,8 @@ class Indeed(object):
         radius=15,
         job_type="fulltime",
         salary_min="$40,000",
-        pagination=0
+        pagination=0,
+        use_cache=True,
     ):
         """
         Purpose:
@@ -209,82 +1092,226 @@ class Indeed(object):
                 none is provided)
             pagination (String): The job to start on. If 0, page 1 of results. Page 2
                 starts at 10. This gets different results depending on usage
+            use_cache (Boolean): Whether a cached response can be returned (see
+                request_url)
         Returns:
             raw_job_listing_html (String): Raw HTML results from Indeed.com of the job
                 listings matching the search criteria
         """
 
-        keywords = keywords.lower().replace(" ", "+")
-
-        job_listing_url = (
-            f"https://www.indeed.com/jobs?q={keywords}+{salary_min}&l="
-            f"{zip_code}&radius={radius}&jt={job_type}&start={pagination}"
+        job_listing_url = Indeed.generate_job_listings_url(
+            keywords,
+            zip_code,
+            radius=radius,
+            job_type=job_type,
+            salary_min=salary_min,
+            pagination=pagination,
         )
 
         logging.info(f"Fetching HTML from Indeed URL: {job_listing_url}")
-        job_listing_response = requests.get(
-            job_listing_url, headers=Indeed.expected_headers
-        )
+        job_listing_response =\
+            Indeed.request_url(job_listing_url, use_cache=use_cache)
+
+        return Indeed.get_html_from_response(job_listing_response)
+
+    @staticmethod
+    def request_job_details_from_indeed(
+        company, job_title, job_id, hedge_width=None
+    ):
+        """
+        Purpose:
+            Get Job Details HTML from Indeed.com by calling the website and
+            parsing the results into a dict. Link versions are probed in the order
+            the link version tracker has learned is most likely to work, either
+            one at a time or hedged (several versions in flight at once)
+        Args:
+            company (String): Name of the company the job is with
+            job_title (String): The title of the position with the company
+            job_id (String): The unqiue job_id from Indeed
+            hedge_width (Int): Number of link versions to keep in flight at once.
+                Defaults to Indeed.job_details_hedge_width (1 probes sequentially)
+        Returns:
+            job_details_url (String): URL that returned the job details
+            raw_job_details_html (String): Raw HTML results from Indeed.com of the job
+                details
+        """
+
+        if not hedge_width:
+            hedge_width = Indeed.job_details_hedge_width
 
-        if job_listing_response.status_code == 200:
-            raw_job_listing_html = job_listing_response.text
+        link_versions = Indeed.link_version_tracker.get_ordered_link_versions(job_id)
+
+        if hedge_width > 1:
+            link_version, raw_job_details_html =\
+                Indeed.request_job_details_hedged(
+                    company, job_title, job_id, link_versions, hedge_width
+                )
         else:
-            logging.error(
-                "Got Failure Response from Indeed.com: "
-                f"{job_listing_response.status_code}"
-            )
-            raw_job_listing_html = None
+            link_version, raw_job_details_html = None, None
+            for link_version in link_versions:
+                raw_job_details_html = Indeed.request_job_details_version(
+                    company, job_title, job_id, link_version
+                )
+                if raw_job_details_html:
+                    break
+
+        if not raw_job_details_html:
+            return None, None
+
+        Indeed.link_version_tracker.record_success(job_id, link_version)
+        job_details_url = Indeed.generate_job_details_url(
+            company, job_title, job_id, link_version=link_version
+        )
 
-        return raw_job_listing_html
+        return job_details_url, raw_job_details_html
 
     @staticmethod
-    def request_job_details_from_indeed(company, job_title, job_id):
+    def request_job_details_hedged(
+        company, job_title, job_id, link_versions, hedge_width
+    ):
         """
         Purpose:
-            Get Job Details HTML from Indeed.com by calling the website and
-            parsing the results into a dict.
+            Probe link versions of a job's details URL with hedge_width requests
+            in flight at once, taking the first version that returns the job.
+            Queued probes are cancelled once a version succeeds (requests already
+            in flight are left to finish and their results are discarded)
         Args:
             company (String): Name of the company the job is with
             job_title (String): The title of the position with the company
             job_id (String): The unqiue job_id from Indeed
+            link_versions (List of Strings): Link versions in the order to probe
+            hedge_width (Int): Number of link versions to keep in flight at once
         Returns:
+            link_version (String): Link version that returned the job (None if
+                no version did)
             raw_job_details_html (String): Raw HTML results from Indeed.com of the job
                 details
         """
 
-        link_versions =\
-            ["v1", "v2", "v3", "v4", "v5", "v6", "v7", "v8", "v9", "v10", "v11"]
-        job_details_url = None
-        raw_job_details_html = None
+        remaining_link_versions = list(link_versions)
+        pending_probes = {}
 
-        for link_version in link_versions:
+        executor = ThreadPoolExecutor(max_workers=hedge_width)
+        try:
+            while remaining_link_versions or pending_probes:
+
+                # Keep hedge_width Probes In Flight
+                while remaining_link_versions and len(pending_probes) < hedge_width:
+                    link_version = remaining_link_versions.pop(0)
+                    pending_probe = executor.submit(
+                        Indeed.request_job_details_version,
+                        company,
+                        job_title,
+                        job_id,
+                        link_version,
+                    )
+                    pending_probes[pending_probe] = link_version
+
+                finished_probes, _ = wait(pending_probes, return_when=FIRST_COMPLETED)
+                for finished_probe in finished_probes:
+                    link_version = pending_probes.pop(finished_probe)
+                    raw_job_details_html = finished_probe.result()
+                    if raw_job_details_html:
+                        return link_version, raw_job_details_html
+        finally:
+            for pending_probe in pending_probes:
+                pending_probe.cancel()
+            executor.shutdown(wait=False)
+
+        return None, None
 
-            # Getting URL From Version
-            job_details_url = Indeed.generate_job_details_url(
-                company, job_title, job_id, link_version=link_version
-            )
+    @staticmethod
+    def request_job_details_version(company, job_title, job_id, link_version):
+        """
+        Purpose:
+            Probe a single link version of a job's details URL
+        Args:
+            company (String): Name of the company the job is with
+            job_title (String): The title of the position with the company
+            job_id (String): The unqiue job_id from Indeed
+            link_version (String): Version of the job details URL to request
+        Returns:
+            raw_job_details_html (String): Raw HTML results from Indeed.com of the job
+                details, None if this version did not return the job
+        """
+
+        job_details_url = Indeed.generate_job_details_url(
+            company, job_title, job_id, link_version=link_version
+        )
+
+        logging.info(
+            f"Fetching HTML from Indeed URL ({link_version}): {job_details_url}"
+        )
+        job_details_response = Indeed.request_url(job_details_url)
+
+        return Indeed.get_html_from_response(
+            job_details_response, response_description=f"Details {link_version}"
+        )
+
+    @staticmethod
+    def get_html_from_response(response, response_description=None):
+        """
+        Purpose:
+            Get the HTML from a response from Indeed.com, logging the failure if the
+            response was not successful
+        Args:
+            response (HttpResponse Obj): Response from Indeed.com
+            response_description (String): What was requested (for logging)
+        Returns:
+            raw_html (String): Raw HTML of the response, None if the request failed
+        """
+
+        if response.status_code == 200 and response.text is not None:
+            return response.text
+        elif response.status_code == 200:
+            logging.error("Got Oversized Response from Indeed.com, Dropped It")
+            return None
 
-            logging.info(
-                f"Fetching HTML from Indeed URL ({link_version}): {job_details_url}"
+        if response_description:
+            logging.error(
+                f"Got Failure Response from Indeed.com ({response_description}): "
+                f"{response.status_code}"
             )
-            job_details_response = requests.get(
-                job_details_url, headers=Indeed.expected_headers
+        else:
+            logging.error(
+                f"Got Failure Response from Indeed.com: {response.status_code}"
             )
 
-            if job_details_response.status_code == 200:
-                raw_job_details_html = job_details_response.text
-            else:
-                logging.error(
-                    f"Got Failure Response from Indeed.com (Details {link_version}): "
-                    f"{job_details_response.status_code}"
-                )
-                raw_job_details_html = None
-                job_details_url = None
+        return None
+
+    @staticmethod
+    def generate_job_listings_url(
+        keywords,
+        zip_code,
+        radius=15,
+        job_type="fulltime",
+        salary_min="$40,000",
+        pagination=0
+    ):
+        """
+        Purpose:
+            Get Job Listings URL to search for jobs using keyword, zip_code, radius,
+            job_type, and salary
+        Args:
+            keywords (String): Keywords to Search
+            zip_code (String): Zip code to center the job search on
+            radius (String): Radius (from the zip code center) that jobs need to be
+                in to be considered
+            job_type (String): type of job. Enum of the following:
+                [fulltime, parttime, contractor]
+            salary_min (String): Minimum salary for jobs to be returned (best guess if
+                none is provided)
+            pagination (String): The job to start on
+        Returns:
+            job_listing_url (String): URL to call to get the job listings
+        """
 
-            if raw_job_details_html:
-                break
+        keywords = keywords.lower().replace(" ", "+")
 
-        return job_details_url, raw_job_details_html
+        return (
+            f"{Indeed.base_url}/jobs?q={keywords}+{salary_min}&l="
+            f"{zip_code}&radius={radius}&jt={job_type}&start={pagination}"
+        )
 
     @staticmethod
     def generate_job_details_url(company, job_title, job_id, link_version="v1"):
@@ -309,30 +1336,30 @@ class Indeed(object):
 
         if link_version == "v1":
             job_details_url =\
-                f"https://www.indeed.com/cmp/{company}/jobs/{job_title}-{job_id}"
+                f"{Indeed.base_url}/cmp/{company}/jobs/{job_title}-{job_id}"
         elif link_version == "v2":
-            job_details_url = f"https://www.indeed.com/viewjob?jk=e{job_id}"
+            job_details_url = f"{Indeed.base_url}/viewjob?jk=e{job_id}"
         elif link_version == "v3":
-            job_details_url = f"https://www.indeed.com/viewjob?jk=ee{job_id}"
+            job_details_url = f"{Indeed.base_url}/viewjob?jk=ee{job_id}"
         elif link_version == "v4":
-            job_details_url = f"https://www.indeed.com/viewjob?jk=b{job_id}"
+            job_details_url = f"{Indeed.base_url}/viewjob?jk=b{job_id}"
         elif link_version == "v5":
-            job_details_url = f"https://www.indeed.com/viewjob?jk=bb{job_id}"
+            job_details_url = f"{Indeed.base_url}/viewjob?jk=bb{job_id}"
         elif link_version == "v6":
-            job_details_url = f"https://www.indeed.com/viewjob?jk=c{job_id}"
+            job_details_url = f"{Indeed.base_url}/viewjob?jk=c{job_id}"
         elif link_version == "v7":
-            job_details_url = f"https://www.indeed.com/viewjob?jk=cc{job_id}"
+            job_details_url = f"{Indeed.base_url}/viewjob?jk=cc{job_id}"
         elif link_version == "v8":
-            job_details_url = f"https://www.indeed.com/viewjob?jk=cb{job_id}"
+            job_details_url = f"{Indeed.base_url}/viewjob?jk=cb{job_id}"
         elif link_version == "v9":
-            job_details_url = f"https://www.indeed.com/viewjob?jk=eb{job_id}"
+            job_details_url = f"{Indeed.base_url}/viewjob?jk=eb{job_id}"
         elif link_version == "v10":
-            job_details_url = f"https://www.indeed.com/viewjob?jk=ce{job_id}"
+            job_details_url = f"{Indeed.base_url}/viewjob?jk=ce{job_id}"
         elif link_version == "v11":
-            job_details_url = f"https://www.indeed.com/viewjob?jk=be{job_id}"
+            job_details_url = f"{Indeed.base_url}/viewjob?jk=be{job_id}"
         else:
             job_details_url =\
-                f"https://www.indeed.com/cmp/{company}/jobs/{job_title}-{job_id}"
+                f"{Indeed.base_url}/cmp/{company}/jobs/{job_title}-{job_id}"
 
         return job_details_url
 
@@ -340,6 +1367,28 @@ class Indeed(object):
     # HTML Parsing
     ###
 
+    @staticmethod
+    def build_beautiful_soup(raw_html, strainer=None):
+        """
+        Purpose:
+            Parse HTML with Beautiful Soup using Indeed.parser_backend
+        Args:
+            raw_html (String): HTML string to parse
+            strainer (SoupStrainer Obj): Parts of the page that are read. Only used
+                (and only these parts are parsed) by the strainer backend, the
+                whole page is parsed if not provided
+        Return:
+            beautiful_soup (BeautifulSoup Obj): Parsed HTML
+        """
+
+        if Indeed.parser_backend == "lxml":
+            return BeautifulSoup(raw_html, "lxml")
+        elif Indeed.parser_backend == "strainer":
+            strainer_parser = "lxml" if Indeed.is_lxml_installed() else "html.parser"
+            return BeautifulSoup(raw_html, strainer_parser, parse_only=strainer)
+
+        return BeautifulSoup(raw_html, "html.parser")
+
     @staticmethod
     def parse_job_listings_html(raw_job_listing_html):
         """
@@ -349,13 +1398,22 @@ class Indeed(object):
             raw_job_listing_html (String): HTML string to parse utilizing beautiful soup.
                 Contains the HTML of the job listings
         Return:
-            job_listings (List of Dicts): Job listings that have been found
+            job_listings (List of JobListing Objs): Job listings that have been
+                found
         """
 
         job_listings = []
 
         # Parse Main DOM
-        job_listing_beautiful_soup = BeautifulSoup(raw_job_listing_html, "html.parser")
+        job_listing_beautiful_soup = Indeed.build_beautiful_soup(
+            raw_job_listing_html,
+            strainer=SoupStrainer(
+                "div",
+                # Matched Against The Raw class Attribute While Parsing, Before
+                # Beautiful Soup Splits It Into Separate Classes
+                {"class": re.compile(r"(?:^|\s)jobsearch-SerpJobCard(?:\s|$)")},
+            ),
+        )
         job_listing_cards =\
             job_listing_beautiful_soup.findAll("div", {"class": "jobsearch-SerpJobCard"})
 
@@ -420,14 +1478,21 @@ class Indeed(object):
             except Exception as err:
                 easy_apply = False
 
-            job_listings.append({
-                "company": company,
-                "job_id": job_id,
-                "job_summary": job_summary,
-                "job_title": job_title,
-                "job_salary": job_salary,
-                "easy_apply": easy_apply,
-            })
+            try:
+                job_listing_posting_timeframe =\
+                    job_listing_card.find("span", {"class": "date"}).text.strip()
+            except Exception as err:
+                job_listing_posting_timeframe = None
+
+            job_listings.append(JobListing(
+                company=company,
+                job_id=job_id,
+                job_summary=job_summary,
+                job_title=job_title,
+                job_salary=job_salary,
+                easy_apply=easy_apply,
+                job_listing_posting_timeframe=job_listing_posting_timeframe,
+            ))
 
         return job_listings
 
@@ -444,39 +1509,31 @@ class Indeed(object):
 
         job_details = {}
 
-        # Parse Main DOM
-        job_details_beautiful_soup = BeautifulSoup(raw_job_details_html, "html.parser")
+        # Pull The Sections Straight Out Of The Raw HTML, Only Building A DOM When
+        # That Fails
+        job_details_sections = None
+        if Indeed.use_fast_path_extraction:
+            job_details_sections =\
+                fast_html_extractor.extract_job_details_sections(raw_job_details_html)
+        if job_details_sections is None:
+            job_details_sections =\
+                Indeed.parse_job_details_sections_html(raw_job_details_html)
 
         # Get Raw Description
         try:
-            raw_job_description = job_details_beautiful_soup.find(
-                "div",
-                {"id": "jobDescriptionText"}
-            )
-            job_details["job_description"] = raw_job_description.text.strip()
+            job_details["job_description"] =\
+                job_details_sections["job_description"].strip()
         except Exception as err:
             job_details["job_description"] = None
 
         # Get Apply Link
-        try:
-            raw_job_apply_span = job_details_beautiful_soup.find(
-                "span",
-                {"id": "originalJobLinkContainer"}
-            )
-            job_details["job_apply_url"] = raw_job_apply_span.find("a")["href"]
-        except Exception as err:
-            job_details["job_apply_url"] = None
+        job_details["job_apply_url"] = job_details_sections["job_apply_url"]
 
         # Get When job was posted
         try:
 
-            raw_job_posting_metadata = job_details_beautiful_soup.find(
-                "div",
-                {"class": "jobsearch-JobMetadataFooter"}
-            )
-
             job_details["job_posting_timeframe"] = None
-            for job_metadata_value in raw_job_posting_metadata.text.split("-"):
+            for job_metadata_value in job_details_sections["job_metadata"].split("-"):
                 if "ago" in job_metadata_value:
                     job_details["job_posting_timeframe"] = job_metadata_value.strip()
                     break
@@ -488,24 +1545,19 @@ class Indeed(object):
             job_details["job_posting_timeframe"] = None
             job_details["job_posting_datetime"] = None
 
-        # Get Job Init Data (has interesting Information on the job)
+        # Get Job Init Data (has interesting Information on the job). Only the
+        # location is read now, the rest is kept as raw bytes (see JobListing)
         try:
-            start_data_string = "window._initialData="
-            start_data_string_location =\
-                raw_job_details_html.find(start_data_string) + len(start_data_string)
-            stripped_raw_job_details_html =\
-                raw_job_details_html[start_data_string_location:]
-            end_data_string = ";</script>"
-            end_data_string_location =\
-                stripped_raw_job_details_html.find(end_data_string)
-            raw_init_data = stripped_raw_job_details_html[:end_data_string_location]
-            job_details["init_data"] = json.loads(raw_init_data)
+            init_data = json.loads(job_details_sections["raw_init_data"])
+            job_details["raw_init_data"] =\
+                job_details_sections["raw_init_data"].encode("utf-8")
         except Exception as err:
-            job_details["init_data"] = {}
+            init_data = {}
+            job_details["raw_init_data"] = None
 
         # Get Job Location (from init_data)
         try:
-            location_string = job_details["init_data"].get("jobLocation", None)
+            location_string = init_data.get("jobLocation", None)
 
             if not location_string:
                 job_details["city"] = None
@@ -531,18 +1583,86 @@ class Indeed(object):
             job_details["state"] = None
             job_details["zip_code"] = None
 
-        # College Degree
-        if not job_details["job_description"]:
-            job_details["college_degree"] = "Not Specified"
-        elif "associates" in job_details["job_description"].lower():
-            job_details["college_degree"] = "Associates"
-        elif "bachelor" in job_details["job_description"].lower():
-            job_details["college_degree"] = "Bachelor's"
+        # Degrees, Certifications, Skills, Etc. Mentioned In The Description (One
+        # Pass Over The Description For Every Term In The Taxonomy)
+        keyword_matches =\
+            Indeed.get_keyword_classifier().classify(job_details["job_description"])
+        for keyword_category, keyword_labels in keyword_matches.items():
+            job_details[keyword_category] = ", ".join(keyword_labels) or None
+
+        # College Degree (The First Degree In The Taxonomy Mentioned)
+        if keyword_matches.get("degrees"):
+            job_details["college_degree"] = keyword_matches["degrees"][0]
         else:
             job_details["college_degree"] = "Not Specified"
 
         return job_details
 
+    @staticmethod
+    def parse_job_details_sections_html(raw_job_details_html):
+        """
+        Purpose:
+            Get the sections of a job details page that are read by parsing the
+            HTML with Beautiful Soup (the fallback when the fast path in
+            fast_html_extractor fails)
+        Args:
+            raw_job_details_html (String): HTML string to parse utilizing beautiful
+                soup
+        Return:
+            job_details_sections (Dict): job_description, job_apply_url,
+                job_metadata, and raw_init_data (None for any that are missing)
+        """
+
+        job_details_sections = {}
+
+        # Parse Main DOM
+        job_details_beautiful_soup = Indeed.build_beautiful_soup(raw_job_details_html)
+
+        # Get Raw Description
+        try:
+            job_details_sections["job_description"] = job_details_beautiful_soup.find(
+                "div",
+                {"id": "jobDescriptionText"}
+            ).text
+        except Exception as err:
+            job_details_sections["job_description"] = None
+
+        # Get Apply Link
+        try:
+            raw_job_apply_span = job_details_beautiful_soup.find(
+                "span",
+                {"id": "originalJobLinkContainer"}
+            )
+            job_details_sections["job_apply_url"] = raw_job_apply_span.find("a")["href"]
+        except Exception as err:
+            job_details_sections["job_apply_url"] = None
+
+        # Get Metadata Footer (has when the job was posted)
+        try:
+            job_details_sections["job_metadata"] = job_details_beautiful_soup.find(
+                "div",
+                {"class": "jobsearch-JobMetadataFooter"}
+            ).text
+        except Exception as err:
+            job_details_sections["job_metadata"] = None
+
+        # Get Job Init Data
+        try:
+            start_data_string = "window._initialData="
+            start_data_string_location =\
+                raw_job_details_html.find(start_data_string) + len(start_data_string)
+            stripped_raw_job_details_html =\
+                raw_job_details_html[start_data_string_location:]
+            end_data_string = ";</script>"
+            end_data_string_location =\
+                stripped_raw_job_details_html.find(end_data_string)
+            job_details_sections["raw_init_data"] =\
+                stripped_raw_job_details_html[:end_data_string_location]
+        except Exception as err:
+            job_details_sections["raw_init_data"] = None
+
+        return job_details_sections
+
     ###
     # HTML Parsing
     ###
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        The JobDetailsRegistry class is responsible for remembering the job details
+        already fetched during a run, so a job that shows up on several pages or
+        under several searches is only fetched once.
+"""
+
+# Python Library Imports
+import logging
+import threading
+from concurrent.futures import Future
+
+
+###
+# Class Definition
+###
+
+
+class JobDetailsRegistry(object):
+    """
+        JobDetailsRegistry Class. Run-scoped registry of job details keyed by job_id.
+        Consulted before every job details fetch. Concurrent requests for the same
+        job wait on the fetch already in flight instead of starting another
+    """
+
+    ###
+    # Class Lifecycle Methods
+    ###
+
+    def __init__(self):
+        """
+        Purpose:
+            Initilize the JobDetailsRegistry Class.
+        Args:
+            N/A
+        Returns:
+            N/A
+        """
+        logging.info("Initializing JobDetailsRegistry")
+
+        self.lock = threading.Lock()
+        self.job_details = {}
+        self.hits = 0
+        self.fetches = 0
+        self.preloaded = 0
+
+    ###
+    # Registry Functions
+    ###
+
+    def get_or_fetch(self, job_id, fetch_job_details):
+        """
+        Purpose:
+            Get the details of a job, fetching them only if the job has not been
+            seen yet during the run
+        Args:
+            job_id (String): The unqiue job_id from Indeed
+            fetch_job_details (Function): Function (no args) that fetches the job
+                details when the job has not been seen
+        Returns:
+            job_details (Dict): Details of the job (a copy, safe to modify)
+        """
+
+        if not job_id:
+            return fetch_job_details()
+
+        with self.lock:
+            job_details_future = self.job_details.get(job_id)
+            is_new_job = job_details_future is None
+            if is_new_job:
+                job_details_future = Future()
+                self.job_details[job_id] = job_details_future
+                self.fetches += 1
+            else:
+                self.hits += 1
+
+        if is_new_job:
+            try:
+                job_details = fetch_job_details()
+            except Exception as err:
+                # Let the next request for the job try again
+                with self.lock:
+                    self.job_details.pop(job_id, None)
+                job_details_future.set_exception(err)
+            else:
+                # No link version returned the job, let the next request for the
+                # job try again (requests already waiting get the failed details)
+                if not job_details.get("job_details_url"):
+                    with self.lock:
+                        self.job_details.pop(job_id, None)
+                job_details_future.set_result(job_details)
+        else:
+            logging.info(f"Job {job_id} Already Seen This Run, Reusing Its Details")
+
+        return dict(job_details_future.result())
+
+    def get(self, job_id):
+        """
+        Purpose:
+            Get the details of a job if they have already been fetched
+        Args:
+            job_id (String): The unqiue job_id from Indeed
+        Returns:
+            job_details (Dict): Details of the job (a copy, safe to modify), None if
+                the job has not been fetched
+        """
+
+        with self.lock:
+            job_details_future = self.job_details.get(job_id)
+            if not job_details_future or not job_details_future.done():
+                return None
+            self.hits += 1
+
+        return dict(job_details_future.result())
+
+    def add(self, job_id, job_details):
+        """
+        Purpose:
+            Add the details of a job fetched outside of get_or_fetch. Failed
+            fetches (no job_details_url) are not added, so the job is fetched
+            again the next time it is requested
+        Args:
+            job_id (String): The unqiue job_id from Indeed
+            job_details (Dict): Details of the job
+        Returns:
+            N/A
+        """
+
+        if not job_id or not job_details.get("job_details_url"):
+            return
+
+        job_details_future = Future()
+        job_details_future.set_result(dict(job_details))
+
+        with self.lock:
+            self.job_details[job_id] = job_details_future
+            self.fetches += 1
+
+    def preload(self, job_details_by_job_id):
+        """
+        Purpose:
+            Add the details of jobs fetched during an earlier run, so they are not
+            fetched again this run
+        Args:
+            job_details_by_job_id (Dict of Dicts): Details of each job, keyed by
+                the unqiue job_id from Indeed
+        Returns:
+            N/A
+        """
+
+        job_details_futures = {}
+        for job_id, job_details in job_details_by_job_id.items():
+            if not job_id:
+                continue
+            job_details_future = Future()
+            job_details_future.set_result(dict(job_details))
+            job_details_futures[job_id] = job_details_future
+
+        with self.lock:
+            for job_id, job_details_future in job_details_futures.items():
+                self.job_details.setdefault(job_id, job_details_future)
+            self.preloaded += len(job_details_futures)
+
+    def get_stats(self):
+        """
+        Purpose:
+            Get how many job details were fetched and how many fetches were avoided
+        Args:
+            N/A
+        Returns:
+            stats (Dict): fetches, hits, and preloaded job details of the registry
+        """
+
+        with self.lock:
+            return {
+                "fetches": self.fetches,
+                "hits": self.hits,
+                "preloaded": self.preloaded,
+            }
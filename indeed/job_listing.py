@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        The JobListing class is responsible for holding a single job found on a
+        job board, from its listing card through its details and report columns.
+"""
+
+# Python Library Imports
+import json
+
+
+###
+# Class Definition
+###
+
+
+class JobListing(object):
+    """
+        JobListing Class. Fixed set of fields stored in __slots__ instead of a dict
+        per job. Supports the dict-style access (job_listing["company"], get,
+        items, etc.) the rest of the project uses. window._initialData is kept as
+        raw UTF-8 bytes and only decoded when init_data is read
+    """
+
+    ###
+    # Properties
+    ###
+
+    card_fields = (
+        "company",
+        "job_id",
+        "job_summary",
+        "job_title",
+        "job_salary",
+        "easy_apply",
+        "job_listing_posting_timeframe",
+        "job_type",
+    )
+    job_details_fields = (
+        "job_description",
+        "job_apply_url",
+        "job_posting_timeframe",
+        "job_posting_datetime",
+        "raw_init_data",
+        "city",
+        "state",
+        "zip_code",
+        "college_degree",
+        "degrees",
+        "certifications",
+        "skills",
+        "security_clearance",
+        "work_arrangement",
+        "job_details_url",
+    )
+    report_fields = (
+        "job_board",
+        "job_search",
+    )
+    fields = card_fields + job_details_fields + report_fields
+    __slots__ = fields
+
+    ###
+    # Class Lifecycle Methods
+    ###
+
+    def __init__(self, **job_fields):
+        """
+        Purpose:
+            Initilize the JobListing Class. Fields not provided are None
+        Args:
+            job_fields (Kwargs): Values of any of JobListing.fields
+        Returns:
+            N/A
+        """
+
+        for field in self.fields:
+            setattr(self, field, None)
+
+        self.update(job_fields)
+
+    def __repr__(self):
+        """
+        Purpose:
+            Show the job's company, title, and ID
+        Args:
+            N/A
+        Returns:
+            job_listing_repr (String): Representation of the job
+        """
+
+        return (
+            f"JobListing(company={self.company!r}, job_title={self.job_title!r}, "
+            f"job_id={self.job_id!r})"
+        )
+
+    def __eq__(self, other):
+        """
+        Purpose:
+            Compare two jobs field by field
+        Args:
+            other (JobListing Obj): Job to compare to
+        Returns:
+            is_equal (Boolean): Whether every field matches
+        """
+
+        if not isinstance(other, JobListing):
+            return NotImplemented
+
+        return all(
+            getattr(self, field) == getattr(other, field) for field in self.fields
+        )
+
+    def __hash__(self):
+        """
+        Purpose:
+            Hash the job by its job board and ID (equal jobs always share both).
+            Don't change either while the job is in a set or used as a dict key
+        Args:
+            N/A
+        Returns:
+            job_listing_hash (Int): Hash of the job board and job ID
+        """
+
+        return hash((self.job_board, self.job_id))
+
+    ###
+    # Lazy Fields
+    ###
+
+    @property
+    def init_data(self):
+        """
+        Purpose:
+            Decode window._initialData of the job details page (decoded on every
+            read, never stored)
+        Args:
+            N/A
+        Returns:
+            init_data (Dict): Decoded window._initialData, empty if missing or
+                invalid
+        """
+
+        if not self.raw_init_data:
+            return {}
+
+        try:
+            return json.loads(self.raw_init_data.decode("utf-8"))
+        except ValueError:
+            return {}
+
+    ###
+    # Dict-Style Access
+    ###
+
+    def __getitem__(self, field):
+        """
+        Purpose:
+            Get a field (or init_data) by name
+        Args:
+            field (String): Name of the field
+        Returns:
+            value (Object): Value of the field
+        """
+
+        if field not in self.fields and field != "init_data":
+            raise KeyError(field)
+
+        return getattr(self, field)
+
+    def __setitem__(self, field, value):
+        """
+        Purpose:
+            Set a field by name. init_data is stored back as raw bytes
+        Args:
+            field (String): Name of the field
+            value (Object): Value of the field
+        Returns:
+            N/A
+        """
+
+        if field == "init_data":
+            field = "raw_init_data"
+            value = json.dumps(value).encode("utf-8") if value else None
+        elif field not in self.fields:
+            raise KeyError(field)
+
+        setattr(self, field, value)
+
+    def __contains__(self, field):
+        """
+        Purpose:
+            Check if a field exists
+        Args:
+            field (String): Name of the field
+        Returns:
+            has_field (Boolean): Whether the field is one of JobListing.fields
+        """
+
+        return field in self.fields
+
+    def get(self, field, default=None):
+        """
+        Purpose:
+            Get a field by name, or a default if the field does not exist
+        Args:
+            field (String): Name of the field
+            default (Object): Value returned if the field does not exist
+        Returns:
+            value (Object): Value of the field
+        """
+
+        try:
+            return self[field]
+        except KeyError:
+            return default
+
+    def keys(self):
+        """
+        Purpose:
+            Get the names of the fields
+        Args:
+            N/A
+        Returns:
+            fields (Tuple of Strings): JobListing.fields
+        """
+
+        return self.fields
+
+    def items(self):
+        """
+        Purpose:
+            Get each field with its value
+        Args:
+            N/A
+        Returns:
+            items (List of Tuples): (field, value) for every field
+        """
+
+        return [(field, getattr(self, field)) for field in self.fields]
+
+    def update(self, job_fields):
+        """
+        Purpose:
+            Set several fields at once
+        Args:
+            job_fields (Dict or JobListing Obj): Fields to set
+        Returns:
+            N/A
+        """
+
+        for field, value in job_fields.items():
+            self[field] = value
+
+    def to_dict(self):
+        """
+        Purpose:
+            Get the job as a plain dict
+        Args:
+            N/A
+        Returns:
+            job_listing (Dict): Every field with its value
+        """
+
+        return dict(self.items())
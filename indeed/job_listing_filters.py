@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        Predicates evaluated against a job listing card (before its details are
+        fetched) to decide whether the job is worth fetching. Each function builds
+        a predicate that takes a job listing dict and returns True to keep it.
+        Predicates keep a job whenever the card lacks the field they check.
+"""
+
+# Python Library Imports
+import re
+
+
+###
+# Job Listing Filters
+###
+
+
+def exclude_companies(companies):
+    """
+    Purpose:
+        Build a predicate that drops jobs with any of the companies
+    Args:
+        companies (List of Strings): Companies to drop (case insensitive)
+    Returns:
+        job_listing_filter (Function): Predicate taking a job listing dict
+    """
+
+    excluded_companies = {company.strip().lower() for company in companies}
+
+    def job_listing_filter(job_listing):
+        company = job_listing.get("company")
+        return not company or company.strip().lower() not in excluded_companies
+
+    return job_listing_filter
+
+
+def exclude_title_keywords(keywords):
+    """
+    Purpose:
+        Build a predicate that drops jobs with any of the keywords in their title
+    Args:
+        keywords (List of Strings): Keywords to drop (case insensitive)
+    Returns:
+        job_listing_filter (Function): Predicate taking a job listing dict
+    """
+
+    excluded_keywords = [keyword.strip().lower() for keyword in keywords]
+
+    def job_listing_filter(job_listing):
+        job_title = (job_listing.get("job_title") or "").lower()
+        return not any(keyword in job_title for keyword in excluded_keywords)
+
+    return job_listing_filter
+
+
+def require_title_keywords(keywords):
+    """
+    Purpose:
+        Build a predicate that drops jobs with none of the keywords in their title
+    Args:
+        keywords (List of Strings): Keywords of which at least one is required
+            (case insensitive)
+    Returns:
+        job_listing_filter (Function): Predicate taking a job listing dict
+    """
+
+    required_keywords = [keyword.strip().lower() for keyword in keywords]
+
+    def job_listing_filter(job_listing):
+        job_title = job_listing.get("job_title")
+        if not job_title:
+            return True
+        return any(keyword in job_title.lower() for keyword in required_keywords)
+
+    return job_listing_filter
+
+
+def min_annual_salary(salary_min):
+    """
+    Purpose:
+        Build a predicate that drops jobs whose listed salary (annualized) tops out
+        below the minimum
+    Args:
+        salary_min (Int): Minimum annual salary
+    Returns:
+        job_listing_filter (Function): Predicate taking a job listing dict
+    """
+
+    def job_listing_filter(job_listing):
+        annual_salary = parse_max_annual_salary(job_listing.get("job_salary"))
+        return annual_salary is None or annual_salary >= salary_min
+
+    return job_listing_filter
+
+
+###
+# Helpers
+###
+
+
+def parse_max_annual_salary(job_salary):
+    """
+    Purpose:
+        Parse the top of the salary range on a job listing card into an annual
+        amount (e.g. "$20 - $28 an hour" is 58240)
+    Args:
+        job_salary (String): Salary text from the job listing card
+    Returns:
+        annual_salary (Float): Top of the salary range per year, None if the
+            salary could not be parsed
+    """
+
+    if not job_salary:
+        return None
+
+    amounts = [
+        float(amount.replace(",", ""))
+        for amount in re.findall(r"\$\s*([0-9][0-9,]*(?:\.[0-9]+)?)", job_salary)
+    ]
+    if not amounts:
+        return None
+
+    salary_periods_per_year = {
+        "hour": 2080,
+        "day": 260,
+        "week": 52,
+        "month": 12,
+        "year": 1,
+    }
+    for salary_period, periods_per_year in salary_periods_per_year.items():
+        if salary_period in job_salary.lower():
+            return max(amounts) * periods_per_year
+
+    return None
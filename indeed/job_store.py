@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        The JobStore class is responsible for keeping every job found on disk in a
+        SQLite database, so jobs outlive the run that found them and later runs
+        (and reports) can query them instead of crawling for them again.
+"""
+
+# Python Library Imports
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+# Local Library Imports
+from .job_listing import JobListing
+
+
+###
+# Class Definition
+###
+
+
+class JobStore(object):
+    """
+        JobStore Class. One row per job (keyed by job board and job ID) holding
+        every JobListing field, plus when the job was first and last seen. Jobs
+        found again are updated in place. Also tracks which jobs each profile
+        (e.g. a recurring report) has already seen
+    """
+
+    ###
+    # Properties
+    ###
+
+    boolean_fields = ("easy_apply",)
+    datetime_fields = ("job_posting_datetime",)
+    datetime_format = "%Y-%m-%d %H:%M:%S.%f"
+    indexed_fields = ("job_id", "job_posting_datetime", "company")
+
+    ###
+    # Class Lifecycle Methods
+    ###
+
+    def __init__(self, db_file):
+        """
+        Purpose:
+            Initilize the JobStore Class. The database (and its tables and indexes)
+            is created if it does not exist
+        Args:
+            db_file (String): Path of the SQLite database
+        Returns:
+            N/A
+        """
+        logging.info(f"Initializing JobStore in {db_file}")
+
+        self.db_file = db_file
+
+        db_dir = os.path.dirname(self.db_file)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        # One Connection Shared By Every Thread, Serialized By The Lock
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(self.db_file, check_same_thread=False)
+        self.create_schema()
+
+    def close(self):
+        """
+        Purpose:
+            Close the database
+        Args:
+            N/A
+        Returns:
+            N/A
+        """
+
+        with self.lock:
+            self.connection.close()
+
+    def create_schema(self):
+        """
+        Purpose:
+            Create the job_listings table and its indexes if they do not exist, and
+            add columns for JobListing fields added since the table was created.
+            job_board is indexed through the primary key (job_board, job_id)
+        Args:
+            N/A
+        Returns:
+            N/A
+        """
+
+        column_definitions = [
+            self.get_column_definition(field) for field in JobListing.fields
+        ] + [
+            "first_seen_at TEXT NOT NULL",
+            "last_seen_at TEXT NOT NULL",
+            "PRIMARY KEY (job_board, job_id)",
+        ]
+
+        with self.lock, self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS job_listings "
+                f"({', '.join(column_definitions)})"
+            )
+
+            existing_columns = {
+                column_info[1]
+                for column_info in self.connection.execute(
+                    "PRAGMA table_info(job_listings)"
+                )
+            }
+            for field in JobListing.fields:
+                if field not in existing_columns:
+                    self.connection.execute(
+                        "ALTER TABLE job_listings ADD COLUMN "
+                        f"{self.get_column_definition(field)}"
+                    )
+
+            for field in self.indexed_fields:
+                self.connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS job_listings_{field} "
+                    f"ON job_listings ({field})"
+                )
+
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS profile_job_ids ("
+                "profile TEXT NOT NULL, "
+                "job_board TEXT NOT NULL, "
+                "job_id TEXT NOT NULL, "
+                "first_seen_at TEXT NOT NULL, "
+                "PRIMARY KEY (profile, job_board, job_id))"
+            )
+
+    def get_column_definition(self, field):
+        """
+        Purpose:
+            Get the column definition of a JobListing field
+        Args:
+            field (String): Name of the field
+        Returns:
+            column_definition (String): Column name and type
+        """
+
+        if field == "raw_init_data":
+            return f"{field} BLOB"
+        elif field in self.boolean_fields:
+            return f"{field} INTEGER"
+        elif field in ("job_board", "job_id"):
+            return f"{field} TEXT NOT NULL"
+
+        return f"{field} TEXT"
+
+    ###
+    # Write Functions
+    ###
+
+    def upsert_job_listings(self, job_listings, job_board=None, job_search=None):
+        """
+        Purpose:
+            Add jobs to the store, updating the jobs already in it (their
+            first_seen_at is kept)
+        Args:
+            job_listings (Iterable of JobListing Objs): Jobs to store. Jobs without
+                a job_id are skipped
+            job_board (String): Job board the jobs were found on, for jobs that do
+                not have one set
+            job_search (String): Search that found the jobs, for jobs that do not
+                have one set
+        Returns:
+            upserted_jobs (Int): Number of jobs stored
+        """
+
+        seen_at = datetime.now().strftime(self.datetime_format)
+
+        rows = []
+        for job_listing in job_listings:
+            if not job_listing.get("job_id"):
+                continue
+
+            row = {
+                field: self.to_db_value(field, job_listing.get(field))
+                for field in JobListing.fields
+            }
+            row["job_board"] = row["job_board"] or job_board or ""
+            row["job_search"] = row["job_search"] or job_search
+            row["seen_at"] = seen_at
+            rows.append(row)
+
+        if not rows:
+            return 0
+
+        updated_fields = [
+            field for field in JobListing.fields if field not in ("job_board", "job_id")
+        ]
+        update_statement = (
+            "UPDATE job_listings SET "
+            + ", ".join(f"{field} = :{field}" for field in updated_fields)
+            + ", last_seen_at = :seen_at WHERE job_board = :job_board "
+            "AND job_id = :job_id"
+        )
+        insert_statement = (
+            f"INSERT OR IGNORE INTO job_listings ({', '.join(JobListing.fields)}, "
+            "first_seen_at, last_seen_at) VALUES ("
+            + ", ".join(f":{field}" for field in JobListing.fields)
+            + ", :seen_at, :seen_at)"
+        )
+
+        with self.lock, self.connection:
+            self.connection.executemany(update_statement, rows)
+            self.connection.executemany(insert_statement, rows)
+
+        return len(rows)
+
+    def mark_job_ids_seen(self, profile, job_board, job_ids):
+        """
+        Purpose:
+            Record that a profile has seen jobs, so later runs of the profile can
+            tell them apart from new jobs
+        Args:
+            profile (String): Name of the profile (e.g. the report name)
+            job_board (String): Job board the jobs were found on
+            job_ids (Iterable of Strings): job_id of each job seen
+        Returns:
+            N/A
+        """
+
+        seen_at = datetime.now().strftime(self.datetime_format)
+        rows = [(profile, job_board, job_id, seen_at) for job_id in job_ids if job_id]
+
+        with self.lock, self.connection:
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO profile_job_ids "
+                "(profile, job_board, job_id, first_seen_at) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+
+    ###
+    # Query Functions
+    ###
+
+    def query_job_listings(
+        self,
+        job_board=None,
+        job_id=None,
+        company=None,
+        posted_since=None,
+        seen_since=None,
+        profile=None,
+    ):
+        """
+        Purpose:
+            Get the jobs in the store matching every filter provided, most recently
+            posted first
+        Args:
+            job_board (String): Only jobs found on this job board
+            job_id (String): Only the job with this job_id
+            company (String): Only jobs with this company
+            posted_since (Datetime Obj): Only jobs posted at or after this time
+            seen_since (Datetime Obj): Only jobs found at or after this time
+            profile (String): Only jobs the profile has already seen
+        Returns:
+            job_listings (List of JobListing Objs): Jobs matching the filters
+        """
+
+        conditions = []
+        parameters = []
+        for field, value in (
+            ("job_board", job_board),
+            ("job_id", job_id),
+            ("company", company),
+        ):
+            if value is not None:
+                conditions.append(f"{field} = ?")
+                parameters.append(value)
+        if posted_since is not None:
+            conditions.append("job_posting_datetime >= ?")
+            parameters.append(posted_since.strftime(self.datetime_format))
+        if seen_since is not None:
+            conditions.append("last_seen_at >= ?")
+            parameters.append(seen_since.strftime(self.datetime_format))
+        if profile is not None:
+            conditions.append(
+                "EXISTS (SELECT 1 FROM profile_job_ids WHERE "
+                "profile_job_ids.profile = ? "
+                "AND profile_job_ids.job_board = job_listings.job_board "
+                "AND profile_job_ids.job_id = job_listings.job_id)"
+            )
+            parameters.append(profile)
+
+        query = f"SELECT {', '.join(JobListing.fields)} FROM job_listings"
+        if conditions:
+            query += f" WHERE {' AND '.join(conditions)}"
+        query += " ORDER BY job_posting_datetime DESC, company"
+
+        with self.lock:
+            rows = self.connection.execute(query, parameters).fetchall()
+
+        return [
+            JobListing(**{
+                field: self.from_db_value(field, value)
+                for field, value in zip(JobListing.fields, row)
+            })
+            for row in rows
+        ]
+
+    def get_seen_job_ids(self, profile, job_board):
+        """
+        Purpose:
+            Get the job_id of every job a profile has already seen on a job board
+        Args:
+            profile (String): Name of the profile (e.g. the report name)
+            job_board (String): Job board the jobs were found on
+        Returns:
+            job_ids (Set of Strings): job_id of every job the profile has seen
+        """
+
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT job_id FROM profile_job_ids "
+                "WHERE profile = ? AND job_board = ?",
+                (profile, job_board),
+            ).fetchall()
+
+        return {job_id for job_id, in rows}
+
+    def get_stats(self):
+        """
+        Purpose:
+            Get how many jobs are in the store
+        Args:
+            N/A
+        Returns:
+            stats (Dict): jobs in the store in total and per job board
+        """
+
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT job_board, COUNT(*) FROM job_listings GROUP BY job_board"
+            ).fetchall()
+
+        jobs_by_job_board = dict(rows)
+
+        return {
+            "jobs": sum(jobs_by_job_board.values()),
+            "jobs_by_job_board": jobs_by_job_board,
+        }
+
+    ###
+    # Conversion Helpers
+    ###
+
+    def to_db_value(self, field, value):
+        """
+        Purpose:
+            Convert a JobListing field to the value stored in the database
+        Args:
+            field (String): Name of the field
+            value (Object): Value of the field
+        Returns:
+            db_value (Object): Value to store
+        """
+
+        if value is None:
+            return None
+        elif field in self.datetime_fields:
+            return value.strftime(self.datetime_format)
+        elif field in self.boolean_fields:
+            return int(value)
+
+        return value
+
+    def from_db_value(self, field, db_value):
+        """
+        Purpose:
+            Convert a value stored in the database back to a JobListing field
+        Args:
+            field (String): Name of the field
+            db_value (Object): Value stored
+        Returns:
+            value (Object): Value of the field
+        """
+
+        if db_value is None:
+            return None
+        elif field in self.datetime_fields:
+            return datetime.strptime(db_value, self.datetime_format)
+        elif field in self.boolean_fields:
+            return bool(db_value)
+
+        return db_value
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        The KeywordClassifier class is responsible for tagging a job description
+        with the terms of a taxonomy (degrees, certifications, skills, clearance,
+        and work arrangement) it mentions, scanning the description once no
+        matter how many terms the taxonomy has.
+"""
+
+# Python Library Imports
+import json
+import logging
+from collections import deque
+
+
+###
+# Globals
+###
+
+
+DEFAULT_KEYWORD_TAXONOMY = {
+    "degrees": {
+        "Associates": ["associates", "associate's degree", "associate degree"],
+        "Bachelor's": ["bachelor", "bachelors", "b.s. degree", "b.a. degree"],
+        "Master's": ["master's degree", "masters degree", "mba"],
+        "Doctorate": ["doctorate", "ph.d", "phd"],
+    },
+    "certifications": {
+        "CPA": ["cpa", "certified public accountant"],
+        "PMP": ["pmp", "project management professional"],
+        "SHRM": ["shrm-cp", "shrm-scp", "shrm"],
+        "CNA": ["cna", "certified nursing assistant"],
+        "RN": ["registered nurse", "rn license"],
+        "Notary": ["notary"],
+        "Paralegal Certificate": ["paralegal certificate", "certified paralegal"],
+    },
+    "skills": {
+        "Excel": ["excel"],
+        "Microsoft Office": ["microsoft office", "ms office", "office 365"],
+        "QuickBooks": ["quickbooks"],
+        "Salesforce": ["salesforce"],
+        "SAP": ["sap"],
+        "SQL": ["sql"],
+        "Customer Service": ["customer service"],
+        "Data Entry": ["data entry"],
+        "Bilingual": ["bilingual", "spanish"],
+    },
+    "security_clearance": {
+        "Secret": ["secret clearance", "secret security clearance"],
+        "Top Secret": ["top secret", "ts/sci"],
+        "Public Trust": ["public trust"],
+        "Background Check": ["background check"],
+    },
+    "work_arrangement": {
+        "Remote": ["remote", "work from home", "telecommute"],
+        "Hybrid": ["hybrid"],
+        "On Site": ["on-site", "onsite", "in office"],
+    },
+}
+
+
+###
+# Class Definition
+###
+
+
+class KeywordClassifier(object):
+    """
+        KeywordClassifier Class. Aho-Corasick automaton built from every term in a
+        taxonomy, so a description is classified in a single pass that stays
+        linear in the length of the description as terms are added. Terms are
+        case insensitive and must be whole words by default (so "excel" matches
+        "Excel" and "Excel's" but not "excellent")
+    """
+
+    ###
+    # Properties
+    ###
+
+    categories = (
+        "degrees",
+        "certifications",
+        "skills",
+        "security_clearance",
+        "work_arrangement",
+    )
+
+    ###
+    # Class Lifecycle Methods
+    ###
+
+    def __init__(self, taxonomy=None, match_whole_words=True):
+        """
+        Purpose:
+            Initilize the KeywordClassifier Class.
+        Args:
+            taxonomy (Dict of Dicts): Terms of each label in each category (e.g.
+                {"skills": {"Excel": ["excel"]}}). Categories must be one of
+                KeywordClassifier.categories. Defaults to DEFAULT_KEYWORD_TAXONOMY
+            match_whole_words (Boolean): Whether terms must also end at the end
+                of a word. Terms always start at the start of a word
+        Returns:
+            N/A
+        """
+
+        if taxonomy is None:
+            taxonomy = DEFAULT_KEYWORD_TAXONOMY
+
+        unknown_categories = set(taxonomy) - set(self.categories)
+        if unknown_categories:
+            raise ValueError(
+                f"Invalid Keyword Categories {sorted(unknown_categories)}, Expected "
+                f"Some Of {self.categories}"
+            )
+
+        self.taxonomy = taxonomy
+        self.match_whole_words = match_whole_words
+
+        # Labels Keep Their Taxonomy Order So Results Are Repeatable
+        self.labels = []
+        for category in self.categories:
+            for label in taxonomy.get(category, {}):
+                self.labels.append((category, label))
+
+        self.build_automaton()
+
+        logging.info(
+            f"Initializing KeywordClassifier ({len(self.labels)} labels, "
+            f"{len(self.goto) - 1} automaton states)"
+        )
+
+    @classmethod
+    def from_file(cls, taxonomy_file, **classifier_settings):
+        """
+        Purpose:
+            Create a KeywordClassifier from a JSON taxonomy file
+        Args:
+            taxonomy_file (String): Path of a JSON file shaped like
+                DEFAULT_KEYWORD_TAXONOMY
+            classifier_settings (Kwargs): Other KeywordClassifier arguments
+        Returns:
+            keyword_classifier (KeywordClassifier Obj): Classifier for the taxonomy
+        """
+
+        with open(taxonomy_file, "r") as taxonomy_fh:
+            return cls(json.load(taxonomy_fh), **classifier_settings)
+
+    ###
+    # Automaton Functions
+    ###
+
+    def build_automaton(self):
+        """
+        Purpose:
+            Build the Aho-Corasick automaton (trie of every term, failure links,
+            and the terms ending at each state)
+        Args:
+            N/A
+        Returns:
+            N/A
+        """
+
+        self.goto = [{}]
+        self.failure = [0]
+        self.outputs = [[]]
+
+        # Trie Of Every Term, Recording (Label Index, Term Length) Where It Ends
+        for label_idx, (category, label) in enumerate(self.labels):
+            for term in self.taxonomy[category][label]:
+                term = term.lower()
+                state = 0
+                for character in term:
+                    next_state = self.goto[state].get(character)
+                    if next_state is None:
+                        next_state = len(self.goto)
+                        self.goto.append({})
+                        self.failure.append(0)
+                        self.outputs.append([])
+                        self.goto[state][character] = next_state
+                    state = next_state
+                self.outputs[state].append((label_idx, len(term)))
+
+        # Failure Links (Breadth First), Merging The Outputs Of The Failure State
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for character, next_state in self.goto[state].items():
+                queue.append(next_state)
+
+                failure_state = self.failure[state]
+                while failure_state and character not in self.goto[failure_state]:
+                    failure_state = self.failure[failure_state]
+                self.failure[next_state] =\
+                    self.goto[failure_state].get(character, 0)
+
+                self.outputs[next_state] =\
+                    self.outputs[next_state] + self.outputs[self.failure[next_state]]
+
+    ###
+    # Classification Functions
+    ###
+
+    def classify(self, text):
+        """
+        Purpose:
+            Find the labels of every category mentioned in a text
+        Args:
+            text (String): Text to classify (e.g. a job description)
+        Returns:
+            keyword_matches (Dict of Lists): Labels found in each category, in
+                taxonomy order (every category is present, empty if nothing
+                matched)
+        """
+
+        matched_label_idxs = set()
+
+        if text:
+            text = text.lower()
+            goto = self.goto
+            failure = self.failure
+            outputs = self.outputs
+
+            state = 0
+            for end_idx, character in enumerate(text):
+                while state and character not in goto[state]:
+                    state = failure[state]
+                state = goto[state].get(character, 0)
+
+                for label_idx, term_length in outputs[state]:
+                    if label_idx in matched_label_idxs:
+                        continue
+                    elif self.is_word_match(text, end_idx - term_length + 1, end_idx):
+                        matched_label_idxs.add(label_idx)
+
+        keyword_matches = {category: [] for category in self.categories}
+        for label_idx, (category, label) in enumerate(self.labels):
+            if label_idx in matched_label_idxs:
+                keyword_matches[category].append(label)
+
+        return keyword_matches
+
+    def is_word_match(self, text, start_idx, end_idx):
+        """
+        Purpose:
+            Check a term found in a text starts (and, with match_whole_words, ends)
+            on a word boundary
+        Args:
+            text (String): Lowercased text the term was found in
+            start_idx (Int): Index of the first character of the term
+            end_idx (Int): Index of the last character of the term
+        Returns:
+            is_word_match (Boolean): Whether the term counts as a match
+        """
+
+        if start_idx > 0 and text[start_idx - 1].isalnum():
+            return False
+        elif not self.match_whole_words:
+            return True
+
+        return end_idx + 1 >= len(text) or not text[end_idx + 1].isalnum()
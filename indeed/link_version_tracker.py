@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        The LinkVersionTracker class is responsible for learning which versions of
+        the job details URL Indeed.com answers, so they can be probed most likely
+        first.
+"""
+
+# Python Library Imports
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+
+
+###
+# Class Definition
+###
+
+
+class LinkVersionTracker(object):
+    """
+        LinkVersionTracker Class. Counts how often each link version returned a job
+        and remembers the link version that worked for each job. Can be persisted
+        to a JSON file between runs
+    """
+
+    ###
+    # Class Lifecycle Methods
+    ###
+
+    def __init__(self, link_versions, stats_file=None, max_remembered_jobs=50000):
+        """
+        Purpose:
+            Initilize the LinkVersionTracker Class.
+        Args:
+            link_versions (List of Strings): Link versions in their default order
+            stats_file (String): JSON file to load and save the stats with. Stats
+                are kept in memory only if not provided
+            max_remembered_jobs (Int): Max number of jobs to remember the working
+                link version for (oldest are forgotten first)
+        Returns:
+            N/A
+        """
+
+        self.link_versions = list(link_versions)
+        self.stats_file = stats_file
+        self.max_remembered_jobs = max_remembered_jobs
+
+        self.lock = threading.Lock()
+        self.success_counts = {link_version: 0 for link_version in link_versions}
+        self.job_link_versions = OrderedDict()
+
+        if self.stats_file:
+            self.load()
+
+    ###
+    # Tracking Functions
+    ###
+
+    def get_ordered_link_versions(self, job_id=None):
+        """
+        Purpose:
+            Get the link versions to probe, most likely to succeed first. The link
+            version that worked for the job before (if any) is always first
+        Args:
+            job_id (String): The unqiue job_id from Indeed
+        Returns:
+            link_versions (List of Strings): Link versions in the order to probe
+        """
+
+        with self.lock:
+            link_versions = sorted(
+                self.link_versions,
+                key=lambda link_version: -self.success_counts[link_version],
+            )
+            known_link_version = self.job_link_versions.get(job_id)
+
+        if known_link_version in link_versions:
+            link_versions.remove(known_link_version)
+            link_versions.insert(0, known_link_version)
+
+        return link_versions
+
+    def record_success(self, job_id, link_version):
+        """
+        Purpose:
+            Record that a link version returned the job details for a job
+        Args:
+            job_id (String): The unqiue job_id from Indeed
+            link_version (String): Link version that returned the job
+        Returns:
+            N/A
+        """
+
+        with self.lock:
+            self.success_counts[link_version] =\
+                self.success_counts.get(link_version, 0) + 1
+
+            self.job_link_versions.pop(job_id, None)
+            self.job_link_versions[job_id] = link_version
+            while len(self.job_link_versions) > self.max_remembered_jobs:
+                self.job_link_versions.popitem(last=False)
+
+    ###
+    # Persistence Functions
+    ###
+
+    def load(self):
+        """
+        Purpose:
+            Load the stats from the stats file (if it exists)
+        Args:
+            N/A
+        Returns:
+            N/A
+        """
+
+        if not os.path.exists(self.stats_file):
+            logging.info(f"No Link Version Stats Found At {self.stats_file}")
+            return
+
+        try:
+            with open(self.stats_file, "r") as stats_file:
+                stats = json.load(stats_file)
+        except Exception as err:
+            logging.exception(f"Failed to Load Link Version Stats: {err}")
+            return
+
+        with self.lock:
+            for link_version, success_count in stats["success_counts"].items():
+                if link_version in self.success_counts:
+                    self.success_counts[link_version] = success_count
+            for job_id, link_version in stats["job_link_versions"]:
+                self.job_link_versions[job_id] = link_version
+
+    def save(self):
+        """
+        Purpose:
+            Save the stats to the stats file
+        Args:
+            N/A
+        Returns:
+            N/A
+        """
+
+        if not self.stats_file:
+            return
+
+        with self.lock:
+            stats = {
+                "success_counts": dict(self.success_counts),
+                "job_link_versions": list(self.job_link_versions.items()),
+            }
+
+        stats_dir = os.path.dirname(self.stats_file)
+        if stats_dir:
+            os.makedirs(stats_dir, exist_ok=True)
+
+        with open(self.stats_file, "w") as stats_file:
+            json.dump(stats, stats_file)
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        The RateLimiter class is responsible for pacing every request to Indeed.com
+        (a token bucket shared across threads) and backing off when Indeed.com
+        starts throttling.
+"""
+
+# Python Library Imports
+import logging
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+
+###
+# Class Definition
+###
+
+
+class RateLimiter(object):
+    """
+        RateLimiter Class. Token bucket limiting requests per second (with a burst
+        allowance). The rate is halved every time a request is throttled and
+        recovers gradually with successful requests. Retries of throttled requests
+        are paced with exponential backoff plus jitter and capped by a retry budget
+    """
+
+    ###
+    # Class Lifecycle Methods
+    ###
+
+    def __init__(
+        self,
+        requests_per_second=5.0,
+        burst=10,
+        min_requests_per_second=0.2,
+        max_retries=4,
+        base_backoff=1.0,
+        max_backoff=60.0,
+        retry_budget_ratio=0.1,
+        min_retry_budget=10,
+    ):
+        """
+        Purpose:
+            Initilize the RateLimiter Class.
+        Args:
+            requests_per_second (Float): Sustained requests per second allowed
+            burst (Int): Max number of requests allowed back to back
+            min_requests_per_second (Float): Floor the rate is never throttled below
+            max_retries (Int): Max number of times a single throttled request is
+                retried
+            base_backoff (Float): Seconds to back off after the first throttle
+                (doubled every retry)
+            max_backoff (Float): Max seconds to back off between retries
+            retry_budget_ratio (Float): Retries earned for every request sent
+            min_retry_budget (Int): Retries available before any are earned
+        Returns:
+            N/A
+        """
+        logging.info(
+            f"Initializing RateLimiter ({requests_per_second} requests/second, "
+            f"burst of {burst})"
+        )
+
+        self.max_requests_per_second = requests_per_second
+        self.min_requests_per_second = min_requests_per_second
+        self.burst = burst
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.retry_budget_ratio = retry_budget_ratio
+
+        self.lock = threading.Lock()
+        self.requests_per_second = requests_per_second
+        self.tokens = float(burst)
+        self.last_refill = time.monotonic()
+        self.paused_until = 0.0
+        self.retry_budget = float(min_retry_budget)
+
+    ###
+    # Pacing Functions
+    ###
+
+    def acquire(self):
+        """
+        Purpose:
+            Block until a request is allowed to be sent
+        Args:
+            N/A
+        Returns:
+            N/A
+        """
+
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.refill(now)
+
+                if now >= self.paused_until and self.tokens >= 1:
+                    self.tokens -= 1
+                    self.retry_budget += self.retry_budget_ratio
+                    return
+
+                wait_seconds = max(
+                    self.paused_until - now,
+                    (1 - self.tokens) / self.requests_per_second,
+                )
+
+            time.sleep(wait_seconds)
+
+    def refill(self, now):
+        """
+        Purpose:
+            Add the tokens earned since the last refill (caller holds the lock)
+        Args:
+            now (Float): Current time.monotonic()
+        Returns:
+            N/A
+        """
+
+        self.tokens = min(
+            self.burst,
+            self.tokens + (now - self.last_refill) * self.requests_per_second,
+        )
+        self.last_refill = now
+
+    def record_success(self):
+        """
+        Purpose:
+            Recover the rate after a request that was not throttled
+        Args:
+            N/A
+        Returns:
+            N/A
+        """
+
+        with self.lock:
+            self.requests_per_second = min(
+                self.max_requests_per_second,
+                self.requests_per_second + self.max_requests_per_second * 0.05,
+            )
+
+    def record_throttle(self, retry_after=None):
+        """
+        Purpose:
+            Slow down after a throttled request. The rate is halved and, if
+            Indeed.com said when to retry, every request waits until then
+        Args:
+            retry_after (Float): Seconds Indeed.com asked to wait (Retry-After)
+        Returns:
+            N/A
+        """
+
+        with self.lock:
+            self.requests_per_second = max(
+                self.min_requests_per_second, self.requests_per_second / 2
+            )
+            if retry_after:
+                self.paused_until =\
+                    max(self.paused_until, time.monotonic() + retry_after)
+
+        logging.warning(
+            "Throttled by Indeed.com, slowing to "
+            f"{self.requests_per_second:.2f} requests/second"
+        )
+
+    ###
+    # Retry Functions
+    ###
+
+    def spend_retry(self):
+        """
+        Purpose:
+            Take a retry from the retry budget
+        Args:
+            N/A
+        Returns:
+            retry_allowed (Boolean): Whether the budget had a retry left
+        """
+
+        with self.lock:
+            if self.retry_budget < 1:
+                return False
+            self.retry_budget -= 1
+            return True
+
+    def get_backoff_seconds(self, attempt, retry_after=None):
+        """
+        Purpose:
+            Get how long to wait before retrying a throttled request: exponential
+            backoff with full jitter, but never less than Retry-After
+        Args:
+            attempt (Int): Number of retries already made for the request
+            retry_after (Float): Seconds Indeed.com asked to wait (Retry-After)
+        Returns:
+            backoff_seconds (Float): Seconds to wait before retrying
+        """
+
+        backoff_cap = min(self.max_backoff, self.base_backoff * (2 ** attempt))
+        backoff_seconds = random.uniform(0, backoff_cap)
+
+        return max(backoff_seconds, retry_after or 0)
+
+    @staticmethod
+    def parse_retry_after(retry_after_header):
+        """
+        Purpose:
+            Parse a Retry-After header (either seconds or an HTTP date)
+        Args:
+            retry_after_header (String): Value of the Retry-After header
+        Returns:
+            retry_after (Float): Seconds to wait, None if missing or unparseable
+        """
+
+        if not retry_after_header:
+            return None
+
+        try:
+            return max(float(retry_after_header), 0.0)
+        except ValueError:
+            pass
+
+        try:
+            retry_after_datetime = parsedate_to_datetime(retry_after_header)
+        except (TypeError, ValueError):
+            return None
+        if retry_after_datetime.tzinfo is None:
+            retry_after_datetime = retry_after_datetime.replace(tzinfo=timezone.utc)
+
+        return max(
+            (retry_after_datetime - datetime.now(timezone.utc)).total_seconds(), 0.0
+        )
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        The ReplayTransport and RecordingTransport classes are responsible for
+        running the Indeed class without the network. RecordingTransport captures
+        the responses of a live run into a corpus on disk and ReplayTransport
+        answers requests from that corpus (or from the pages in indeed/cached_data
+        when no corpus has been recorded).
+"""
+
+# Python Library Imports
+import codecs
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+
+# Local Library Imports
+from .http_transport import HttpResponse
+from .response_cache import ResponseCache
+
+
+###
+# Globals
+###
+
+
+CACHED_DATA_DIR =\
+    os.path.join(os.path.dirname(os.path.realpath(__file__)), "cached_data")
+ESCAPE_REGEX = re.compile(rb"\\(.)", re.DOTALL)
+VALID_ESCAPE_CHARACTERS = b"\\'\"abfnrtv01234567xNuU\n"
+
+
+###
+# Class Definition
+###
+
+
+class ReplayTransport(object):
+    """
+        ReplayTransport Class. Answers requests from a recorded corpus of responses
+        instead of the network
+    """
+
+    ###
+    # Properties
+    ###
+
+    cached_data_files = {
+        "listing": f"{CACHED_DATA_DIR}/cached_indeed_job_listing.html",
+        "details": f"{CACHED_DATA_DIR}/cached_indeed_job_details.html",
+    }
+
+    ###
+    # Class Lifecycle Methods
+    ###
+
+    def __init__(self, corpus_dir=None, fallback_to_cached_data=None, latency=0):
+        """
+        Purpose:
+            Initilize the ReplayTransport Class.
+        Args:
+            corpus_dir (String): Directory of a corpus recorded with the
+                RecordingTransport. Only the cached_data pages are replayed if not
+                provided (or nothing has been recorded there yet)
+            fallback_to_cached_data (Boolean): Whether to answer URLs missing from
+                the corpus with the cached_data page of the same kind (listing or
+                details). Defaults to only when no corpus is loaded, so URLs
+                missing from a loaded corpus get a 404
+            latency (Float): Seconds to wait before answering each request, to
+                approximate a network round trip when benchmarking
+        Returns:
+            N/A
+        """
+        logging.info(f"Initializing ReplayTransport (corpus_dir={corpus_dir})")
+
+        self.corpus_dir = corpus_dir
+        self.latency = latency
+
+        self.corpus_index = {}
+        if self.corpus_dir:
+            self.corpus_index = load_corpus_index(self.corpus_dir)
+
+        if fallback_to_cached_data is None:
+            fallback_to_cached_data = not self.corpus_index
+        self.fallback_to_cached_data = fallback_to_cached_data
+
+        self.cached_data_html = {}
+        if self.fallback_to_cached_data:
+            for url_kind, cached_data_file in self.cached_data_files.items():
+                self.cached_data_html[url_kind] =\
+                    load_cached_data_html(cached_data_file)
+
+    def close(self):
+        """
+        Purpose:
+            Nothing to release, exists so transports are interchangeable
+        Args:
+            N/A
+        Returns:
+            N/A
+        """
+        pass
+
+    ###
+    # Request Functions
+    ###
+
+    def get(self, url, headers=None):
+        """
+        Purpose:
+            Answer a GET for a URL from the corpus
+        Args:
+            url (String): URL to request
+            headers (Dict): Ignored, exists so transports are interchangeable
+        Returns:
+            response (HttpResponse Obj): Status, headers, and body of the response
+        """
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        recorded_response = self.corpus_index.get(ResponseCache.normalize_url(url))
+        if recorded_response:
+            response_file = os.path.join(
+                self.corpus_dir, recorded_response["response_file"]
+            )
+            with open(response_file, "r", encoding="utf-8") as response_fh:
+                text = response_fh.read()
+            return HttpResponse(url, recorded_response["status_code"], text=text)
+
+        cached_data_html = self.cached_data_html.get(ResponseCache.get_url_kind(url))
+        if cached_data_html:
+            return HttpResponse(url, 200, text=cached_data_html)
+
+        logging.debug(f"No Recorded Response for URL: {url}")
+        return HttpResponse(url, 404, text="")
+
+
+class RecordingTransport(object):
+    """
+        RecordingTransport Class. Wraps another transport and records every
+        response it returns into a corpus the ReplayTransport can answer from
+    """
+
+    ###
+    # Class Lifecycle Methods
+    ###
+
+    def __init__(self, transport, corpus_dir):
+        """
+        Purpose:
+            Initilize the RecordingTransport Class.
+        Args:
+            transport (HttpTransport Obj): Transport to make the live requests with
+            corpus_dir (String): Directory to record the corpus into (added to if
+                a corpus already exists there)
+        Returns:
+            N/A
+        """
+        logging.info(f"Initializing RecordingTransport (corpus_dir={corpus_dir})")
+
+        self.transport = transport
+        self.corpus_dir = corpus_dir
+
+        os.makedirs(self.corpus_dir, exist_ok=True)
+        self.lock = threading.Lock()
+        self.corpus_index = load_corpus_index(self.corpus_dir)
+
+    def close(self):
+        """
+        Purpose:
+            Write the corpus index and close the wrapped transport
+        Args:
+            N/A
+        Returns:
+            N/A
+        """
+
+        with self.lock:
+            corpus_index = dict(self.corpus_index)
+
+        with open(get_corpus_index_file(self.corpus_dir), "w") as corpus_index_fh:
+            json.dump(corpus_index, corpus_index_fh, indent=2, sort_keys=True)
+
+        self.transport.close()
+
+    def get_transfer_stats(self):
+        """
+        Purpose:
+            Get the transfer stats of the wrapped transport
+        Args:
+            N/A
+        Returns:
+            transfer_stats (Dict): Transfer stats of the wrapped transport
+        """
+        return self.transport.get_transfer_stats()
+
+    ###
+    # Request Functions
+    ###
+
+    def get(self, url, headers=None):
+        """
+        Purpose:
+            GET a URL through the wrapped transport and record the response
+        Args:
+            url (String): URL to request
+            headers (Dict): Headers to send with the request
+        Returns:
+            response (HttpResponse Obj): Status, headers, and body of the response
+        """
+
+        response = self.transport.get(url, headers=headers)
+
+        normalized_url = ResponseCache.normalize_url(url)
+        response_file =\
+            f"{hashlib.sha256(normalized_url.encode('utf-8')).hexdigest()}.html"
+        with open(
+            os.path.join(self.corpus_dir, response_file), "w", encoding="utf-8"
+        ) as response_fh:
+            response_fh.write(response.text or "")
+
+        with self.lock:
+            self.corpus_index[normalized_url] = {
+                "status_code": response.status_code,
+                "response_file": response_file,
+            }
+
+        return response
+
+
+###
+# Corpus Helpers
+###
+
+
+def get_corpus_index_file(corpus_dir):
+    """
+    Purpose:
+        Get the path of the index of a recorded corpus
+    Args:
+        corpus_dir (String): Directory of the corpus
+    Returns:
+        corpus_index_file (String): Path of the corpus index
+    """
+
+    return os.path.join(corpus_dir, "index.json")
+
+
+def load_corpus_index(corpus_dir):
+    """
+    Purpose:
+        Load the index of a recorded corpus
+    Args:
+        corpus_dir (String): Directory of the corpus
+    Returns:
+        corpus_index (Dict of Dicts): Status code and response file of each
+            recorded URL, keyed by normalized URL
+    """
+
+    corpus_index_file = get_corpus_index_file(corpus_dir)
+    if not os.path.exists(corpus_index_file):
+        return {}
+
+    with open(corpus_index_file, "r") as corpus_index_fh:
+        return json.load(corpus_index_fh)
+
+
+def load_cached_data_html(cached_data_file):
+    """
+    Purpose:
+        Load one of the pages in indeed/cached_data. The pages were saved with
+        their bytes escaped (literal \\n, \\xNN, etc.), so they are unescaped back
+        into the HTML Indeed.com sent
+    Args:
+        cached_data_file (String): Path of the cached page
+    Returns:
+        cached_data_html (String): HTML of the page
+    """
+
+    with open(cached_data_file, "rb") as cached_data_fh:
+        escaped_html = cached_data_fh.read()
+
+    # Backslashes Not Starting An Escape (e.g. "\ ") Are Kept As Is, Doubling
+    # Them First So unicode_escape Doesn't Warn About Them
+    escaped_html = ESCAPE_REGEX.sub(
+        lambda escape_match: escape_match.group(0)
+        if escape_match.group(1) in VALID_ESCAPE_CHARACTERS
+        else b"\\" + escape_match.group(0),
+        escaped_html,
+    )
+
+    return codecs.decode(escaped_html, "unicode_escape")\
+        .encode("latin-1")\
+        .decode("utf-8", errors="replace")
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        The ResponseCache class is responsible for keeping the bodies of responses
+        from Indeed.com on disk so re-runs (and overlapping searches) can reuse them
+        instead of fetching them again.
+"""
+
+# Python Library Imports
+import gzip
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+
+###
+# Class Definition
+###
+
+
+class ResponseCache(object):
+    """
+        ResponseCache Class. Stores gzip compressed response bodies on disk keyed
+        by normalized URL, expiring them with a TTL per kind of page and evicting
+        the least recently used bodies once the cache grows past its size cap
+    """
+
+    ###
+    # Properties
+    ###
+
+    cache_file_extension = ".html.gz"
+
+    ###
+    # Class Lifecycle Methods
+    ###
+
+    def __init__(
+        self,
+        cache_dir,
+        listing_ttl=60 * 60,
+        details_ttl=7 * 24 * 60 * 60,
+        max_size_bytes=1024 * 1024 * 1024,
+    ):
+        """
+        Purpose:
+            Initilize the ResponseCache Class.
+        Args:
+            cache_dir (String): Directory to store the cached responses in
+            listing_ttl (Int): Seconds a job listings page is reused for
+            details_ttl (Int): Seconds a job details page is reused for
+            max_size_bytes (Int): Max size of the cache on disk (compressed)
+        Returns:
+            N/A
+        """
+        logging.info(f"Initializing ResponseCache in {cache_dir}")
+
+        self.cache_dir = cache_dir
+        self.ttls = {
+            "listing": listing_ttl,
+            "details": details_ttl,
+        }
+        self.max_size_bytes = max_size_bytes
+
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        # Cache files (and their size) from least to most recently used
+        self.cache_files = OrderedDict()
+        self.cache_size_bytes = 0
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.load_cache_files()
+
+    def load_cache_files(self):
+        """
+        Purpose:
+            Index the cache files already on disk, least recently used first
+        Args:
+            N/A
+        Returns:
+            N/A
+        """
+
+        cache_files = []
+        for cache_subdir, _, filenames in os.walk(self.cache_dir):
+            for filename in filenames:
+                if not filename.endswith(self.cache_file_extension):
+                    continue
+                cache_file = os.path.join(cache_subdir, filename)
+                cache_file_stat = os.stat(cache_file)
+                cache_files.append(
+                    (cache_file_stat.st_atime, cache_file, cache_file_stat.st_size)
+                )
+
+        for _, cache_file, cache_file_size in sorted(cache_files):
+            self.cache_files[cache_file] = cache_file_size
+            self.cache_size_bytes += cache_file_size
+
+    ###
+    # Cache Functions
+    ###
+
+    def get(self, url):
+        """
+        Purpose:
+            Get the cached body of a URL
+        Args:
+            url (String): URL that was requested
+        Returns:
+            text (String): Cached body of the response, None if the URL is not
+                cached or has expired
+        """
+
+        cache_file = self.get_cache_file(url)
+        ttl = self.ttls[self.get_url_kind(url)]
+
+        try:
+            stored_at = os.path.getmtime(cache_file)
+            if time.time() - stored_at > ttl:
+                self.remove(cache_file)
+                text = None
+            else:
+                with gzip.open(cache_file, "rt", encoding="utf-8") as cache_fh:
+                    text = cache_fh.read()
+                # Bump the access time (used for LRU) without touching the TTL
+                os.utime(cache_file, (time.time(), stored_at))
+        except (OSError, EOFError):
+            text = None
+
+        with self.lock:
+            if text is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                if cache_file in self.cache_files:
+                    self.cache_files.move_to_end(cache_file)
+
+        return text
+
+    def put(self, url, text):
+        """
+        Purpose:
+            Store the body of a response for a URL
+        Args:
+            url (String): URL that was requested
+            text (String): Body of the response
+        Returns:
+            N/A
+        """
+
+        cache_file = self.get_cache_file(url)
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+
+        # Write To A Temporary File First So Readers Never See A Partial Body
+        temp_cache_file = f"{cache_file}.{threading.get_ident()}.tmp"
+        with gzip.open(temp_cache_file, "wt", encoding="utf-8") as cache_fh:
+            cache_fh.write(text)
+        os.replace(temp_cache_file, cache_file)
+
+        cache_file_size = os.path.getsize(cache_file)
+        with self.lock:
+            self.cache_size_bytes -= self.cache_files.pop(cache_file, 0)
+            self.cache_files[cache_file] = cache_file_size
+            self.cache_size_bytes += cache_file_size
+
+        self.evict()
+
+    def remove(self, cache_file):
+        """
+        Purpose:
+            Remove a cached response from disk
+        Args:
+            cache_file (String): Path of the cached response
+        Returns:
+            N/A
+        """
+
+        with self.lock:
+            self.cache_size_bytes -= self.cache_files.pop(cache_file, 0)
+
+        try:
+            os.remove(cache_file)
+        except OSError:
+            pass
+
+    def evict(self):
+        """
+        Purpose:
+            Remove the least recently used responses until the cache is within its
+            size cap
+        Args:
+            N/A
+        Returns:
+            N/A
+        """
+
+        while True:
+            with self.lock:
+                if self.cache_size_bytes <= self.max_size_bytes:
+                    return
+                cache_file, _ = next(iter(self.cache_files.items()))
+
+            logging.debug(f"Evicting Cached Response {cache_file}")
+            self.remove(cache_file)
+
+    def get_stats(self):
+        """
+        Purpose:
+            Get the hit/miss counters and size of the cache
+        Args:
+            N/A
+        Returns:
+            stats (Dict): hits, misses, cached_responses, and size_bytes of the cache
+        """
+
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "cached_responses": len(self.cache_files),
+                "size_bytes": self.cache_size_bytes,
+            }
+
+    ###
+    # Key Functions
+    ###
+
+    def get_cache_file(self, url):
+        """
+        Purpose:
+            Get the path a URL's response is cached at
+        Args:
+            url (String): URL that was requested
+        Returns:
+            cache_file (String): Path of the cached response
+        """
+
+        cache_key = hashlib.sha256(
+            ResponseCache.normalize_url(url).encode("utf-8")
+        ).hexdigest()
+
+        return os.path.join(
+            self.cache_dir, cache_key[:2], f"{cache_key}{self.cache_file_extension}"
+        )
+
+    @staticmethod
+    def normalize_url(url):
+        """
+        Purpose:
+            Normalize a URL so equivalent URLs share a cache entry (lowercase scheme
+            and host, sorted query parameters, no fragment)
+        Args:
+            url (String): URL to normalize
+        Returns:
+            normalized_url (String): Normalized URL
+        """
+
+        split_url = urlsplit(url)
+        query = urlencode(sorted(parse_qsl(split_url.query, keep_blank_values=True)))
+
+        return urlunsplit((
+            split_url.scheme.lower(),
+            split_url.netloc.lower(),
+            split_url.path,
+            query,
+            "",
+        ))
+
+    @staticmethod
+    def get_url_kind(url):
+        """
+        Purpose:
+            Get what kind of page a URL is for (job listings or job details)
+        Args:
+            url (String): URL that was requested
+        Returns:
+            url_kind (String): "details" for job details pages, otherwise "listing"
+        """
+
+        path = urlsplit(url).path
+
+        if path.startswith("/viewjob") or path.startswith("/cmp/"):
+            return "details"
+
+        return "listing"
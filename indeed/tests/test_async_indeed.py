@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        Tests for the AsyncIndeed class, run against a local HTTP server serving
+        the pages in indeed/cached_data
+"""
+
+# Python Library Imports
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Third Party Imports
+import pytest
+
+# Local Library Imports
+from indeed.async_indeed import AsyncIndeed
+from indeed.http_transport import HttpTransport
+from indeed.indeed import Indeed
+from indeed.link_version_tracker import LinkVersionTracker
+from indeed.replay_transport import ReplayTransport, load_cached_data_html
+
+
+###
+# Test Server
+###
+
+
+# Jobs on the cached listing page that pass a 7 day window (the cached details
+# page was posted 6 days ago, so every card not ruled out by its date is kept)
+EXPECTED_JOB_IDS = {
+    "f56b8108fb86aaf7",
+    "fa309fa30e9a34df",
+    "355d8414c9a71d12",
+    "a65a3286ea387c6b",
+    "5df575e910c019ac",
+    "f435d92da84fa684",
+    "412d47b918b70c05",
+    "9c7db7badee4401",
+    "10b2106b4afc2fab",
+}
+
+
+class CachedDataHandler(BaseHTTPRequestHandler):
+    """
+        Serves the cached listing page for searches and the cached details page
+        for every job details URL. Paths of the searches are kept in order
+    """
+
+    requested_listing_paths = []
+
+    cached_data_html = {
+        page_kind: load_cached_data_html(cached_data_file).encode("utf-8")
+        for page_kind, cached_data_file in ReplayTransport.cached_data_files.items()
+    }
+
+    def do_GET(self):
+        if self.path.startswith("/jobs"):
+            self.requested_listing_paths.append(self.path)
+            body = self.cached_data_html["listing"]
+        elif self.path.startswith(("/viewjob", "/cmp/")):
+            body = self.cached_data_html["details"]
+        else:
+            self.send_error(404)
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def cached_data_server(monkeypatch):
+    """
+    Purpose:
+        Start the cached data server in a background thread and point Indeed at
+        it, with a fresh transport, registry, and link version tracker
+    Returns:
+        server (ThreadingHTTPServer Obj): The running server
+    """
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), CachedDataHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    monkeypatch.setattr(Indeed, "base_url", f"http://127.0.0.1:{server.server_port}")
+    monkeypatch.setattr(Indeed, "response_cache", None)
+    monkeypatch.setattr(Indeed, "job_details_registry", None)
+    monkeypatch.setattr(
+        Indeed, "link_version_tracker", LinkVersionTracker(Indeed.link_versions)
+    )
+    monkeypatch.setattr(CachedDataHandler, "requested_listing_paths", [])
+    Indeed.set_transport(HttpTransport(max_retries=0))
+    try:
+        yield server
+    finally:
+        Indeed.close_transport()
+        server.shutdown()
+        server.server_close()
+
+
+###
+# Tests
+###
+
+
+def test_get_job_listings(cached_data_server):
+    """
+    Purpose:
+        get_job_listings returns the jobs on the page within the posting window,
+        with their details, sorted by company
+    """
+
+    async_indeed = AsyncIndeed()
+    try:
+        job_listings = asyncio.run(
+            async_indeed.get_job_listings("a", "19103", max_days_since_posting=7)
+        )
+    finally:
+        async_indeed.close()
+
+    assert {job_listing["job_id"] for job_listing in job_listings} ==\
+        EXPECTED_JOB_IDS
+    assert [job_listing["company"] for job_listing in job_listings] ==\
+        sorted(job_listing["company"] for job_listing in job_listings)
+    for job_listing in job_listings:
+        assert job_listing["job_type"] == "Full Time"
+        assert job_listing["job_posting_timeframe"] == "6 days ago"
+        assert job_listing["job_details_url"].startswith(Indeed.base_url)
+
+
+def test_get_job_listings_applies_job_listing_filters(cached_data_server):
+    """
+    Purpose:
+        Cards failing a job listing filter are dropped before their details are
+        fetched
+    """
+
+    async_indeed = AsyncIndeed()
+    try:
+        job_listings = asyncio.run(
+            async_indeed.get_job_listings(
+                "a",
+                "19103",
+                max_days_since_posting=7,
+                job_listing_filters=[
+                    lambda job_listing: job_listing["company"] != "EMSL"
+                ],
+            )
+        )
+    finally:
+        async_indeed.close()
+
+    assert {job_listing["job_id"] for job_listing in job_listings} ==\
+        EXPECTED_JOB_IDS - {"f435d92da84fa684"}
+
+
+def test_iter_job_listings(cached_data_server):
+    """
+    Purpose:
+        iter_job_listings yields each job once, even though every page of the
+        search returns the same cached listing page
+    """
+
+    async def collect_job_listings(async_indeed):
+        return [
+            job_listing
+            async for job_listing in async_indeed.iter_job_listings(
+                "a", "19103", max_days_since_posting=7, max_pages_without_new_jobs=2
+            )
+        ]
+
+    async_indeed = AsyncIndeed()
+    try:
+        job_listings = asyncio.run(collect_job_listings(async_indeed))
+    finally:
+        async_indeed.close()
+
+    job_ids = [job_listing["job_id"] for job_listing in job_listings]
+    assert len(job_ids) == len(set(job_ids))
+    assert set(job_ids) == EXPECTED_JOB_IDS
+
+    # Page 1 Had New Jobs, So Page 2 Is Tried Until It Gives Up
+    assert [
+        requested_listing_path.rsplit("&start=", 1)[1]
+        for requested_listing_path in CachedDataHandler.requested_listing_paths
+    ] == ["0", "18", "18"]
+
+
+def test_indeed_iter_job_listings_retries_page(cached_data_server, monkeypatch):
+    """
+    Purpose:
+        Indeed.iter_job_listings fetches a page again when it yields no new job
+        instead of moving on to the next page
+    """
+
+    monkeypatch.setattr(Indeed, "listing_pages_to_prefetch", 0)
+
+    job_listings = list(Indeed.iter_job_listings(
+        "a", "19103", max_days_since_posting=7, max_pages_without_new_jobs=2
+    ))
+
+    assert {job_listing["job_id"] for job_listing in job_listings} ==\
+        EXPECTED_JOB_IDS
+    assert [
+        requested_listing_path.rsplit("&start=", 1)[1]
+        for requested_listing_path in CachedDataHandler.requested_listing_paths
+    ] == ["0", "18", "18"]
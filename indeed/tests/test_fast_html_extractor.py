@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        Tests that fast_html_extractor pulls the same job details sections out of
+        the page in indeed/cached_data as Beautiful Soup, and gives up on markup
+        it can't read exactly
+"""
+
+# Third Party Imports
+import pytest
+
+# Local Library Imports
+from indeed import fast_html_extractor
+from indeed.indeed import Indeed
+from indeed.replay_transport import ReplayTransport, load_cached_data_html
+
+
+###
+# Helpers
+###
+
+
+RAW_JOB_DETAILS_HTML =\
+    load_cached_data_html(ReplayTransport.cached_data_files["details"])
+JOB_DESCRIPTION_TAG =\
+    '<div id="jobDescriptionText" class="jobsearch-jobDescriptionText">'
+
+
+def add_to_job_description(markup):
+    """
+    Purpose:
+        Get the cached job details page with markup added to the start of the
+        job description
+    Args:
+        markup (String): HTML to add
+    Returns:
+        raw_job_details_html (String): The changed page
+    """
+
+    assert JOB_DESCRIPTION_TAG in RAW_JOB_DETAILS_HTML
+
+    return RAW_JOB_DETAILS_HTML.replace(
+        JOB_DESCRIPTION_TAG, f"{JOB_DESCRIPTION_TAG}{markup}", 1
+    )
+
+
+def parse_job_details(monkeypatch, raw_job_details_html, use_fast_path_extraction):
+    """
+    Purpose:
+        Parse a job details page with html.parser, with or without the fast path
+    Args:
+        raw_job_details_html (String): Raw HTML of the job details page
+        use_fast_path_extraction (Boolean): Whether to try the fast path first
+    Returns:
+        job_details (Dict): Parsed job details, without job_posting_datetime
+            (which depends on when it was parsed)
+    """
+
+    monkeypatch.setattr(Indeed, "parser_backend", "html.parser")
+    monkeypatch.setattr(Indeed, "use_fast_path_extraction", use_fast_path_extraction)
+
+    job_details = Indeed.parse_job_details_html(raw_job_details_html)
+    job_details.pop("job_posting_datetime")
+
+    return job_details
+
+
+###
+# Tests
+###
+
+
+def test_sections_match_beautiful_soup(monkeypatch):
+    """
+    Purpose:
+        Every section of the cached page matches the Beautiful Soup fallback
+    """
+
+    monkeypatch.setattr(Indeed, "parser_backend", "html.parser")
+
+    job_details_sections =\
+        fast_html_extractor.extract_job_details_sections(RAW_JOB_DETAILS_HTML)
+
+    assert job_details_sections is not None
+    assert job_details_sections ==\
+        Indeed.parse_job_details_sections_html(RAW_JOB_DETAILS_HTML)
+
+
+def test_job_details_match_dom_parse(monkeypatch):
+    """
+    Purpose:
+        parse_job_details_html gives the same job details with and without the
+        fast path
+    """
+
+    assert parse_job_details(monkeypatch, RAW_JOB_DETAILS_HTML, True) ==\
+        parse_job_details(monkeypatch, RAW_JOB_DETAILS_HTML, False)
+
+
+@pytest.mark.parametrize("markup", [
+    "<!-- note -->",
+    "<![CDATA[note]]>",
+    "<script>var note = 1;</script>",
+    "<style>p { margin: 0; }</style>",
+    "<textarea>note</textarea>",
+    "<pre>  note  </pre>",
+    "1 < 2",
+])
+def test_unsafe_markup_falls_back_to_dom(monkeypatch, markup):
+    """
+    Purpose:
+        Markup whose text is not simply its strings makes the fast path give up,
+        and parse_job_details_html still matches the DOM parse
+    """
+
+    raw_job_details_html = add_to_job_description(markup)
+
+    assert fast_html_extractor.extract_job_details_sections(
+        raw_job_details_html
+    ) is None
+    assert parse_job_details(monkeypatch, raw_job_details_html, True) ==\
+        parse_job_details(monkeypatch, raw_job_details_html, False)
+
+
+def test_missing_section_falls_back_to_dom():
+    """
+    Purpose:
+        A page missing one of the sections is left to Beautiful Soup
+    """
+
+    raw_job_details_html =\
+        RAW_JOB_DETAILS_HTML.replace("originalJobLinkContainer", "otherContainer")
+
+    assert fast_html_extractor.extract_job_details_sections(
+        raw_job_details_html
+    ) is None
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        Tests for the HttpTransport class, run against a local HTTP server
+"""
+
+# Python Library Imports
+import gzip
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+# Local Library Imports
+from indeed.http_transport import HttpTransport
+
+
+###
+# Test Server
+###
+
+
+RESPONSE_TEXT = "Administrative Assistant – Café Résumé"
+
+
+class ResponseHandler(BaseHTTPRequestHandler):
+    """
+        Serves RESPONSE_TEXT as UTF-8, with the Content-Type and Content-Encoding
+        picked by the request path
+    """
+
+    def do_GET(self):
+        body = RESPONSE_TEXT.encode("utf-8")
+        if self.path.startswith("/gzip"):
+            body = gzip.compress(body)
+
+        self.send_response(200)
+        if self.path.endswith("/charset"):
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+        if self.path.startswith("/gzip"):
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_server():
+    """
+    Purpose:
+        Start the test server on a free port in a background thread
+    Returns:
+        server (HTTPServer Obj): The running server
+    """
+
+    server = HTTPServer(("127.0.0.1", 0), ResponseHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    return server
+
+
+###
+# Tests
+###
+
+
+def test_get_decodes_body_without_charset():
+    """
+    Purpose:
+        A streamed 200 with no charset is decoded from its bytes instead of
+        re-reading the consumed body
+    """
+
+    server = start_server()
+    transport = HttpTransport()
+    try:
+        for path in ("/plain", "/plain/charset", "/gzip", "/gzip/charset"):
+            response = transport.get(f"http://127.0.0.1:{server.server_port}{path}")
+
+            assert response.status_code == 200
+            assert response.text == RESPONSE_TEXT
+    finally:
+        transport.close()
+        server.shutdown()
+
+
+def test_get_drops_oversized_response():
+    """
+    Purpose:
+        Responses past max_response_bytes have no text and are counted
+    """
+
+    server = start_server()
+    transport = HttpTransport(max_response_bytes=8)
+    try:
+        response = transport.get(f"http://127.0.0.1:{server.server_port}/plain")
+
+        assert response.status_code == 200
+        assert response.text is None
+        assert transport.get_transfer_stats()["oversized_responses"] == 1
+    finally:
+        transport.close()
+        server.shutdown()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        Tests for the shared state of the Indeed class (transport and parse pool)
+"""
+
+# Python Library Imports
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Local Library Imports
+from indeed import indeed
+from indeed.indeed import Indeed
+from indeed.replay_transport import ReplayTransport, load_cached_data_html
+
+
+###
+# Helpers
+###
+
+
+RAW_JOB_LISTING_HTML =\
+    load_cached_data_html(ReplayTransport.cached_data_files["listing"])
+RAW_JOB_DETAILS_HTML =\
+    load_cached_data_html(ReplayTransport.cached_data_files["details"])
+
+
+###
+# Tests
+###
+
+
+def test_get_transport_creates_one_transport(monkeypatch):
+    """
+    Purpose:
+        Concurrent fetches without a configured transport all share the single
+        transport created by the first of them
+    """
+
+    created_transports = []
+
+    class SlowTransport(object):
+        def __init__(self, **transport_settings):
+            time.sleep(0.05)
+            created_transports.append(self)
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(indeed, "HttpTransport", SlowTransport)
+    monkeypatch.setattr(Indeed, "transport", None)
+
+    start_barrier = threading.Barrier(8)
+
+    def get_transport():
+        start_barrier.wait()
+        return Indeed.get_transport()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        transports = list(executor.map(lambda _: get_transport(), range(8)))
+
+    assert len(created_transports) == 1
+    assert all(transport is created_transports[0] for transport in transports)
+
+
+def test_parse_pool_matches_parsing_in_thread(monkeypatch):
+    """
+    Purpose:
+        Pages parsed in the parse pool's spawned processes come back the same as
+        pages parsed in the fetching thread
+    """
+
+    monkeypatch.setattr(Indeed, "parser_backend", "lxml")
+
+    job_listings = Indeed.run_parse("parse_job_listings_html", RAW_JOB_LISTING_HTML)
+    job_details = Indeed.run_parse("parse_job_details_html", RAW_JOB_DETAILS_HTML)
+
+    Indeed.configure_parse_pool(parse_workers=2)
+    try:
+        assert Indeed.parse_executor._mp_context.get_start_method() == "spawn"
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            pooled_job_listings, pooled_job_details = executor.map(
+                Indeed.run_parse,
+                ["parse_job_listings_html", "parse_job_details_html"],
+                [RAW_JOB_LISTING_HTML, RAW_JOB_DETAILS_HTML],
+            )
+    finally:
+        Indeed.close_parse_pool()
+
+    assert len(job_listings) == 15
+    assert pooled_job_listings == job_listings
+    job_details.pop("job_posting_datetime")
+    pooled_job_details.pop("job_posting_datetime")
+    assert pooled_job_details == job_details
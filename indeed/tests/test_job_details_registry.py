@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        Tests for the JobDetailsRegistry class
+"""
+
+# Python Library Imports
+from unittest import mock
+
+# Local Library Imports
+from indeed.job_details_registry import JobDetailsRegistry
+
+
+###
+# Tests
+###
+
+
+def test_get_or_fetch_reuses_fetched_details():
+    """
+    Purpose:
+        A job fetched once is not fetched again
+    """
+
+    registry = JobDetailsRegistry()
+    fetch_job_details = mock.Mock(
+        return_value={"job_details_url": "https://www.indeed.com/viewjob?jk=e1"}
+    )
+
+    registry.get_or_fetch("1", fetch_job_details)
+    job_details = registry.get_or_fetch("1", fetch_job_details)
+
+    assert job_details["job_details_url"] == "https://www.indeed.com/viewjob?jk=e1"
+    assert fetch_job_details.call_count == 1
+    assert registry.get_stats() == {"fetches": 1, "hits": 1, "preloaded": 0}
+
+
+def test_get_or_fetch_retries_failed_fetch():
+    """
+    Purpose:
+        A fetch where no link version returned the job is not kept, so the next
+        request for the job fetches it again
+    """
+
+    registry = JobDetailsRegistry()
+    fetch_job_details = mock.Mock(side_effect=[
+        {"job_details_url": None},
+        {"job_details_url": "https://www.indeed.com/viewjob?jk=e1"},
+    ])
+
+    assert registry.get_or_fetch("1", fetch_job_details)["job_details_url"] is None
+    assert registry.get("1") is None
+    assert registry.get_or_fetch("1", fetch_job_details)["job_details_url"] ==\
+        "https://www.indeed.com/viewjob?jk=e1"
+    assert fetch_job_details.call_count == 2
+
+
+def test_add_skips_failed_fetch():
+    """
+    Purpose:
+        Details fetched outside of get_or_fetch are only kept if they succeeded
+    """
+
+    registry = JobDetailsRegistry()
+
+    registry.add("1", {"job_details_url": None})
+    registry.add("2", {"job_details_url": "https://www.indeed.com/viewjob?jk=e2"})
+
+    assert registry.get("1") is None
+    assert registry.get("2") is not None
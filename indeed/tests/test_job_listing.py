@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        Tests for the JobListing class
+"""
+
+# Python Library Imports
+import pickle
+from datetime import datetime
+
+# Third Party Imports
+import pytest
+
+# Local Library Imports
+from indeed.job_listing import JobListing
+
+
+###
+# Helpers
+###
+
+
+def build_job_listing(**job_fields):
+    """
+    Purpose:
+        Build a JobListing with a few fields filled in
+    Args:
+        job_fields (Kwargs): Fields to set on top of the defaults
+    Returns:
+        job_listing (JobListing Obj): The job
+    """
+
+    return JobListing(**{
+        "company": "EMSL",
+        "job_id": "f435d92da84fa684",
+        "job_title": "Administrative Assistant",
+        "job_board": "indeed",
+        "job_posting_datetime": datetime(2020, 1, 2, 3, 4, 5),
+        **job_fields,
+    })
+
+
+###
+# Tests
+###
+
+
+def test_dict_style_access():
+    """
+    Purpose:
+        Fields read like a dict, unset fields are None, and unknown fields raise
+        KeyError (or return the default from get)
+    """
+
+    job_listing = build_job_listing()
+
+    assert job_listing["company"] == "EMSL"
+    assert job_listing["job_salary"] is None
+    assert job_listing.get("company") == "EMSL"
+    assert job_listing.get("salary", "Unknown") == "Unknown"
+    assert "company" in job_listing
+    assert "salary" not in job_listing
+    with pytest.raises(KeyError):
+        job_listing["salary"]
+    with pytest.raises(KeyError):
+        job_listing["salary"] = "$40,000"
+
+
+def test_update_and_items():
+    """
+    Purpose:
+        update sets several fields, and items/keys/to_dict cover every field in
+        JobListing.fields order
+    """
+
+    job_listing = build_job_listing()
+    job_listing.update({"job_salary": "$40,000", "city": "Philadelphia"})
+
+    assert job_listing["job_salary"] == "$40,000"
+    assert job_listing["city"] == "Philadelphia"
+    assert job_listing.keys() == JobListing.fields
+    assert [field for field, _ in job_listing.items()] == list(JobListing.fields)
+    assert job_listing.to_dict()["city"] == "Philadelphia"
+    assert JobListing(**job_listing.to_dict()) == job_listing
+
+    with pytest.raises(KeyError):
+        job_listing.update({"salary": "$40,000"})
+
+
+def test_init_data_is_decoded_lazily():
+    """
+    Purpose:
+        init_data is stored as raw bytes and decoded when read
+    """
+
+    job_listing = build_job_listing()
+    assert job_listing["init_data"] == {}
+
+    job_listing["init_data"] = {"jobLocation": "Philadelphia, PA"}
+    assert job_listing.raw_init_data == b'{"jobLocation": "Philadelphia, PA"}'
+    assert job_listing["init_data"] == {"jobLocation": "Philadelphia, PA"}
+    assert job_listing.init_data == {"jobLocation": "Philadelphia, PA"}
+
+    job_listing["raw_init_data"] = b"{not json"
+    assert job_listing["init_data"] == {}
+
+    job_listing["init_data"] = {}
+    assert job_listing.raw_init_data is None
+
+
+def test_pickle_round_trip():
+    """
+    Purpose:
+        Jobs survive pickling (e.g. when sent to a process pool)
+    """
+
+    job_listing = build_job_listing(raw_init_data=b'{"a": 1}')
+
+    unpickled_job_listing = pickle.loads(pickle.dumps(job_listing))
+
+    assert unpickled_job_listing == job_listing
+    assert unpickled_job_listing["init_data"] == {"a": 1}
+
+
+def test_equality_and_hash():
+    """
+    Purpose:
+        Jobs are equal when every field matches, and hash by job board and ID
+        so they can be kept in sets
+    """
+
+    job_listing = build_job_listing()
+    same_job_listing = build_job_listing()
+    updated_job_listing = build_job_listing(job_salary="$40,000")
+
+    assert job_listing == same_job_listing
+    assert job_listing != updated_job_listing
+    assert hash(job_listing) == hash(updated_job_listing)
+    assert len({job_listing, same_job_listing, updated_job_listing}) == 2
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        Tests for the job listing card predicates and salary parsing
+"""
+
+# Third Party Imports
+import pytest
+
+# Local Library Imports
+from indeed import job_listing_filters
+from indeed.job_listing import JobListing
+
+
+###
+# Tests
+###
+
+
+@pytest.mark.parametrize("job_salary, annual_salary", [
+    ("$20 an hour", 41600),
+    ("$20 - $28 an hour", 58240),
+    ("$18.50 hourly", 38480),
+    ("$150 a day", 39000),
+    ("$900 a week", 46800),
+    ("$3,500 - $4,000 a month", 48000),
+    ("$45,000 a year", 45000),
+    ("$40,000 - $55,000 a year", 55000),
+    ("Up to $60,000 a year", 60000),
+])
+def test_parse_max_annual_salary(job_salary, annual_salary):
+    """
+    Purpose:
+        The top of the salary range is annualized by its pay period
+    """
+
+    assert job_listing_filters.parse_max_annual_salary(job_salary) == annual_salary
+
+
+@pytest.mark.parametrize("job_salary", [
+    None,
+    "",
+    "Competitive salary",
+    "$45,000",
+    "20 - 28 an hour",
+])
+def test_parse_max_annual_salary_unparseable(job_salary):
+    """
+    Purpose:
+        Salaries without a dollar amount or pay period can't be annualized
+    """
+
+    assert job_listing_filters.parse_max_annual_salary(job_salary) is None
+
+
+def test_min_annual_salary():
+    """
+    Purpose:
+        Jobs topping out below the minimum are dropped, while jobs without a
+        parseable salary are kept
+    """
+
+    job_listing_filter = job_listing_filters.min_annual_salary(50000)
+
+    assert job_listing_filter(JobListing(job_salary="$20 - $28 an hour"))
+    assert job_listing_filter(JobListing(job_salary="$50,000 a year"))
+    assert not job_listing_filter(JobListing(job_salary="$20 an hour"))
+    assert not job_listing_filter(JobListing(job_salary="$3,500 a month"))
+    assert job_listing_filter(JobListing(job_salary="Competitive salary"))
+    assert job_listing_filter(JobListing())
+
+
+def test_title_keywords():
+    """
+    Purpose:
+        Title keywords are case insensitive substrings, and jobs without a title
+        are kept by both predicates
+    """
+
+    exclude_filter =\
+        job_listing_filters.exclude_title_keywords(["Senior", " intern "])
+    require_filter =\
+        job_listing_filters.require_title_keywords(["assistant", "Receptionist"])
+
+    assert exclude_filter(JobListing(job_title="Administrative Assistant"))
+    assert not exclude_filter(JobListing(job_title="SENIOR Administrative Assistant"))
+    assert not exclude_filter(JobListing(job_title="Summer Internship"))
+    assert exclude_filter(JobListing())
+
+    assert require_filter(JobListing(job_title="Front Desk receptionist"))
+    assert not require_filter(JobListing(job_title="Office Manager"))
+    assert require_filter(JobListing())
+
+
+def test_exclude_companies():
+    """
+    Purpose:
+        Companies must match in full (ignoring case and surrounding whitespace),
+        and jobs without a company are kept
+    """
+
+    job_listing_filter =\
+        job_listing_filters.exclude_companies(["Staffing Co ", "emsl"])
+
+    assert not job_listing_filter(JobListing(company="EMSL"))
+    assert not job_listing_filter(JobListing(company=" staffing co"))
+    assert job_listing_filter(JobListing(company="EMSL Analytical"))
+    assert job_listing_filter(JobListing())
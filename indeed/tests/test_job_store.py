@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        Tests for the JobStore class
+"""
+
+# Python Library Imports
+import sqlite3
+from datetime import datetime
+
+# Third Party Imports
+import pytest
+
+# Local Library Imports
+from indeed import job_store
+from indeed.job_listing import JobListing
+from indeed.job_store import JobStore
+
+
+###
+# Helpers
+###
+
+
+@pytest.fixture
+def persistent_job_store(tmp_path):
+    """
+    Purpose:
+        Open a job store in a temporary directory
+    Returns:
+        persistent_job_store (JobStore Obj): The open job store
+    """
+
+    persistent_job_store = JobStore(str(tmp_path / "jobs.sqlite3"))
+    try:
+        yield persistent_job_store
+    finally:
+        persistent_job_store.close()
+
+
+def get_seen_at(persistent_job_store, job_id):
+    """
+    Purpose:
+        Get when a stored job was first and last seen
+    Args:
+        persistent_job_store (JobStore Obj): The open job store
+        job_id (String): The unqiue job_id of the job
+    Returns:
+        seen_at (Tuple of Strings): first_seen_at and last_seen_at
+    """
+
+    return persistent_job_store.connection.execute(
+        "SELECT first_seen_at, last_seen_at FROM job_listings WHERE job_id = ?",
+        (job_id,),
+    ).fetchone()
+
+
+###
+# Tests
+###
+
+
+def test_upsert_keeps_first_seen_at(persistent_job_store, monkeypatch):
+    """
+    Purpose:
+        A job found again is updated in place, keeping first_seen_at and moving
+        last_seen_at forward
+    """
+
+    seen_ats = iter([datetime(2020, 1, 1), datetime(2020, 1, 2)])
+
+    class SeenAtDatetime(datetime):
+        @classmethod
+        def now(cls):
+            return next(seen_ats)
+
+    monkeypatch.setattr(job_store, "datetime", SeenAtDatetime)
+
+    persistent_job_store.upsert_job_listings(
+        [JobListing(job_id="1", company="EMSL", job_salary="$40,000")],
+        job_board="indeed",
+        job_search="Administrative Assistant",
+    )
+    first_seen_at, last_seen_at = get_seen_at(persistent_job_store, "1")
+    assert first_seen_at == last_seen_at
+
+    persistent_job_store.upsert_job_listings(
+        [JobListing(job_id="1", company="EMSL", job_salary="$50,000")],
+        job_board="indeed",
+        job_search="Administrative Assistant",
+    )
+    updated_first_seen_at, updated_last_seen_at =\
+        get_seen_at(persistent_job_store, "1")
+
+    assert updated_first_seen_at == first_seen_at == "2020-01-01 00:00:00.000000"
+    assert updated_last_seen_at == "2020-01-02 00:00:00.000000"
+    assert persistent_job_store.get_stats() ==\
+        {"jobs": 1, "jobs_by_job_board": {"indeed": 1}}
+
+    job_listing, = persistent_job_store.query_job_listings(job_id="1")
+    assert job_listing["job_salary"] == "$50,000"
+    assert job_listing["job_board"] == "indeed"
+    assert job_listing["job_search"] == "Administrative Assistant"
+
+
+def test_upsert_skips_jobs_without_job_id(persistent_job_store):
+    """
+    Purpose:
+        Jobs without a job_id can't be keyed, so they are not stored
+    """
+
+    assert persistent_job_store.upsert_job_listings(
+        [JobListing(company="EMSL")], job_board="indeed"
+    ) == 0
+    assert persistent_job_store.get_stats()["jobs"] == 0
+
+
+def test_values_round_trip(persistent_job_store):
+    """
+    Purpose:
+        Datetimes, booleans, and raw_init_data bytes come back as they were stored
+    """
+
+    job_posting_datetime = datetime(2020, 1, 2, 3, 4, 5, 678901)
+    persistent_job_store.upsert_job_listings(
+        [
+            JobListing(
+                job_id="1",
+                easy_apply=True,
+                job_posting_datetime=job_posting_datetime,
+                raw_init_data=b'{"a": 1}',
+            ),
+            JobListing(job_id="2", easy_apply=False),
+        ],
+        job_board="indeed",
+    )
+
+    job_listing = persistent_job_store.query_job_listings(job_id="1")[0]
+    assert job_listing["easy_apply"] is True
+    assert job_listing["job_posting_datetime"] == job_posting_datetime
+    assert job_listing["init_data"] == {"a": 1}
+
+    job_listing = persistent_job_store.query_job_listings(job_id="2")[0]
+    assert job_listing["easy_apply"] is False
+    assert job_listing["job_posting_datetime"] is None
+
+    assert [
+        job_listing["job_id"]
+        for job_listing in persistent_job_store.query_job_listings(
+            posted_since=datetime(2020, 1, 1)
+        )
+    ] == ["1"]
+
+
+def test_profile_seen_job_ids(persistent_job_store):
+    """
+    Purpose:
+        Jobs marked seen by a profile are only seen by that profile
+    """
+
+    persistent_job_store.upsert_job_listings(
+        [JobListing(job_id="1"), JobListing(job_id="2")], job_board="indeed"
+    )
+    persistent_job_store.mark_job_ids_seen("daily", "indeed", ["1", None])
+
+    assert persistent_job_store.get_seen_job_ids("daily", "indeed") == {"1"}
+    assert persistent_job_store.get_seen_job_ids("weekly", "indeed") == set()
+    assert [
+        job_listing["job_id"]
+        for job_listing in persistent_job_store.query_job_listings(profile="daily")
+    ] == ["1"]
+
+
+def test_schema_migration_adds_new_fields(tmp_path):
+    """
+    Purpose:
+        Opening a database created before JobListing fields were added adds a
+        column for each of them, keeping the jobs already stored
+    """
+
+    db_file = str(tmp_path / "jobs.sqlite3")
+    connection = sqlite3.connect(db_file)
+    with connection:
+        connection.execute(
+            "CREATE TABLE job_listings (job_board TEXT NOT NULL, "
+            "job_id TEXT NOT NULL, company TEXT, first_seen_at TEXT NOT NULL, "
+            "last_seen_at TEXT NOT NULL, PRIMARY KEY (job_board, job_id))"
+        )
+        connection.execute(
+            "INSERT INTO job_listings VALUES ('indeed', '1', 'EMSL', "
+            "'2020-01-01 00:00:00.000000', '2020-01-01 00:00:00.000000')"
+        )
+    connection.close()
+
+    persistent_job_store = JobStore(db_file)
+    try:
+        columns = {
+            column_info[1]
+            for column_info in persistent_job_store.connection.execute(
+                "PRAGMA table_info(job_listings)"
+            )
+        }
+        assert set(JobListing.fields) <= columns
+
+        persistent_job_store.upsert_job_listings(
+            [JobListing(job_id="1", company="EMSL", easy_apply=True)],
+            job_board="indeed",
+        )
+        job_listing, = persistent_job_store.query_job_listings(job_id="1")
+        assert job_listing["easy_apply"] is True
+        assert get_seen_at(persistent_job_store, "1")[0] ==\
+            "2020-01-01 00:00:00.000000"
+    finally:
+        persistent_job_store.close()
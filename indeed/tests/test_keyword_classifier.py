@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        Tests for the KeywordClassifier class
+"""
+
+# Third Party Imports
+import pytest
+
+# Local Library Imports
+from indeed.keyword_classifier import KeywordClassifier
+
+
+###
+# Tests
+###
+
+
+@pytest.mark.parametrize("text, skills", [
+    ("Advanced Excel required", ["Excel"]),
+    ("Excel's pivot tables", ["Excel"]),
+    ("(Excel)", ["Excel"]),
+    ("excel", ["Excel"]),
+    ("Excellent communication skills", []),
+    ("Must excel under pressure", ["Excel"]),
+    ("Uses MySQL", []),
+    ("SQL/Excel", ["Excel", "SQL"]),
+])
+def test_classify_matches_whole_words(text, skills):
+    """
+    Purpose:
+        Terms only match whole words, case insensitive
+    """
+
+    assert KeywordClassifier().classify(text)["skills"] == skills
+
+
+def test_classify_matches_word_prefixes():
+    """
+    Purpose:
+        Without match_whole_words, terms still start on a word but may end
+        inside one
+    """
+
+    keyword_classifier = KeywordClassifier(match_whole_words=False)
+
+    assert keyword_classifier.classify("Excellent")["skills"] == ["Excel"]
+    assert keyword_classifier.classify("MySQL")["skills"] == []
+
+
+def test_classify_matches_overlapping_terms():
+    """
+    Purpose:
+        Terms inside other terms (of the same label or another) all count
+    """
+
+    keyword_matches = KeywordClassifier().classify(
+        "Top secret clearance and SHRM-CP required, CPA (certified public "
+        "accountant) a plus"
+    )
+
+    assert keyword_matches["security_clearance"] == ["Secret", "Top Secret"]
+    assert keyword_matches["certifications"] == ["CPA", "SHRM"]
+
+
+def test_classify_keeps_taxonomy_order():
+    """
+    Purpose:
+        Labels come back in taxonomy order, not the order they appear in the
+        text, so college_degree (the first degree) is repeatable
+    """
+
+    keyword_matches = KeywordClassifier().classify(
+        "PhD preferred, Master's degree or Bachelor's degree required"
+    )
+
+    assert keyword_matches["degrees"] == ["Bachelor's", "Master's", "Doctorate"]
+
+
+def test_classify_returns_every_category():
+    """
+    Purpose:
+        Every category is present, empty if nothing matched
+    """
+
+    assert KeywordClassifier().classify(None) == {
+        category: [] for category in KeywordClassifier.categories
+    }
+    assert KeywordClassifier({"skills": {"Excel": ["excel"]}}).classify("Excel") ==\
+        {
+            "degrees": [],
+            "certifications": [],
+            "skills": ["Excel"],
+            "security_clearance": [],
+            "work_arrangement": [],
+        }
+
+
+def test_invalid_category():
+    """
+    Purpose:
+        Taxonomies with an unknown category are rejected
+    """
+
+    with pytest.raises(ValueError):
+        KeywordClassifier({"languages": {"Python": ["python"]}})
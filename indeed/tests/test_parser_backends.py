@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        Tests that every Indeed parser backend parses the pages in
+        indeed/cached_data the same as html.parser
+"""
+
+# Third Party Imports
+import pytest
+
+# Local Library Imports
+from indeed.indeed import Indeed
+from indeed.replay_transport import ReplayTransport, load_cached_data_html
+
+
+###
+# Helpers
+###
+
+
+RAW_JOB_LISTING_HTML =\
+    load_cached_data_html(ReplayTransport.cached_data_files["listing"])
+RAW_JOB_DETAILS_HTML =\
+    load_cached_data_html(ReplayTransport.cached_data_files["details"])
+
+
+def parse_cached_data(monkeypatch, parser_backend):
+    """
+    Purpose:
+        Parse the cached listing and details pages with a parser backend (always
+        building the DOM for the details page, so the backend is what parses it)
+    Args:
+        parser_backend (String): One of Indeed.parser_backends
+    Returns:
+        job_listings (List of Dicts): Parsed job listings
+        job_details (Dict): Parsed job details, without job_posting_datetime
+            (which depends on when it was parsed)
+    """
+
+    monkeypatch.setattr(Indeed, "parser_backend", parser_backend)
+    monkeypatch.setattr(Indeed, "use_fast_path_extraction", False)
+
+    job_listings = [
+        job_listing.to_dict()
+        for job_listing in Indeed.parse_job_listings_html(RAW_JOB_LISTING_HTML)
+    ]
+    job_details = Indeed.parse_job_details_html(RAW_JOB_DETAILS_HTML)
+    job_details.pop("job_posting_datetime")
+
+    return job_listings, job_details
+
+
+###
+# Tests
+###
+
+
+@pytest.mark.parametrize("parser_backend", Indeed.parser_backends)
+def test_parser_backend_matches_html_parser(monkeypatch, parser_backend):
+    """
+    Purpose:
+        Job listings and job details match html.parser field for field
+    """
+
+    if parser_backend == "lxml" and not Indeed.is_lxml_installed():
+        pytest.skip("lxml is not installed")
+
+    expected_job_listings, expected_job_details =\
+        parse_cached_data(monkeypatch, "html.parser")
+    job_listings, job_details = parse_cached_data(monkeypatch, parser_backend)
+
+    assert len(expected_job_listings) == 15
+    assert job_listings == expected_job_listings
+    assert job_details == expected_job_details
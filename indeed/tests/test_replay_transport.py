@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        Tests for the ReplayTransport and RecordingTransport classes
+"""
+
+# Python Library Imports
+import warnings
+
+# Local Library Imports
+from indeed import replay_transport
+from indeed.http_transport import HttpResponse
+from indeed.replay_transport import RecordingTransport, ReplayTransport
+
+
+###
+# Helpers
+###
+
+
+LISTING_URL = "https://www.indeed.com/jobs?q=Administrative+Assistant&start=0"
+DETAILS_URL = "https://www.indeed.com/viewjob?jk=f435d92da84fa684"
+
+
+class StaticTransport(object):
+    """
+        StaticTransport Class. Answers every request with the same page
+    """
+
+    def __init__(self, text):
+        self.text = text
+
+    def close(self):
+        pass
+
+    def get(self, url, headers=None):
+        return HttpResponse(url, 200, text=self.text)
+
+
+###
+# Tests
+###
+
+
+def test_replay_recorded_corpus(tmp_path):
+    """
+    Purpose:
+        Recorded responses are replayed, and URLs missing from the corpus get a
+        404 instead of a cached_data page
+    """
+
+    corpus_dir = str(tmp_path / "replay_corpus")
+    recording_transport =\
+        RecordingTransport(StaticTransport("<html>Recorded</html>"), corpus_dir)
+    recording_transport.get(LISTING_URL)
+    recording_transport.close()
+
+    transport = ReplayTransport(corpus_dir=corpus_dir)
+
+    response = transport.get(LISTING_URL)
+    assert response.status_code == 200
+    assert response.text == "<html>Recorded</html>"
+    assert transport.get(DETAILS_URL).status_code == 404
+
+
+def test_replay_cached_data_without_corpus(tmp_path):
+    """
+    Purpose:
+        Without a recorded corpus, the cached_data page of the same kind answers
+        every URL
+    """
+
+    for transport in (
+        ReplayTransport(),
+        ReplayTransport(corpus_dir=str(tmp_path / "empty_corpus")),
+    ):
+        listing_response = transport.get(LISTING_URL)
+        details_response = transport.get(DETAILS_URL)
+
+        assert listing_response.status_code == details_response.status_code == 200
+        assert listing_response.text == replay_transport.load_cached_data_html(
+            ReplayTransport.cached_data_files["listing"]
+        )
+        assert details_response.text == replay_transport.load_cached_data_html(
+            ReplayTransport.cached_data_files["details"]
+        )
+
+
+def test_load_cached_data_html_keeps_invalid_escapes(tmp_path):
+    """
+    Purpose:
+        Backslashes that don't start an escape are kept without a
+        DeprecationWarning, while escaped backslashes and newlines are decoded
+    """
+
+    cached_data_file = tmp_path / "cached.html"
+    cached_data_file.write_bytes(b"a\\ b\\\\ c\\nd\\\\\\ e")
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert replay_transport.load_cached_data_html(str(cached_data_file)) ==\
+            "a\\ b\\ c\nd\\\\ e"
@@ -0,0 +1,7 @@
+"""
+    Purpose:
+        Add Classes to Path for Importing
+"""
+
+from .job_exporters import *
+from .xlsx_job_report import *
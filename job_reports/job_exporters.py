@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        The JobExporter classes are responsible for writing job listings to flat
+        files (JSON Lines and CSV) one row at a time as the jobs are found, so the
+        export never holds more than a single row in memory.
+"""
+
+# Python Library Imports
+import abc
+import csv
+import json
+import logging
+import threading
+from datetime import datetime
+
+
+###
+# Class Definitions
+###
+
+
+class JobExporter(abc.ABC):
+    """
+        JobExporter Class. Abstract base class of the exporters. Each job listing
+        is written as one row holding the fields named in the headers (the same
+        header definitions the xlsx report uses), in header order. Rows may be
+        written from several threads at once
+    """
+
+    ###
+    # Properties
+    ###
+
+    file_extension = None
+
+    ###
+    # Class Lifecycle Methods
+    ###
+
+    def __init__(self, output_file, headers):
+        """
+        Purpose:
+            Initilize the JobExporter Class. Opens the output file (replacing it if
+            it exists)
+        Args:
+            output_file (String): Path of the file to write
+            headers (List of Dicts): Headers of the columns to write. Each header's
+                "name" is the job listing field written in that column
+        Returns:
+            N/A
+        """
+        logging.info(f"Initializing {type(self).__name__} for {output_file}")
+
+        self.output_file = output_file
+        self.field_names = [header["name"] for header in headers]
+        self.rows_written = 0
+
+        self.lock = threading.Lock()
+        self.output_fh = open(self.output_file, "w", newline="", encoding="utf-8")
+        self.write_header()
+
+    def close(self):
+        """
+        Purpose:
+            Close the output file
+        Args:
+            N/A
+        Returns:
+            N/A
+        """
+
+        with self.lock:
+            self.output_fh.close()
+
+        logging.info(f"Wrote {self.rows_written} Jobs To {self.output_file}")
+
+    ###
+    # Write Functions
+    ###
+
+    def write_job_listing(self, job_listing):
+        """
+        Purpose:
+            Write a job listing as the next row of the export
+        Args:
+            job_listing (JobListing Obj or Dict): Job to write
+        Returns:
+            N/A
+        """
+
+        row = [
+            self.get_export_value(job_listing.get(field_name))
+            for field_name in self.field_names
+        ]
+
+        with self.lock:
+            self.write_row(row)
+            self.rows_written += 1
+
+    def write_header(self):
+        """
+        Purpose:
+            Write anything the file needs before its first row (nothing by default)
+        Args:
+            N/A
+        Returns:
+            N/A
+        """
+
+        pass
+
+    @abc.abstractmethod
+    def write_row(self, row):
+        """
+        Purpose:
+            Write a row to the output file. Called with the lock held
+        Args:
+            row (List of Objects): Value of each field, in header order
+        Returns:
+            N/A
+        """
+
+    @staticmethod
+    def get_export_value(value):
+        """
+        Purpose:
+            Convert a job listing field to a value every format can hold
+        Args:
+            value (Object): Value of the field
+        Returns:
+            export_value (Object): Datetimes as ISO 8601 strings, anything else as is
+        """
+
+        if isinstance(value, datetime):
+            return value.isoformat()
+
+        return value
+
+
+class JsonLinesJobExporter(JobExporter):
+    """
+        JsonLinesJobExporter Class. One JSON object per line, keyed by field name
+    """
+
+    ###
+    # Properties
+    ###
+
+    file_extension = "jsonl"
+
+    ###
+    # Write Functions
+    ###
+
+    def write_row(self, row):
+        """
+        Purpose:
+            Write a row as a JSON object on its own line
+        Args:
+            row (List of Objects): Value of each field, in header order
+        Returns:
+            N/A
+        """
+
+        self.output_fh.write(json.dumps(dict(zip(self.field_names, row))))
+        self.output_fh.write("\n")
+
+
+class CsvJobExporter(JobExporter):
+    """
+        CsvJobExporter Class. CSV with a row of field names first. Missing values
+        are written as empty cells
+    """
+
+    ###
+    # Properties
+    ###
+
+    file_extension = "csv"
+
+    ###
+    # Write Functions
+    ###
+
+    def write_header(self):
+        """
+        Purpose:
+            Write the row of field names
+        Args:
+            N/A
+        Returns:
+            N/A
+        """
+
+        self.csv_writer = csv.writer(self.output_fh)
+        self.csv_writer.writerow(self.field_names)
+
+    def write_row(self, row):
+        """
+        Purpose:
+            Write a row of CSV
+        Args:
+            row (List of Objects): Value of each field, in header order
+        Returns:
+            N/A
+        """
+
+        self.csv_writer.writerow(["" if value is None else value for value in row])
+
+
+###
+# Exporter Lookup
+###
+
+
+JOB_EXPORTERS = {
+    JsonLinesJobExporter.file_extension: JsonLinesJobExporter,
+    CsvJobExporter.file_extension: CsvJobExporter,
+}
+
+
+def get_job_exporter(output_format, output_file, headers):
+    """
+    Purpose:
+        Open the exporter of an output format
+    Args:
+        output_format (String): Format to export. One of JOB_EXPORTERS
+        output_file (String): Path of the file to write
+        headers (List of Dicts): Headers of the columns to write
+    Returns:
+        job_exporter (JobExporter Obj): The open exporter
+    """
+
+    if output_format not in JOB_EXPORTERS:
+        raise ValueError(
+            f"Invalid Output Format {output_format}, Expected One Of "
+            f"{tuple(JOB_EXPORTERS)}"
+        )
+
+    return JOB_EXPORTERS[output_format](output_file, headers)
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        Tests for the JobExporter classes, reading back the files written
+"""
+
+# Python Library Imports
+import csv
+import json
+from datetime import datetime
+
+# Third Party Imports
+import pytest
+
+# Local Library Imports
+from indeed.job_listing import JobListing
+from job_reports import job_exporters
+
+
+###
+# Helpers
+###
+
+
+HEADERS = [
+    {"name": "company", "title": "Company", "width": 20},
+    {"name": "job_posting_datetime", "title": "Posted", "width": 20,
+        "type": "datetime"},
+    {"name": "easy_apply", "title": "Easy Apply", "width": 10, "type": "boolean"},
+    {"name": "job_salary", "title": "Salary", "width": 20},
+]
+JOB_LISTINGS = [
+    JobListing(
+        company="EMSL, Inc.",
+        job_posting_datetime=datetime(2020, 1, 2, 3, 4, 5),
+        easy_apply=True,
+        job_salary=None,
+    ),
+    JobListing(company='The "Quoted" Co', job_salary="$20 - $28 an hour"),
+]
+
+
+def export_job_listings(output_format, output_file):
+    """
+    Purpose:
+        Write JOB_LISTINGS with an exporter
+    Args:
+        output_format (String): Format to export. One of JOB_EXPORTERS
+        output_file (String): Path of the file to write
+    Returns:
+        N/A
+    """
+
+    job_exporter =\
+        job_exporters.get_job_exporter(output_format, output_file, HEADERS)
+    for job_listing in JOB_LISTINGS:
+        job_exporter.write_job_listing(job_listing)
+    job_exporter.close()
+
+    assert job_exporter.rows_written == len(JOB_LISTINGS)
+
+
+###
+# Tests
+###
+
+
+def test_json_lines_round_trip(tmp_path):
+    """
+    Purpose:
+        Each job is one JSON object with its header fields, datetimes as ISO 8601
+        and missing values as null
+    """
+
+    output_file = str(tmp_path / "jobs.jsonl")
+    export_job_listings("jsonl", output_file)
+
+    with open(output_file, encoding="utf-8") as output_fh:
+        rows = [json.loads(line) for line in output_fh]
+
+    assert rows == [
+        {
+            "company": "EMSL, Inc.",
+            "job_posting_datetime": "2020-01-02T03:04:05",
+            "easy_apply": True,
+            "job_salary": None,
+        },
+        {
+            "company": 'The "Quoted" Co',
+            "job_posting_datetime": None,
+            "easy_apply": None,
+            "job_salary": "$20 - $28 an hour",
+        },
+    ]
+    assert datetime.fromisoformat(rows[0]["job_posting_datetime"]) ==\
+        JOB_LISTINGS[0]["job_posting_datetime"]
+
+
+def test_csv_round_trip(tmp_path):
+    """
+    Purpose:
+        The CSV starts with the field names, quotes values as needed, writes
+        datetimes as ISO 8601, and writes missing values as empty cells
+    """
+
+    output_file = str(tmp_path / "jobs.csv")
+    export_job_listings("csv", output_file)
+
+    with open(output_file, newline="", encoding="utf-8") as output_fh:
+        rows = list(csv.DictReader(output_fh))
+
+    assert rows == [
+        {
+            "company": "EMSL, Inc.",
+            "job_posting_datetime": "2020-01-02T03:04:05",
+            "easy_apply": "True",
+            "job_salary": "",
+        },
+        {
+            "company": 'The "Quoted" Co',
+            "job_posting_datetime": "",
+            "easy_apply": "",
+            "job_salary": "$20 - $28 an hour",
+        },
+    ]
+
+
+def test_exporters_must_write_rows(tmp_path):
+    """
+    Purpose:
+        JobExporter is abstract, and unknown output formats are rejected
+    """
+
+    with pytest.raises(TypeError):
+        job_exporters.JobExporter(str(tmp_path / "jobs.txt"), HEADERS)
+
+    with pytest.raises(ValueError):
+        job_exporters.get_job_exporter("txt", str(tmp_path / "jobs.txt"), HEADERS)
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        Tests for the XlsxJobReport class and the multi-workbook functions,
+        reading back the xlsx files written
+"""
+
+# Python Library Imports
+import re
+import zipfile
+from datetime import datetime
+
+# Local Library Imports
+from indeed.job_listing import JobListing
+from job_reports import xlsx_job_report
+
+
+###
+# Helpers
+###
+
+
+HEADERS = [
+    {"name": "company", "title": "Company", "width": 20},
+    {"name": "job_posting_datetime", "title": "Posted", "width": 20,
+        "type": "datetime"},
+    {"name": "easy_apply", "title": "Easy Apply", "width": 10, "type": "boolean"},
+    {"name": "job_apply_url", "title": "Apply URL", "width": 40, "type": "url"},
+]
+
+
+def build_worksheet(sheet_name, job_listings):
+    """
+    Purpose:
+        Build a worksheet of jobs with HEADERS
+    Args:
+        sheet_name (String): Name of the sheet
+        job_listings (List of JobListing Objs): Jobs on the sheet
+    Returns:
+        worksheet (Dict): sheet_name, headers, job_listings, and row_height
+    """
+
+    return {
+        "sheet_name": sheet_name,
+        "headers": HEADERS,
+        "job_listings": job_listings,
+        "row_height": 15,
+    }
+
+
+def build_job_listings(job_count):
+    """
+    Purpose:
+        Build jobs that each have an apply URL
+    Args:
+        job_count (Int): Number of jobs to build
+    Returns:
+        job_listings (List of JobListing Objs): The jobs
+    """
+
+    return [
+        JobListing(
+            company=f"Company {job_idx}",
+            job_id=str(job_idx),
+            job_posting_datetime=datetime(2020, 1, 2),
+            easy_apply=bool(job_idx % 2),
+            job_apply_url=f"https://www.indeed.com/rc/clk?jk={job_idx}",
+        )
+        for job_idx in range(job_count)
+    ]
+
+
+def read_workbook(report_file):
+    """
+    Purpose:
+        Read the sheets of a written workbook
+    Args:
+        report_file (String): Path of the workbook
+    Returns:
+        sheets (Dict of Dicts): rows (data rows, excluding the header), hyperlinks,
+            and xml of each sheet, keyed by sheet name in workbook order
+        shared_strings (String): xml of the shared strings (empty in
+            constant_memory, where strings are written inline)
+    """
+
+    with zipfile.ZipFile(report_file) as report_zip:
+        sheet_names = re.findall(
+            r'<sheet name="([^"]+)"', report_zip.read("xl/workbook.xml").decode()
+        )
+        sheets = {}
+        for sheet_idx, sheet_name in enumerate(sheet_names, 1):
+            sheet_xml =\
+                report_zip.read(f"xl/worksheets/sheet{sheet_idx}.xml").decode()
+            sheets[sheet_name] = {
+                "rows": sheet_xml.count("<row ") - 1,
+                "hyperlinks": sheet_xml.count("<hyperlink "),
+                "xml": sheet_xml,
+            }
+        shared_strings = ""
+        if "xl/sharedStrings.xml" in report_zip.namelist():
+            shared_strings = report_zip.read("xl/sharedStrings.xml").decode()
+
+    return sheets, shared_strings
+
+
+###
+# Tests
+###
+
+
+def test_unlinkable_urls_are_written_as_text(tmp_path):
+    """
+    Purpose:
+        Relative URLs and URLs past Excel's length limit are written as text
+        instead of failing the report
+    """
+
+    report_file = str(tmp_path / "jobs.xlsx")
+    long_url = f"https://www.indeed.com/rc/clk?jk={'1' * 2100}"
+    job_listings = [
+        JobListing(company="EMSL", job_apply_url="/rc/clk?jk=1"),
+        JobListing(company="EMSL", job_apply_url=long_url),
+        JobListing(company="EMSL", job_apply_url="https://www.indeed.com/rc/clk"),
+        JobListing(company="EMSL", job_apply_url=None),
+    ]
+
+    xlsx_job_report.write_job_report_workbook(
+        report_file, [build_worksheet("Jobs", job_listings)]
+    )
+
+    sheets, shared_strings = read_workbook(report_file)
+    assert sheets["Jobs"]["rows"] == 4
+    assert sheets["Jobs"]["hyperlinks"] == 1
+    assert "/rc/clk?jk=1" in shared_strings
+    assert long_url in shared_strings
+
+
+def test_sheets_sharded_by_max_urls_per_sheet(tmp_path):
+    """
+    Purpose:
+        A worksheet with more rows than max_urls_per_sheet allows rolls over into
+        numbered sheets holding every row
+    """
+
+    report_file = str(tmp_path / "jobs.xlsx")
+
+    xlsx_job_report.write_job_report_workbook(
+        report_file,
+        [build_worksheet("Global", build_job_listings(25))],
+        max_urls_per_sheet=10,
+    )
+
+    sheets, _ = read_workbook(report_file)
+    assert list(sheets) == ["Global", "Global (2)", "Global (3)"]
+    assert [sheet["rows"] for sheet in sheets.values()] == [10, 10, 5]
+    assert [sheet["hyperlinks"] for sheet in sheets.values()] == [10, 10, 5]
+
+
+def test_sheets_sharded_in_constant_memory(tmp_path):
+    """
+    Purpose:
+        Sharding by max_rows_per_sheet works the same with constant_memory
+    """
+
+    report_file = str(tmp_path / "jobs.xlsx")
+
+    xlsx_job_report.write_job_report_workbook(
+        report_file,
+        [build_worksheet("Global", build_job_listings(7))],
+        constant_memory=True,
+        max_rows_per_sheet=3,
+    )
+
+    sheets, _ = read_workbook(report_file)
+    assert [sheet["rows"] for sheet in sheets.values()] == [3, 3, 1]
+
+
+def test_plan_spills_into_workbooks():
+    """
+    Purpose:
+        Sheets are sharded and grouped into workbooks of at most
+        max_rows_per_workbook jobs, keeping every job once and in order
+    """
+
+    worksheets = [
+        build_worksheet("Global", build_job_listings(12)),
+        build_worksheet("Indeed - A", build_job_listings(5)),
+    ]
+
+    workbooks = xlsx_job_report.plan_job_report_workbooks(
+        worksheets, max_rows_per_workbook=8, max_urls_per_sheet=6
+    )
+
+    assert [
+        [
+            (worksheet["sheet_name"], len(worksheet["job_listings"]))
+            for worksheet in workbook_worksheets
+        ]
+        for workbook_worksheets in workbooks
+    ] == [
+        [("Global", 6)],
+        [("Global (2)", 6)],
+        [("Indeed - A", 5)],
+    ]
+
+
+def test_write_workbooks_in_parallel(tmp_path):
+    """
+    Purpose:
+        Workbooks written by the process pool match the ones asked for
+    """
+
+    workbooks = [
+        (
+            str(tmp_path / f"jobs_{workbook_idx}.xlsx"),
+            [build_worksheet("Global", build_job_listings(workbook_idx + 1))],
+        )
+        for workbook_idx in range(3)
+    ]
+
+    report_files = xlsx_job_report.write_job_report_workbooks(
+        workbooks, workers=2, max_urls_per_sheet=2
+    )
+
+    assert report_files == [report_file for report_file, _ in workbooks]
+    for workbook_idx, report_file in enumerate(report_files):
+        sheets, _ = read_workbook(report_file)
+        assert sum(sheet["rows"] for sheet in sheets.values()) == workbook_idx + 1
+        assert len(sheets) == -(-(workbook_idx + 1) // 2)
@@ -0,0 +1,560 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        The XlsxJobReport class is responsible for writing job listings to an xlsx
+        workbook one row at a time, with the way each column is written decided
+        once from its header instead of inspected for every cell. Worksheets too
+        large for Excel are sharded into numbered sheets, and reports too large
+        for one workbook can be planned into several workbooks written in
+        parallel.
+"""
+
+# Python Library Imports
+import logging
+import re
+import xlsxwriter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+
+###
+# Class Definition
+###
+
+
+class XlsxJobReport(object):
+    """
+        XlsxJobReport Class. Workbook of job listing worksheets. Each header may
+        name the type of its column ("string", "number", "datetime", "boolean", or
+        "url", defaulting to "string"), which picks the xlsxwriter function used for
+        every cell in the column. Empty values are left as blank cells.
+
+        With constant_memory, rows are flushed to disk as they are written (so
+        memory use does not grow with the number of jobs). Excel tables are not
+        available in that mode, so each worksheet gets a header row with an
+        autofilter instead.
+
+        Worksheets with more rows (or hyperlinks) than a sheet can hold are
+        written as several numbered sheets (e.g. "Global", "Global (2)")
+    """
+
+    ###
+    # Properties
+    ###
+
+    column_types = ("string", "number", "datetime", "boolean", "url")
+    url_prefixes =\
+        ("http://", "https://", "ftp://", "mailto:", "internal:", "external:")
+    header_row_height = 20
+
+    # Excel Limits (Rows Exclude The Header Row)
+    excel_max_rows_per_sheet = 1048575
+    excel_max_urls_per_sheet = 65530
+    excel_max_sheet_name_length = 31
+    excel_max_url_length = 2079
+
+    ###
+    # Class Lifecycle Methods
+    ###
+
+    def __init__(
+        self,
+        report_file,
+        constant_memory=False,
+        max_rows_per_sheet=None,
+        max_urls_per_sheet=None,
+    ):
+        """
+        Purpose:
+            Initilize the XlsxJobReport Class.
+        Args:
+            report_file (String): Path of the workbook to write
+            constant_memory (Boolean): Whether to flush each row to disk as it is
+                written
+            max_rows_per_sheet (Int): Max jobs per sheet before the worksheet is
+                sharded. Defaults to (and is capped at) the Excel limit
+            max_urls_per_sheet (Int): Max hyperlinks per sheet before the
+                worksheet is sharded. Defaults to (and is capped at) the Excel
+                limit
+        Returns:
+            N/A
+        """
+        logging.info(f"Initializing XlsxJobReport for {report_file}")
+
+        self.report_file = report_file
+        self.constant_memory = constant_memory
+        self.max_rows_per_sheet = max_rows_per_sheet
+        self.max_urls_per_sheet = max_urls_per_sheet
+
+        self.workbook = xlsxwriter.Workbook(
+            self.report_file, {"constant_memory": self.constant_memory}
+        )
+        self.cell_formats = {
+            "base_cell_format": self.workbook.add_format({"text_wrap": True}),
+            "date_cell_format": self.workbook.add_format({
+                "num_format": "[$-en-US]mmmm d, yyyy"
+            }),
+            "header_cell_format": self.workbook.add_format({
+                "bold": True, "bottom": 1
+            }),
+        }
+
+    def close(self):
+        """
+        Purpose:
+            Write out and close the workbook
+        Args:
+            N/A
+        Returns:
+            N/A
+        """
+
+        self.workbook.close()
+
+    ###
+    # Worksheet Functions
+    ###
+
+    def add_job_listings_worksheet(
+        self, sheet_name, headers, job_listings, job_listing_count, row_height
+    ):
+        """
+        Purpose:
+            Add a worksheet with a row for each job listing, sharded into numbered
+            sheets if it has too many rows or hyperlinks for one sheet
+        Args:
+            sheet_name (String): Name of the sheet to add to the workbook
+            headers (List of Dicts): Headers of the columns. Each header's "name"
+                is the job listing field in the column, "title" its heading,
+                "width" its width, and "type" (optional) its column type
+            job_listings (Iterable of JobListing Objs): Jobs to write, in order
+            job_listing_count (Int): Number of jobs in job_listings
+            row_height (Int): Height of each job's row
+        Returns:
+            sheet_names (List of Strings): Name of each sheet added
+        """
+
+        rows_per_sheet = self.get_rows_per_sheet(
+            headers,
+            max_rows_per_sheet=self.max_rows_per_sheet,
+            max_urls_per_sheet=self.max_urls_per_sheet,
+        )
+        shard_count = max(-(-job_listing_count // rows_per_sheet), 1)
+        if shard_count > 1:
+            logging.info(
+                f"Sharding {sheet_name} ({job_listing_count} Jobs) Into "
+                f"{shard_count} Sheets"
+            )
+
+        job_listings = iter(job_listings)
+        sheet_names = []
+        for shard_idx in range(shard_count):
+            shard_sheet_name = self.get_shard_sheet_name(sheet_name, shard_idx + 1)
+            shard_job_listing_count = min(
+                rows_per_sheet, job_listing_count - shard_idx * rows_per_sheet
+            )
+            self.add_job_listings_sheet(
+                shard_sheet_name,
+                headers,
+                islice(job_listings, shard_job_listing_count),
+                shard_job_listing_count,
+                row_height,
+            )
+            sheet_names.append(shard_sheet_name)
+
+        return sheet_names
+
+    def add_job_listings_sheet(
+        self, sheet_name, headers, job_listings, job_listing_count, row_height
+    ):
+        """
+        Purpose:
+            Add a single sheet with a row for each job listing (no sharding)
+        Args:
+            sheet_name (String): Name of the sheet to add to the workbook
+            headers (List of Dicts): Headers of the columns
+            job_listings (Iterable of JobListing Objs): Jobs to write, in order
+            job_listing_count (Int): Number of jobs in job_listings
+            row_height (Int): Height of each job's row
+        Returns:
+            N/A
+        """
+
+        worksheet = self.workbook.add_worksheet(sheet_name)
+
+        # Set Column Widths
+        for header_idx, header in enumerate(headers):
+            worksheet.set_column(header_idx, header_idx, header["width"])
+
+        # Header Row Comes From The Table, Or Is Written Out In constant_memory
+        last_row_idx = job_listing_count
+        last_column_idx = len(headers) - 1
+        if self.constant_memory:
+            worksheet.set_row(0, self.header_row_height)
+            for header_idx, header in enumerate(headers):
+                worksheet.write_string(
+                    0, header_idx, header["title"],
+                    self.cell_formats["header_cell_format"],
+                )
+            worksheet.autofilter(0, 0, last_row_idx, last_column_idx)
+            worksheet.freeze_panes(1, 0)
+        else:
+            worksheet.add_table(
+                0, 0, last_row_idx, last_column_idx,
+                {
+                    "name": self.get_table_name(sheet_name),
+                    "columns": [{"header": header["title"]} for header in headers],
+                },
+            )
+
+        # Resolve The Writer Of Each Column Once
+        column_writers = [
+            (column_idx, header["name"], self.get_column_writer(worksheet, header))
+            for column_idx, header in enumerate(headers)
+        ]
+
+        # Write Data Row By Row (In Order, As constant_memory Requires)
+        row_idx = 0
+        for job_listing in job_listings:
+            row_idx += 1
+            worksheet.set_row(row_idx, row_height)
+            for column_idx, field_name, column_writer in column_writers:
+                cell_value = job_listing[field_name]
+                if cell_value:
+                    column_writer(row_idx, column_idx, cell_value)
+
+    @staticmethod
+    def get_table_name(sheet_name):
+        """
+        Purpose:
+            Get the name of the Excel table of a sheet (letters of the sheet name,
+            followed by the shard number of a sharded sheet)
+        Args:
+            sheet_name (String): Name of the sheet
+        Returns:
+            table_name (String): Name of the table
+        """
+
+        shard_number_match = re.search(r" \((\d+)\)$", sheet_name)
+        table_name = re.sub("[^a-zA-Z]+", "", sheet_name)
+        if shard_number_match:
+            table_name =\
+                re.sub("[^a-zA-Z]+", "", sheet_name[:shard_number_match.start()])\
+                + shard_number_match.group(1)
+
+        return table_name
+
+    ###
+    # Sharding Functions
+    ###
+
+    @staticmethod
+    def get_rows_per_sheet(headers, max_rows_per_sheet=None, max_urls_per_sheet=None):
+        """
+        Purpose:
+            Get the most jobs a sheet of a worksheet can hold, from the row limit
+            and the hyperlinks each row adds
+        Args:
+            headers (List of Dicts): Headers of the columns
+            max_rows_per_sheet (Int): Max jobs per sheet. Defaults to (and is
+                capped at) the Excel limit
+            max_urls_per_sheet (Int): Max hyperlinks per sheet. Defaults to (and
+                is capped at) the Excel limit
+        Returns:
+            rows_per_sheet (Int): Max jobs per sheet
+        """
+
+        rows_per_sheet = min(
+            max_rows_per_sheet or XlsxJobReport.excel_max_rows_per_sheet,
+            XlsxJobReport.excel_max_rows_per_sheet,
+        )
+
+        url_columns = sum(header.get("type") == "url" for header in headers)
+        if url_columns:
+            urls_per_sheet = min(
+                max_urls_per_sheet or XlsxJobReport.excel_max_urls_per_sheet,
+                XlsxJobReport.excel_max_urls_per_sheet,
+            )
+            rows_per_sheet = min(rows_per_sheet, urls_per_sheet // url_columns)
+
+        return max(rows_per_sheet, 1)
+
+    @staticmethod
+    def get_shard_sheet_name(sheet_name, shard_number):
+        """
+        Purpose:
+            Get the name of a numbered sheet of a sharded worksheet
+        Args:
+            sheet_name (String): Name of the worksheet
+            shard_number (Int): Number of the sheet (the first sheet keeps the
+                worksheet's name)
+        Returns:
+            shard_sheet_name (String): Name of the sheet, within Excel's limit
+        """
+
+        if shard_number == 1:
+            return sheet_name
+
+        shard_suffix = f" ({shard_number})"
+        max_base_length =\
+            XlsxJobReport.excel_max_sheet_name_length - len(shard_suffix)
+
+        return f"{sheet_name[:max_base_length]}{shard_suffix}"
+
+    ###
+    # Column Writer Functions
+    ###
+
+    def get_column_writer(self, worksheet, header):
+        """
+        Purpose:
+            Get the function that writes a cell of a column
+        Args:
+            worksheet (XlsxWriter Worksheet Obj): Worksheet the column is in
+            header (Dict): Header of the column
+        Returns:
+            column_writer (Function): Function taking the row index, column index,
+                and (non-empty) value of a cell
+        """
+
+        column_type = header.get("type", "string")
+        base_cell_format = self.cell_formats["base_cell_format"]
+
+        if column_type == "datetime":
+            date_cell_format = self.cell_formats["date_cell_format"]
+
+            def column_writer(row_idx, column_idx, cell_value):
+                worksheet.write_datetime(
+                    row_idx, column_idx, cell_value, date_cell_format
+                )
+
+        elif column_type == "boolean":
+
+            def column_writer(row_idx, column_idx, cell_value):
+                worksheet.write_boolean(
+                    row_idx, column_idx, bool(cell_value), base_cell_format
+                )
+
+        elif column_type == "url":
+
+            # URLs Excel Cannot Link To (Relative, Unknown Scheme, Or Too Long)
+            # Are Kept As Text
+            def column_writer(row_idx, column_idx, cell_value):
+                cell_value = str(cell_value)
+                if (
+                    not cell_value.lower().startswith(self.url_prefixes)
+                    or len(cell_value) > self.excel_max_url_length
+                ):
+                    worksheet.write_string(
+                        row_idx, column_idx, cell_value, base_cell_format
+                    )
+                elif worksheet.write_url(
+                    row_idx, column_idx, cell_value, base_cell_format
+                ):
+                    worksheet.write_string(
+                        row_idx, column_idx, cell_value, base_cell_format
+                    )
+
+        elif column_type == "number":
+
+            def column_writer(row_idx, column_idx, cell_value):
+                worksheet.write_number(
+                    row_idx, column_idx, cell_value, base_cell_format
+                )
+
+        elif column_type == "string":
+
+            def column_writer(row_idx, column_idx, cell_value):
+                worksheet.write_string(
+                    row_idx, column_idx, str(cell_value), base_cell_format
+                )
+
+        else:
+            raise ValueError(
+                f"Invalid Column Type {column_type} For {header['name']}, Expected "
+                f"One Of {self.column_types}"
+            )
+
+        return column_writer
+
+
+###
+# Multi-Workbook Functions
+###
+
+
+def plan_job_report_workbooks(
+    worksheets,
+    max_rows_per_workbook=None,
+    max_mb_per_workbook=None,
+    max_rows_per_sheet=None,
+    max_urls_per_sheet=None,
+):
+    """
+    Purpose:
+        Shard worksheets that are too large for one sheet and group the sheets
+        into workbooks, starting a new workbook whenever one would pass the row
+        or size threshold
+    Args:
+        worksheets (List of Dicts): Worksheets of the report, in order. Each has
+            sheet_name, headers, job_listings (List), and row_height
+        max_rows_per_workbook (Int): Max jobs per workbook (None for no limit)
+        max_mb_per_workbook (Float): Max (estimated, uncompressed) cell text per
+            workbook in MB (None for no limit)
+        max_rows_per_sheet (Int): Max jobs per sheet
+        max_urls_per_sheet (Int): Max hyperlinks per sheet
+    Returns:
+        workbooks (List of Lists of Dicts): Sheets of each workbook, each shaped
+            like the worksheets
+    """
+
+    max_bytes_per_workbook = None
+    if max_mb_per_workbook:
+        max_bytes_per_workbook = max_mb_per_workbook * 1024 * 1024
+
+    workbooks = [[]]
+    workbook_rows = 0
+    workbook_bytes = 0
+    for worksheet in worksheets:
+        rows_per_sheet = XlsxJobReport.get_rows_per_sheet(
+            worksheet["headers"],
+            max_rows_per_sheet=max_rows_per_sheet,
+            max_urls_per_sheet=max_urls_per_sheet,
+        )
+        if max_rows_per_workbook:
+            rows_per_sheet = min(rows_per_sheet, max_rows_per_workbook)
+
+        field_names = [header["name"] for header in worksheet["headers"]]
+        job_listings = worksheet["job_listings"]
+        for shard_idx, shard_start_idx in enumerate(
+            range(0, len(job_listings), rows_per_sheet)
+        ):
+            shard_job_listings =\
+                job_listings[shard_start_idx:shard_start_idx + rows_per_sheet]
+            shard_rows = len(shard_job_listings)
+            shard_bytes = sum(
+                estimate_job_listing_bytes(job_listing, field_names)
+                for job_listing in shard_job_listings
+            ) if max_bytes_per_workbook else 0
+
+            # Start A New Workbook If This Sheet Would Overfill The Current One
+            if workbooks[-1] and (
+                (
+                    max_rows_per_workbook
+                    and workbook_rows + shard_rows > max_rows_per_workbook
+                )
+                or (
+                    max_bytes_per_workbook
+                    and workbook_bytes + shard_bytes > max_bytes_per_workbook
+                )
+            ):
+                workbooks.append([])
+                workbook_rows = 0
+                workbook_bytes = 0
+
+            workbooks[-1].append(dict(
+                worksheet,
+                sheet_name=XlsxJobReport.get_shard_sheet_name(
+                    worksheet["sheet_name"], shard_idx + 1
+                ),
+                job_listings=shard_job_listings,
+            ))
+            workbook_rows += shard_rows
+            workbook_bytes += shard_bytes
+
+    return workbooks
+
+
+def estimate_job_listing_bytes(job_listing, field_names):
+    """
+    Purpose:
+        Estimate how much cell text a job listing adds to a workbook
+    Args:
+        job_listing (JobListing Obj): Job to estimate
+        field_names (List of Strings): Fields written for the job
+    Returns:
+        job_listing_bytes (Int): Characters of text in the job's cells
+    """
+
+    return sum(
+        len(str(job_listing[field_name]))
+        for field_name in field_names
+        if job_listing[field_name]
+    )
+
+
+def write_job_report_workbook(
+    report_file,
+    worksheets,
+    constant_memory=False,
+    max_rows_per_sheet=None,
+    max_urls_per_sheet=None,
+):
+    """
+    Purpose:
+        Write a workbook of worksheets
+    Args:
+        report_file (String): Path of the workbook to write
+        worksheets (List of Dicts): Worksheets of the workbook, in order. Each has
+            sheet_name, headers, job_listings (List), and row_height
+        constant_memory (Boolean): Whether to flush each row to disk as it is
+            written
+        max_rows_per_sheet (Int): Max jobs per sheet
+        max_urls_per_sheet (Int): Max hyperlinks per sheet
+    Returns:
+        report_file (String): Path of the workbook written
+    """
+
+    job_report = XlsxJobReport(
+        report_file,
+        constant_memory=constant_memory,
+        max_rows_per_sheet=max_rows_per_sheet,
+        max_urls_per_sheet=max_urls_per_sheet,
+    )
+    for worksheet in worksheets:
+        job_report.add_job_listings_worksheet(
+            worksheet["sheet_name"],
+            worksheet["headers"],
+            worksheet["job_listings"],
+            len(worksheet["job_listings"]),
+            worksheet["row_height"],
+        )
+    job_report.close()
+
+    return report_file
+
+
+def write_job_report_workbooks(workbooks, workers=1, **workbook_settings):
+    """
+    Purpose:
+        Write several workbooks, each in its own process when workers allow (xlsx
+        compression is CPU bound, so threads would not help)
+    Args:
+        workbooks (List of Tuples): (report_file, worksheets) of each workbook
+        workers (Int): Number of workbooks to write at once
+        workbook_settings (Kwargs): Other write_job_report_workbook arguments
+    Returns:
+        report_files (List of Strings): Path of each workbook written, in order
+    """
+
+    if workers <= 1 or len(workbooks) <= 1:
+        return [
+            write_job_report_workbook(report_file, worksheets, **workbook_settings)
+            for report_file, worksheets in workbooks
+        ]
+
+    logging.info(f"Writing {len(workbooks)} Workbooks With {workers} Workers")
+    with ProcessPoolExecutor(max_workers=min(workers, len(workbooks))) as executor:
+        report_file_writes = [
+            executor.submit(
+                write_job_report_workbook,
+                report_file,
+                worksheets,
+                **workbook_settings,
+            )
+            for report_file, worksheets in workbooks
+        ]
+
+        return [
+            report_file_write.result() for report_file_write in report_file_writes
+        ]
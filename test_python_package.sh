@@ -7,7 +7,7 @@
 #
 
 echo "$(date +%c): Running Unit Tests"
-pytest auto_recruiter indeed
+pytest auto_recruiter indeed job_reports
 
 TEST_STATUS=$?
 echo "$(date +%c): Test Exit Status - ${TEST_STATUS}"